@@ -21,36 +21,18 @@ echo "========================================"
 echo ""
 
 RESULTS_FILE="$REPORT_DIR/auth-flows-results.json"
-cat > "$RESULTS_FILE" << EOF
-{
-    "benchmark": "auth-flows",
-    "timestamp": "$(date -Iseconds)",
-    "flows": []
+# Results are appended as NDJSON by the benchmark harness and written to
+# $RESULTS_FILE once, before the summary. Timings get warm-up plus repeated runs,
+# summarized as median, MAD and a bootstrap CI under 'measurements'.
+harness() {
+    PYTHONPATH="$SCRIPT_DIR/..${PYTHONPATH:+:$PYTHONPATH}" \
+        python3 -m harness --report-dir "$REPORT_DIR" "$@"
 }
-EOF
-
-add_flow_result() {
-    local flow="$1"
-    local status="$2"
-    local duration="$3"
-    local notes="$4"
 
-    # Handle empty duration
-    [ -z "$duration" ] && duration="0"
+harness record --suite auth-flows --reset
 
-    python3 << PYEOF
-import json
-with open('$RESULTS_FILE', 'r') as f:
-    data = json.load(f)
-data['flows'].append({
-    'flow': '$flow',
-    'status': '$status',
-    'duration_seconds': float('$duration') if '$duration' else 0,
-    'notes': '''$notes'''
-})
-with open('$RESULTS_FILE', 'w') as f:
-    json.dump(data, f, indent=2)
-PYEOF
+add_flow_result() {
+    harness record --suite auth-flows flow="$1" status="$2" duration_seconds="${3:-0}" notes="$4"
 }
 
 # ============================================
@@ -60,15 +42,12 @@ echo "Test 1: 2-Legged OAuth (Client Credentials)"
 echo "---------------------------------------------"
 
 if command -v raps &> /dev/null && [ -n "${APS_CLIENT_ID:-}" ] && [ -n "${APS_CLIENT_SECRET:-}" ]; then
-    START_TIME=$(date +%s.%N)
-
     # Use 'raps auth test' for 2-legged (client credentials) authentication
     AUTH_OUTPUT=$(raps auth test 2>&1) && AUTH_SUCCESS=true || AUTH_SUCCESS=false
 
     if [ "$AUTH_SUCCESS" = "true" ]; then
-        END_TIME=$(date +%s.%N)
-        DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-        echo "  ✓ 2-legged auth successful in ${DURATION}s"
+        DURATION=$(harness measure --name 2-legged --warmup 0 --attach auth-flows -- raps auth test) || DURATION=0
+        echo "  ✓ 2-legged auth successful in ${DURATION}s (median)"
         add_flow_result "2-legged" "success" "$DURATION" "Client credentials flow works"
     else
         echo "  ✗ 2-legged auth failed"
@@ -179,11 +158,9 @@ echo "Test 6: Auth Status (Token Info)"
 echo "----------------------------------"
 
 if command -v raps &> /dev/null; then
-    START_TIME=$(date +%s.%N)
     if raps auth status 2>/dev/null; then
-        END_TIME=$(date +%s.%N)
-        DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-        echo "  ✓ Auth status command works (${DURATION}s)"
+        DURATION=$(harness measure --name auth-status --attach auth-flows -- raps auth status) || DURATION=0
+        echo "  ✓ Auth status command works (${DURATION}s median)"
         add_flow_result "auth-status" "success" "$DURATION" "Displays token info and expiry"
     else
         echo "  ○ No active session (expected if not logged in)"
@@ -219,6 +196,8 @@ fi
 
 echo ""
 
+harness finalize --suite auth-flows --key flows
+
 # ============================================
 # Summary
 # ============================================
@@ -22,15 +22,16 @@ echo "========================================"
 echo ""
 
 RESULTS_FILE="$REPORT_DIR/automation-timing-results.json"
-cat > "$RESULTS_FILE" << EOF
-{
-    "benchmark": "automation-timing",
-    "timestamp": "$(date -Iseconds)",
-    "manual_process": {},
-    "automated_process": {},
-    "savings": {}
+
+# Timings go through the benchmark harness: warm-up plus repeated runs,
+# summarized as median, MAD and a bootstrap CI under 'measurements'. They are
+# appended as NDJSON and written to $RESULTS_FILE once, after the measured run.
+harness() {
+    PYTHONPATH="$SCRIPT_DIR/..${PYTHONPATH:+:$PYTHONPATH}" \
+        python3 -m harness --report-dir "$REPORT_DIR" "$@"
 }
-EOF
+
+harness record --suite automation-timing --reset
 
 # ============================================
 # Manual Process Timing (Simulated)
@@ -56,27 +57,6 @@ echo ""
 MANUAL_TOTAL=$((MANUAL_UPLOAD_TIME + MANUAL_TRANSLATE_CHECK + MANUAL_NOTIFY_TIME))
 echo "Total per upload: ${MANUAL_TOTAL} minutes (${MANUAL_TOTAL} min without context switch)"
 
-# Update results
-python3 << EOF
-import json
-
-with open("$RESULTS_FILE", 'r') as f:
-    data = json.load(f)
-
-data['manual_process'] = {
-    'upload_minutes': $MANUAL_UPLOAD_TIME,
-    'translate_check_minutes': $MANUAL_TRANSLATE_CHECK,
-    'notify_minutes': $MANUAL_NOTIFY_TIME,
-    'context_switch_minutes': $CONTEXT_SWITCH_COST,
-    'total_per_upload_minutes': $MANUAL_TOTAL,
-    'uploads_per_week': 10,
-    'fix_forgotten_weekly_minutes': 60
-}
-
-with open("$RESULTS_FILE", 'w') as f:
-    json.dump(data, f, indent=2)
-EOF
-
 echo ""
 
 # ============================================
@@ -96,20 +76,17 @@ if command -v raps &> /dev/null && [ -n "${APS_CLIENT_ID:-}" ]; then
         dd if=/dev/urandom of="$TEST_FILE" bs=1M count=10 2>/dev/null
     fi
 
-    START_TIME=$(date +%s.%N)
-
     # Simulate full pipeline (would need real credentials)
     # raps oss object upload "$TEST_FILE" --bucket test-bucket
     # raps derivative translate --urn <urn> --wait
     # raps webhook trigger --event translation.complete
 
-    # For demo, measure command overhead
-    raps --version > /dev/null 2>&1
+    # For demo, measure command overhead (median of repeated runs)
+    AUTOMATED_DURATION=$(harness measure --name raps_version --attach automation-timing -- raps --version) \
+        || AUTOMATED_DURATION=0
+    AUTOMATED_DURATION=${AUTOMATED_DURATION:-0}
 
-    END_TIME=$(date +%s.%N)
-    AUTOMATED_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-
-    echo "  Pipeline execution time: ${AUTOMATED_DURATION}s"
+    echo "  Pipeline execution time: ${AUTOMATED_DURATION}s (median)"
     AUTOMATED_MINUTES=$(echo "scale=2; $AUTOMATED_DURATION / 60" | bc)
 else
     echo "  Using estimated automated timings (no credentials available)"
@@ -119,6 +96,8 @@ fi
 echo "  Estimated automated time per upload: ${AUTOMATED_MINUTES} minutes"
 echo "  (Upload, translate, notify all automated)"
 
+harness finalize --suite automation-timing --key measurements
+
 # Update results
 python3 << EOF
 import json
@@ -126,6 +105,15 @@ import json
 with open("$RESULTS_FILE", 'r') as f:
     data = json.load(f)
 
+data['manual_process'] = {
+    'upload_minutes': $MANUAL_UPLOAD_TIME,
+    'translate_check_minutes': $MANUAL_TRANSLATE_CHECK,
+    'notify_minutes': $MANUAL_NOTIFY_TIME,
+    'context_switch_minutes': $CONTEXT_SWITCH_COST,
+    'total_per_upload_minutes': $MANUAL_TOTAL,
+    'uploads_per_week': 10,
+    'fix_forgotten_weekly_minutes': 60
+}
 data['automated_process'] = {
     'total_per_upload_minutes': float("$AUTOMATED_MINUTES"),
     'human_intervention_minutes': 0,
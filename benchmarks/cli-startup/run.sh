@@ -0,0 +1,86 @@
+#!/bin/bash
+# CLI Startup Latency Benchmark
+# Measures how long the raps binary takes to start for no-network commands.
+#
+# Why it matters:
+# - Every SR test spawns raps afresh, so startup (config load, keyring
+#   access, TLS init) is paid roughly 300 times per test run
+# - Warm starts show the steady-state cost; cold starts (page cache
+#   evicted) show what the first invocation after a build or reboot pays
+#
+# Environment:
+#   CLI_STARTUP_REPEAT=30         measured warm runs per command
+#   CLI_STARTUP_COLD_REPEAT=10    measured cold runs per command
+#   CLI_STARTUP_DROP_CACHES=true  drop the whole page cache for cold runs (root only)
+#   CLI_STARTUP_HISTORY=<file>    p50/p95 history, one NDJSON line per run
+
+set -e
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+WORKSPACE_DIR="$(cd "$SCRIPT_DIR/../.." && pwd)"
+REPORT_DIR="${REPORT_DIR:-$WORKSPACE_DIR/reports}"
+HISTORY_FILE="${CLI_STARTUP_HISTORY:-$WORKSPACE_DIR/benchmark-results/cli-startup-history.ndjson}"
+BASELINE_FILE="${BENCH_BASELINE:-$WORKSPACE_DIR/benchmark-results/baselines.json}"
+
+mkdir -p "$REPORT_DIR"
+
+echo "========================================"
+echo "CLI Startup Latency Benchmark"
+echo "========================================"
+echo ""
+
+RESULTS_FILE="$REPORT_DIR/cli-startup-results.json"
+
+# ============================================
+# Run the measured cases (see suite.py)
+# ============================================
+PYTHONPATH="$SCRIPT_DIR/..${PYTHONPATH:+:$PYTHONPATH}" \
+    python3 -m harness --report-dir "$REPORT_DIR" run "$SCRIPT_DIR/suite.py"
+
+echo ""
+
+# ============================================
+# Summary
+# ============================================
+echo "========================================"
+echo "Startup Latency (ms)"
+echo "========================================"
+
+python3 << SUMMARY_EOF
+import json
+
+with open('$RESULTS_FILE') as f:
+    data = json.load(f)
+
+print(f"\n  {'Command':<28} {'p50':>8} {'p95':>8} {'max':>8} {'n':>4}")
+for test in data['tests']:
+    wall = test.get('stats', {}).get('wall_seconds')
+    if test['status'] != 'success' or not wall:
+        print(f"  {test['name']:<28} {test['status']:>8}  {test.get('notes', '')}")
+        continue
+    noisy = '  noisy' if wall['noisy'] else ''
+    print(f"  {test['name']:<28} {wall['median'] * 1000:>8.1f} {wall['p95'] * 1000:>8.1f} "
+          f"{wall['max'] * 1000:>8.1f} {wall['n']:>4}{noisy}")
+SUMMARY_EOF
+
+echo ""
+
+# ============================================
+# Track over time and gate on p95
+# ============================================
+# Appends this run to the history and, once a baseline has been recorded
+# (python3 scripts/bench-compare.py "$RESULTS_FILE" --update), fails when a
+# command's p95 startup time regresses.
+echo "========================================"
+echo "Regression Check (p95)"
+echo "========================================"
+
+python3 "$WORKSPACE_DIR/scripts/bench-compare.py" "$RESULTS_FILE" \
+    --baseline "$BASELINE_FILE" \
+    --statistic p95 \
+    --exclude 'cli-startup/worker_vs_spawn' \
+    --history "$HISTORY_FILE" \
+    --output "$REPORT_DIR/cli-startup-compare.md"
+
+echo "Results saved to: $RESULTS_FILE"
+echo "History: $HISTORY_FILE"
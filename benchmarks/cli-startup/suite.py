@@ -0,0 +1,78 @@
+"""
+CLI startup latency suite definition for the benchmark harness.
+
+Every SR test spawns raps afresh, so its startup cost (config load,
+keyring access, TLS setup) is paid roughly 300 times per test run. These
+cases time no-network commands warm (after warm-up runs) and cold (with
+the page cache evicted before every run), and compare spawning a process
+per command with RapsRunner's persistent worker.
+
+Cold runs drop the whole page cache when CLI_STARTUP_DROP_CACHES=true
+and /proc/sys/vm/drop_caches is writable (root); otherwise they evict
+just the raps binary with posix_fadvise(DONTNEED), which needs no
+privileges.
+"""
+
+import os
+import shutil
+
+from harness import Case, Suite
+
+RAPS = shutil.which('raps')
+DROP_CACHES = '/proc/sys/vm/drop_caches'
+DROP_ALL = (os.environ.get('CLI_STARTUP_DROP_CACHES', 'false') == 'true'
+            and os.access(DROP_CACHES, os.W_OK))
+
+WARM_REPEAT = int(os.environ.get('CLI_STARTUP_REPEAT', 30))
+COLD_REPEAT = int(os.environ.get('CLI_STARTUP_COLD_REPEAT', 10))
+
+COMMANDS = {
+    'version': ['raps', '--version'],
+    'config_profile_current': ['raps', 'config', 'profile', 'current'],
+    'logs_path': ['raps', 'logs', 'path'],
+    'help': ['raps', '--help'],
+}
+
+
+def evict_page_cache():
+    """Make the next launch a cold start."""
+    if DROP_ALL:
+        os.sync()
+        with open(DROP_CACHES, 'w') as f:
+            f.write('3\n')
+    elif RAPS and hasattr(os, 'posix_fadvise'):
+        fd = os.open(RAPS, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+if DROP_ALL:
+    COLD_NOTES = 'page cache dropped before every run'
+elif hasattr(os, 'posix_fadvise'):
+    COLD_NOTES = 'raps binary evicted from the page cache before every run'
+else:
+    COLD_NOTES = 'page cache not isolated on this platform'
+
+RAPS_CASE = dict(requires=('raps',), failure_status='failed', file_size_mb=0)
+
+SUITE = Suite(
+    name='cli-startup',
+    warmup=3,
+    repeat=WARM_REPEAT,
+    versions={'raps_version': ['raps', '--version']},
+    cases=[
+        *(Case(f'{name}_warm', argv, notes=f"warm start: {' '.join(argv)}", **RAPS_CASE)
+          for name, argv in COMMANDS.items()),
+        *(Case(f'{name}_cold', argv, notes=f"cold start: {' '.join(argv)} ({COLD_NOTES})",
+               warmup=0, repeat=COLD_REPEAT, before_each=evict_page_cache, **RAPS_CASE)
+          for name, argv in COMMANDS.items()),
+        # The same kind of local commands through RapsRunner, spawned vs one persistent raps shell
+        Case('worker_vs_spawn',
+             ['python3', '{script_dir}/worker-vs-spawn.py'],
+             notes='worker {worker_ms_median}ms vs spawn {spawn_ms_median}ms per command '
+                   '({speedup}x, {worker_served}/{commands} served by the worker)',
+             warmup=0, repeat=1, **RAPS_CASE),
+    ],
+)
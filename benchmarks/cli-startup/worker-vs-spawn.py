@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Worker vs spawn: local raps commands through RapsRunner, one process per
+command versus one persistent `raps shell` (pytest --raps-worker).
+
+Prints a JSON result line like the other benchmark scripts.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from tests.helpers.runner import RapsRunner  # noqa: E402
+
+COMMANDS = [
+    'raps config profile current',
+    'raps logs path',
+    'raps template list',
+    'raps plugin list',
+]
+
+
+def time_mode(worker, rounds):
+    """Per-command wall times (seconds) over `rounds` passes of COMMANDS."""
+    runner = RapsRunner(cwd=str(REPO_ROOT), worker=worker)
+    try:
+        runner.run(COMMANDS[0])  # start the worker / warm the page cache
+        times = []
+        served = 0
+        for _ in range(rounds):
+            for command in COMMANDS:
+                start = time.perf_counter()
+                result = runner.run(command)
+                times.append(time.perf_counter() - start)
+                served += result.worker
+        return times, served
+    finally:
+        runner.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=10, help='Passes over the command list')
+    args = parser.parse_args()
+
+    spawn, _ = time_mode(False, args.rounds)
+    worker, served = time_mode(True, args.rounds)
+
+    spawn_ms = statistics.median(spawn) * 1000
+    worker_ms = statistics.median(worker) * 1000
+    print(f"Spawn per command:  {spawn_ms:.1f} ms median over {len(spawn)} commands")
+    print(f"Persistent worker:  {worker_ms:.1f} ms median ({served}/{len(worker)} served by the worker)")
+    print(json.dumps({
+        'commands': len(spawn),
+        'spawn_ms_median': round(spawn_ms, 2),
+        'worker_ms_median': round(worker_ms, 2),
+        'speedup': round(spawn_ms / worker_ms, 2) if worker_ms else 0,
+        'worker_served': served,
+    }))
+
+
+if __name__ == '__main__':
+    main()
@@ -22,31 +22,18 @@ echo "========================================"
 echo ""
 
 RESULTS_FILE="$REPORT_DIR/design-automation-results.json"
-cat > "$RESULTS_FILE" << EOF
-{
-    "benchmark": "design-automation",
-    "timestamp": "$(date -Iseconds)",
-    "commands": []
+
+# Results are appended as NDJSON by the benchmark harness and written to
+# $RESULTS_FILE once, before the summary.
+harness() {
+    PYTHONPATH="$SCRIPT_DIR/..${PYTHONPATH:+:$PYTHONPATH}" \
+        python3 -m harness --report-dir "$REPORT_DIR" "$@"
 }
-EOF
 
-add_command_result() {
-    local command="$1"
-    local exists="$2"
-    local notes="$3"
+harness record --suite design-automation --reset
 
-    python3 -c "
-import json
-with open('$RESULTS_FILE', 'r') as f:
-    data = json.load(f)
-data['commands'].append({
-    'command': '$command',
-    'exists': $exists,
-    'notes': '$notes'
-})
-with open('$RESULTS_FILE', 'w') as f:
-    json.dump(data, f, indent=2)
-"
+add_command_result() {
+    harness record --suite design-automation command="$1" exists="$2" notes="$3"
 }
 
 # ============================================
@@ -172,6 +159,8 @@ SAVINGS
 
 echo ""
 
+harness finalize --suite design-automation --key commands
+
 # ============================================
 # Summary
 # ============================================
@@ -19,35 +19,19 @@ echo "========================================"
 echo ""
 
 RESULTS_FILE="$REPORT_DIR/feature-validation-results.json"
-echo '{"benchmark": "feature-validation", "timestamp": "'$(date -Iseconds)'", "claims": []}' > "$RESULTS_FILE"
 
-add_claim() {
-    local claim="$1"
-    local expected="$2"
-    local actual="$3"
-    local passed="$4"
-    local notes="$5"
-
-    # Convert bash true/false to Python True/False
-    local py_passed="False"
-    if [ "$passed" = "true" ]; then
-        py_passed="True"
-    fi
+# Results are appended as NDJSON by the benchmark harness and written to
+# $RESULTS_FILE once, before the summary.
+harness() {
+    PYTHONPATH="$SCRIPT_DIR/..${PYTHONPATH:+:$PYTHONPATH}" \
+        python3 -m harness --report-dir "$REPORT_DIR" "$@"
+}
 
-    python3 << PYEOF
-import json
-with open('$RESULTS_FILE', 'r') as f:
-    data = json.load(f)
-data['claims'].append({
-    'claim': '$claim',
-    'expected': '$expected',
-    'actual': '$actual',
-    'passed': $py_passed,
-    'notes': '''$notes'''
-})
-with open('$RESULTS_FILE', 'w') as f:
-    json.dump(data, f, indent=2)
-PYEOF
+harness record --suite feature-validation --reset
+
+add_claim() {
+    harness record --suite feature-validation \
+        claim="$1" expected="$2" actual="$3" passed="$4" notes="$5"
 }
 
 # ============================================
@@ -209,6 +193,8 @@ echo "  ✓ PASSED: All major platforms supported"
 
 echo ""
 
+harness finalize --suite feature-validation --key claims
+
 # ============================================
 # Summary
 # ============================================
@@ -0,0 +1,48 @@
+"""
+Benchmark harness for the suites under benchmarks/.
+
+Suites describe their measured commands declaratively (see Case and
+Suite) and the harness launches them, samples memory, repeats runs and
+writes results in the format scripts/generate-report.py reads. Shell
+suites that only record feature checks use `python3 -m harness record`.
+
+Run from the benchmarks directory (or with it on PYTHONPATH):
+
+    python3 -m harness run rust-vs-nodejs/suite.py
+    python3 -m harness record --suite my-suite name=foo status=available
+    python3 -m harness finalize --suite my-suite
+    python3 -m harness combine
+    python3 -m harness measure --name startup --repeat 10 -- raps --version
+"""
+
+from .baseline import BaselineStore, compare, host_fingerprint, timing_samples
+from .collector import ResultsCollector
+from .combined import summarize, write_combined
+from .launcher import Launch, launch, tree_rss_kb
+from .repeat import measure
+from .stats import bootstrap_ci, describe, format_distribution, mad, mann_whitney_greater
+from .suite import Case, Suite, run_case, run_suite, system_info
+
+__all__ = [
+    'BaselineStore',
+    'Case',
+    'Launch',
+    'ResultsCollector',
+    'Suite',
+    'bootstrap_ci',
+    'compare',
+    'describe',
+    'format_distribution',
+    'host_fingerprint',
+    'launch',
+    'mad',
+    'mann_whitney_greater',
+    'measure',
+    'run_case',
+    'run_suite',
+    'summarize',
+    'system_info',
+    'timing_samples',
+    'tree_rss_kb',
+    'write_combined',
+]
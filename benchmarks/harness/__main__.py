@@ -0,0 +1,142 @@
+"""Command-line entry point: python3 -m harness <command>."""
+
+import argparse
+import json
+import os
+import runpy
+import sys
+from pathlib import Path
+
+from .collector import ResultsCollector
+from .combined import write_combined
+from .repeat import measure
+from .stats import format_distribution
+from .suite import Suite, run_suite
+
+# Free-text fields are kept verbatim; everything else is parsed as JSON when it can be.
+TEXT_FIELDS = ('name', 'status', 'notes', 'flow', 'stage', 'command', 'claim', 'expected',
+               'actual')
+RUN_FIELDS = ('wall_seconds', 'user_seconds', 'sys_seconds', 'peak_rss_mb', 'ok')
+
+
+def load_suite(path):
+    """Load the SUITE object defined by a suite config file."""
+    namespace = runpy.run_path(str(path))
+    suite = namespace.get('SUITE')
+    if not isinstance(suite, Suite):
+        raise SystemExit(f"{path}: no SUITE = Suite(...) defined")
+    return suite
+
+
+def parse_fields(pairs):
+    """Turn key=value arguments into a record."""
+    record = {}
+    for pair in pairs:
+        key, sep, value = pair.partition('=')
+        if not sep:
+            raise SystemExit(f"expected key=value, got {pair!r}")
+        if key not in TEXT_FIELDS:
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        record[key] = value
+    return record
+
+
+def measure_command(args):
+    """Run `harness measure`; exits non-zero if any measured run failed."""
+    cmd = args.argv[1:] if args.argv[:1] == ['--'] else args.argv
+    if not cmd:
+        raise SystemExit("measure: no command given")
+    try:
+        runs, stats = measure(cmd, warmup=args.warmup, repeat=args.repeat, timeout=args.timeout)
+    except OSError as e:
+        print(f"  {args.name}: {e}", file=sys.stderr)
+        return 127
+    ok = all(r['ok'] for r in runs)
+    record = {
+        'name': args.name,
+        'command': ' '.join(cmd),
+        'status': 'success' if ok else 'failed',
+        'warmup': args.warmup,
+        'repeat': len(runs),
+        'runs': [{k: r[k] for k in RUN_FIELDS} for r in runs],
+        'stats': stats,
+        'noisy': stats['wall_seconds']['noisy'],
+    }
+    if args.attach:
+        ResultsCollector(args.attach, args.report_dir).add(record, 'measurements')
+    print(f"  {args.name}: {format_distribution(stats['wall_seconds'])}", file=sys.stderr)
+    print(f"{stats['wall_seconds']['median']:.6f}")
+    return 0 if ok else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python3 -m harness', description=__doc__)
+    parser.add_argument('--report-dir', default=os.environ.get('REPORT_DIR', 'reports'),
+                        help='Results directory (default: $REPORT_DIR or ./reports)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help='Run a declarative suite config')
+    run.add_argument('suite_file', type=Path)
+    run.add_argument('--data-dir', default=os.environ.get('DATA_DIR', 'data/generated'))
+    run.add_argument('--warmup', type=int, help='Warm-up runs per case (overrides the suite)')
+    run.add_argument('--repeat', type=int, help='Measured runs per case (overrides the suite)')
+    run.add_argument('--only', action='append', help='Run only this case (repeatable)')
+
+    record = sub.add_parser('record', help='Append one result record')
+    record.add_argument('--suite', required=True)
+    record.add_argument('--reset', action='store_true', help='Discard earlier records first')
+    record.add_argument('fields', nargs='*', metavar='key=value')
+
+    finalize = sub.add_parser('finalize', help='Write <suite>-results.json from recorded results')
+    finalize.add_argument('--suite', required=True)
+    finalize.add_argument('--key', default='tests',
+                          help='List the records go under (default: tests)')
+    finalize.add_argument('--set', dest='fields', action='append', default=[], metavar='key=value',
+                          help='Extra top-level field (repeatable)')
+
+    sub.add_parser('combine', help='Write combined-results.json from all suite results')
+
+    timing = sub.add_parser('measure', help='Time a command with warm-up and repeated runs; '
+                                            'prints the median wall time')
+    timing.add_argument('--name', required=True)
+    timing.add_argument('--warmup', type=int, default=int(os.environ.get('BENCH_WARMUP', 1)),
+                        help='Unmeasured runs first (default: $BENCH_WARMUP or 1)')
+    timing.add_argument('--repeat', type=int, default=int(os.environ.get('BENCH_REPEAT', 5)),
+                        help='Measured runs (default: $BENCH_REPEAT or 5)')
+    timing.add_argument('--timeout', type=float, help='Per-run timeout in seconds')
+    timing.add_argument('--attach', metavar='SUITE',
+                        help="Record the measurement under the suite's 'measurements' list "
+                             "(written by finalize)")
+    timing.add_argument('argv', nargs=argparse.REMAINDER, help='-- command [args...]')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        suite = load_suite(args.suite_file)
+        run_suite(suite, script_dir=args.suite_file.resolve().parent, report_dir=args.report_dir,
+                  data_dir=args.data_dir, warmup=args.warmup, repeat=args.repeat, only=args.only)
+        print(f"Results saved to: {Path(args.report_dir) / f'{suite.name}-results.json'}")
+    elif args.command == 'record':
+        collector = ResultsCollector(args.suite, args.report_dir, reset=args.reset)
+        if args.fields:
+            collector.add(parse_fields(args.fields))
+    elif args.command == 'finalize':
+        ResultsCollector(args.suite, args.report_dir).finalize(args.key,
+                                                               **parse_fields(args.fields))
+    elif args.command == 'measure':
+        return measure_command(args)
+    elif args.command == 'combine':
+        combined = write_combined(args.report_dir)
+        summary = combined['summary']
+        print()
+        print(f"Combined results saved to: {Path(args.report_dir) / 'combined-results.json'}")
+        print(f"Total validations: {summary['total_claims_validated']}")
+        print(f"Passed: {summary['passed']} ({summary['pass_rate']}%)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""Baseline store and regression comparison for benchmark timings."""
+
+import hashlib
+import json
+import os
+import platform
+import statistics
+from datetime import datetime
+from pathlib import Path
+
+from .stats import bootstrap_greater, mann_whitney_greater, percentile
+
+SCHEMA = 1
+DEFAULT_TOLERANCE = 0.10
+DEFAULT_ALPHA = 0.05
+STATISTICS = {
+    'median': statistics.median,
+    'p95': lambda samples: percentile(samples, 95),
+}
+# One-sided significance test per statistic: p-value that the first samples
+# are slower. A rank test suits the median; a p95 that regresses while the
+# bulk stays put needs a test of the p95 itself.
+SIGNIFICANCE = {
+    'median': mann_whitney_greater,
+    'p95': lambda a, b: bootstrap_greater(a, b, STATISTICS['p95']),
+}
+# Below this many samples on either side the significance test can't reach
+# any useful p-value, so the tolerance alone decides.
+MIN_SAMPLES = 3
+
+
+def host_info():
+    """The machine properties that make timings comparable."""
+    cpu = platform.processor()
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    cpu = line.split(':', 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    memory_gb = 0
+    if hasattr(os, 'sysconf'):
+        try:
+            memory_gb = round(os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 1024 ** 3)
+        except (ValueError, OSError):
+            pass
+    return {
+        'platform': platform.system(),
+        'arch': platform.machine(),
+        'cpu': cpu,
+        'cpus': os.cpu_count(),
+        'memory_gb': memory_gb,
+    }
+
+
+def host_fingerprint(info=None):
+    """Short stable hash of host_info(); baselines only compare within one host."""
+    info = info or host_info()
+    return hashlib.sha256(json.dumps(info, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def timing_samples(combined):
+    """Wall-time samples per 'suite/name' from a combined or single-suite results document.
+
+    Only successful timings count: mocked, skipped and unavailable entries
+    say nothing about raps speed. Repeated runs contribute every sample,
+    single runs their one duration, and a `measurements` entry replaces a
+    test or flow of the same name.
+    """
+    samples = {}
+    suites = combined.get('suites') or {combined.get('benchmark', 'unknown'): combined}
+    for suite_name, suite in suites.items():
+        for item in suite.get('tests', []) + suite.get('flows', []):
+            if item.get('status') != 'success':
+                continue
+            name = item.get('name') or item.get('flow')
+            if item.get('runs'):
+                values = [r['wall_seconds'] for r in item['runs'] if r.get('ok', True)]
+            elif item.get('duration_seconds'):
+                values = [item['duration_seconds']]
+            else:
+                continue
+            if values:
+                samples[f'{suite_name}/{name}'] = values
+        for item in suite.get('measurements', []):
+            values = [r['wall_seconds'] for r in item.get('runs', []) if r.get('ok', True)]
+            if item.get('status') == 'success' and values:
+                samples[f"{suite_name}/{item['name']}"] = values
+    return samples
+
+
+class BaselineStore:
+    """JSON file of timing baselines keyed by host fingerprint, raps version and benchmark.
+
+    Layout:
+        {"schema": 1,
+         "hosts": {fingerprint: host_info()},
+         "baselines": {fingerprint: {raps_version: {
+             "recorded": iso-timestamp,
+             "benchmarks": {"suite/name": {"samples": [...], "median": s}}}}}}
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                self.data = json.load(f)
+        else:
+            self.data = {'schema': SCHEMA, 'hosts': {}, 'baselines': {}}
+
+    def versions(self, host):
+        """Recorded raps versions for a host, oldest first."""
+        entries = self.data['baselines'].get(host, {})
+        return sorted(entries, key=lambda v: entries[v]['recorded'])
+
+    def get(self, host, version):
+        """{'suite/name': samples} for one host and raps version, or None."""
+        entry = self.data['baselines'].get(host, {}).get(version)
+        if entry is None:
+            return None
+        return {key: bench['samples'] for key, bench in entry['benchmarks'].items()}
+
+    def put(self, host, version, samples, info=None):
+        """Record samples as the baseline for host and version, merging per benchmark."""
+        if info:
+            self.data['hosts'][host] = info
+        entry = self.data['baselines'].setdefault(host, {}).setdefault(
+            version, {'recorded': None, 'benchmarks': {}})
+        entry['recorded'] = datetime.now().astimezone().isoformat(timespec='seconds')
+        for key, values in samples.items():
+            entry['benchmarks'][key] = {'samples': values, 'median': statistics.median(values)}
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.json.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp, self.path)
+
+
+def history_entry(samples, host, version):
+    """One line of a results history: median and p95 per benchmark."""
+    return {
+        'timestamp': datetime.now().astimezone().isoformat(timespec='seconds'),
+        'host': host,
+        'raps_version': version,
+        'benchmarks': {key: {'n': len(values), 'median': statistics.median(values),
+                             'p95': percentile(values, 95)}
+                       for key, values in samples.items()},
+    }
+
+
+def compare(baseline, current, tolerance=DEFAULT_TOLERANCE, alpha=DEFAULT_ALPHA,
+            statistic='median'):
+    """Compare current samples against baseline samples, one row per benchmark.
+
+    A benchmark regresses when its `statistic` (median or p95) is more
+    than `tolerance` slower than the baseline's and, with at least
+    MIN_SAMPLES on both sides, a one-sided test of that statistic says the
+    slowdown is significant at `alpha`: Mann-Whitney for the median, a
+    bootstrap of the p95 difference for the p95, so a regression confined
+    to the tail is caught. Improvements are judged the same way in the
+    other direction.
+    """
+    summarize = STATISTICS[statistic]
+    significance = SIGNIFICANCE[statistic]
+    rows = []
+    for key in sorted(set(baseline) | set(current)):
+        base, cur = baseline.get(key), current.get(key)
+        row = {'benchmark': key, 'baseline': None, 'current': None,
+               'change': None, 'p_value': None}
+        if base:
+            row['baseline'] = summarize(base)
+        if cur:
+            row['current'] = summarize(cur)
+        if not base:
+            row['result'] = 'new'
+        elif not cur:
+            row['result'] = 'missing'
+        else:
+            change = (row['current'] - row['baseline']) / row['baseline'] if row['baseline'] else 0.0
+            row['change'] = change
+            tested = len(base) >= MIN_SAMPLES and len(cur) >= MIN_SAMPLES
+            if change > tolerance:
+                p = significance(cur, base) if tested else None
+                row['p_value'] = p
+                row['result'] = 'regression' if p is None or p <= alpha else 'ok'
+            elif change < -tolerance:
+                p = significance(base, cur) if tested else None
+                row['p_value'] = p
+                row['result'] = 'improved' if p is None or p <= alpha else 'ok'
+            else:
+                row['result'] = 'ok'
+        rows.append(row)
+    return rows
+
+
+RESULT_ICONS = {'regression': '✗ regression', 'improved': '✓ improved', 'ok': 'ok',
+                'new': 'new', 'missing': 'missing'}
+
+
+def markdown_table(rows, statistic='median'):
+    """Markdown diff table of compare() rows."""
+
+    def seconds(value):
+        return '-' if value is None else f'{value:.3f}s'
+
+    lines = [
+        f'| Benchmark | Baseline {statistic} | Current {statistic} | Change | p-value | Result |',
+        '|-----------|-----------------|----------------|--------|---------|--------|',
+    ]
+    for row in rows:
+        change = '-' if row['change'] is None else f"{row['change']:+.1%}"
+        p = '-' if row['p_value'] is None else f"{row['p_value']:.3f}"
+        lines.append(f"| {row['benchmark']} | {seconds(row['baseline'])} | "
+                     f"{seconds(row['current'])} | {change} | {p} | {RESULT_ICONS[row['result']]} |")
+    return '\n'.join(lines) + '\n'
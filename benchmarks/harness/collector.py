@@ -0,0 +1,72 @@
+"""Append-only results collection for benchmark suites."""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+# Records filed under a list other than the suite's main one carry its name here.
+LIST_FIELD = '_list'
+
+
+class ResultsCollector:
+    """Collects one suite's results as NDJSON and writes the final JSON once.
+
+    Each record is appended as a single line to <suite>-results.ndjson, so
+    adding a result costs the same no matter how many came before it.
+    finalize() turns the lines into the <suite>-results.json document that
+    run-all-benchmarks.sh and generate-report.py read.
+    """
+
+    def __init__(self, suite, report_dir, reset=False):
+        self.suite = suite
+        self.report_dir = Path(report_dir)
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        self.ndjson_path = self.report_dir / f'{suite}-results.ndjson'
+        self.json_path = self.report_dir / f'{suite}-results.json'
+        if reset:
+            self.reset()
+
+    def reset(self):
+        """Drop records left over from a previous run."""
+        self.ndjson_path.unlink(missing_ok=True)
+
+    def add(self, record, key=None):
+        """Append one result record; with `key`, finalize() files it under that list."""
+        if key is not None:
+            record = {**record, LIST_FIELD: key}
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        # A single O_APPEND write keeps concurrent writers from interleaving lines.
+        fd = os.open(self.ndjson_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode())
+        finally:
+            os.close(fd)
+
+    def records(self):
+        """All records appended so far, in order."""
+        if not self.ndjson_path.exists():
+            return []
+        with open(self.ndjson_path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def finalize(self, records_key='tests', **fields):
+        """Write <suite>-results.json with the records under `records_key` and return it.
+
+        Records added with a key (e.g. 'measurements' from `harness measure
+        --attach`) go under that list instead.
+        """
+        lists = {records_key: []}
+        for record in self.records():
+            lists.setdefault(record.pop(LIST_FIELD, records_key), []).append(record)
+        data = {
+            'benchmark': self.suite,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            **fields,
+            **lists,
+        }
+        tmp = self.json_path.with_suffix('.json.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, self.json_path)
+        return data
@@ -0,0 +1,69 @@
+"""Combine per-suite results into the file generate-report.py reads."""
+
+import json
+import os
+import platform
+from datetime import datetime
+from pathlib import Path
+
+PASSED_TEST_STATUSES = ('success', 'mock')
+PASSED_FLOW_STATUSES = ('success', 'available', 'detected')
+
+
+def summarize(suites):
+    """Pass/fail totals across claims, tests and flows of all suites."""
+    total = passed = 0
+    for suite in suites.values():
+        if 'claims' in suite:
+            for claim in suite['claims']:
+                total += 1
+                passed += bool(claim.get('passed'))
+        elif 'tests' in suite:
+            for test in suite['tests']:
+                total += 1
+                passed += test.get('status') in PASSED_TEST_STATUSES
+        elif 'flows' in suite:
+            for flow in suite['flows']:
+                total += 1
+                passed += flow.get('status') in PASSED_FLOW_STATUSES
+    return {
+        'total_claims_validated': total,
+        'passed': passed,
+        'failed': total - passed,
+        'pass_rate': round(passed / total * 100, 1) if total > 0 else 0,
+    }
+
+
+def write_combined(report_dir):
+    """Write combined-results.json from every <suite>-results.json in report_dir."""
+    report_dir = Path(report_dir)
+    combined_path = report_dir / 'combined-results.json'
+    combined = {
+        'benchmark_run': {
+            'timestamp': datetime.now().astimezone().isoformat(timespec='seconds'),
+            'platform': platform.system(),
+            'arch': platform.machine(),
+        },
+        'suites': {},
+    }
+
+    for result_file in sorted(report_dir.glob('*-results.json')):
+        if result_file == combined_path:
+            continue
+        try:
+            with open(result_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"  Error reading {result_file}: {e}")
+            continue
+        suite_name = data.get('benchmark', result_file.name)
+        combined['suites'][suite_name] = data
+        print(f"  Added: {suite_name}")
+
+    combined['summary'] = summarize(combined['suites'])
+
+    tmp = combined_path.with_suffix('.json.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(combined, f, indent=2)
+    os.replace(tmp, combined_path)
+    return combined
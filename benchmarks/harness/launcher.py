@@ -0,0 +1,207 @@
+"""Process launcher with resident-memory sampling."""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+_PAGE_KB = os.sysconf('SC_PAGE_SIZE') // 1024 if hasattr(os, 'sysconf') else 4
+_HAVE_PROC = os.path.isdir('/proc/self')
+
+
+@dataclass
+class Launch:
+    """Outcome of one launch of one or more concurrent processes."""
+    returncodes: list
+    duration_seconds: float
+    peak_rss_mb: float
+    outputs: list
+    timed_out: bool = False
+    samples: list = field(default_factory=list)
+    # CPU time of the launched processes and the descendants they waited for.
+    user_seconds: float = 0.0
+    sys_seconds: float = 0.0
+
+    @property
+    def ok(self):
+        return not self.timed_out and all(rc == 0 for rc in self.returncodes)
+
+    def result_lines(self):
+        """The last JSON object line printed by each process, if any."""
+        results = []
+        for output in self.outputs:
+            for line in reversed(output.splitlines()):
+                line = line.strip()
+                if line.startswith('{') and line.endswith('}'):
+                    try:
+                        results.append(json.loads(line))
+                        break
+                    except ValueError:
+                        continue
+        return results
+
+
+# ── RSS sampling ───────────────────────────────────────────────
+
+def _children_by_parent():
+    """Map of ppid -> [pid] for every process visible in /proc."""
+    children = defaultdict(list)
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry.name}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces; fields resume after the last ')'.
+        ppid = int(stat[stat.rindex(b')') + 2:].split()[1])
+        children[ppid].append(int(entry.name))
+    return children
+
+
+def _proc_rss_kb(pid):
+    try:
+        with open(f'/proc/{pid}/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_KB
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def tree_rss_kb(pids):
+    """Summed RSS of the given processes and all of their descendants."""
+    if not _HAVE_PROC:
+        return _ps_rss_kb(pids)
+    children = _children_by_parent()
+    total = 0
+    stack = list(pids)
+    seen = set()
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        total += _proc_rss_kb(pid)
+        stack.extend(children.get(pid, ()))
+    return total
+
+
+def _ps_rss_kb(pids):
+    """Fallback for systems without /proc (macOS): direct processes only."""
+    if not pids:
+        return 0
+    out = subprocess.run(['ps', '-o', 'rss=', '-p', ','.join(map(str, pids))],
+                         capture_output=True, text=True).stdout
+    return sum(int(v) for v in out.split() if v.isdigit())
+
+
+def _maxrss_kb(rusage):
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere.
+    return rusage.ru_maxrss // 1024 if sys.platform == 'darwin' else rusage.ru_maxrss
+
+
+# ── Launch ─────────────────────────────────────────────────────
+
+def launch(cmds, *, timeout=None, interval=0.1, env=None, cwd=None, memory_log=None):
+    """Run one argv, or a list of argvs concurrently, sampling their memory.
+
+    Each process gets its own session so a timeout can kill the whole
+    tree, and a reaper thread blocked in wait4 so its exit time is exact
+    rather than rounded to the sampling interval. CPU time comes from
+    each child's wait4 rusage, the per-child form of
+    getrusage(RUSAGE_CHILDREN), so concurrent launches don't mix their
+    accounting. Peak memory is the highest summed RSS seen while
+    sampling, or the largest single-process peak reported by wait4,
+    whichever is larger, so short-lived processes still get a figure.
+    """
+    if cmds and isinstance(cmds[0], str):
+        cmds = [cmds]
+    outs = [tempfile.TemporaryFile() for _ in cmds]
+    samples = []
+    peak_kb = 0
+    timed_out = False
+    reaped = {}
+    lock = threading.Lock()
+    all_done = threading.Event()
+
+    def reap(proc):
+        try:
+            _, status, rusage = os.wait4(proc.pid, 0)
+        except OSError:
+            # Reaped elsewhere (ChildProcessError): no status or usage, but the
+            # pid still counts as done or the sampling loop would never end.
+            status = rusage = None
+        end = time.perf_counter()
+        with lock:
+            if status is not None:
+                proc.returncode = os.waitstatus_to_exitcode(status)
+            reaped[proc.pid] = (end, rusage)
+            if len(reaped) == len(procs):
+                all_done.set()
+
+    start = time.perf_counter()
+    procs = []
+    try:
+        for cmd, out in zip(cmds, outs):
+            procs.append(subprocess.Popen(cmd, stdout=out, stderr=subprocess.STDOUT, env=env,
+                                          cwd=cwd, start_new_session=True))
+        for proc in procs:
+            threading.Thread(target=reap, args=(proc,), daemon=True).start()
+
+        # Sample only between waits so short commands run undisturbed.
+        while not all_done.wait(interval):
+            with lock:
+                live = [p.pid for p in procs if p.pid not in reaped]
+            rss_kb = tree_rss_kb(live)
+            peak_kb = max(peak_kb, rss_kb)
+            samples.append((int(time.time() * 1000), rss_kb // 1024))
+            if timeout is not None and time.perf_counter() - start > timeout:
+                timed_out = True
+                for proc in procs:
+                    if proc.pid not in reaped:
+                        _kill_group(proc)
+                all_done.wait()
+    except BaseException:
+        for proc in procs:
+            if proc.pid not in reaped:
+                _kill_group(proc)
+        raise
+
+    duration = max(end for end, _ in reaped.values()) - start
+    usages = [r for _, r in reaped.values() if r is not None]
+    peak_kb = max([peak_kb] + [_maxrss_kb(r) for r in usages])
+
+    outputs = []
+    for out in outs:
+        out.seek(0)
+        outputs.append(out.read().decode('utf-8', 'replace'))
+        out.close()
+
+    if memory_log:
+        with open(memory_log, 'w') as f:
+            f.write('timestamp_ms,memory_mb\n')
+            f.writelines(f'{ts},{mb}\n' for ts, mb in samples)
+
+    return Launch(
+        returncodes=[p.returncode for p in procs],
+        duration_seconds=duration,
+        peak_rss_mb=peak_kb / 1024,
+        outputs=outputs,
+        timed_out=timed_out,
+        samples=samples,
+        user_seconds=sum(r.ru_utime for r in usages),
+        sys_seconds=sum(r.ru_stime for r in usages),
+    )
+
+
+def _kill_group(proc):
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
@@ -0,0 +1,36 @@
+"""Warm-up plus repeated measurement of a command."""
+
+from .launcher import launch
+from .stats import describe
+
+
+def measure(cmds, *, warmup=0, repeat=1, timeout=None, memory_log=None, before_each=None):
+    """Launch `cmds` W times unmeasured, then K times measured.
+
+    `before_each`, if given, is called before every launch (outside the
+    timed region), e.g. to evict caches for cold-start measurements.
+    Returns the per-run figures, including each run's Launch, and a
+    describe() summary of wall, user and sys time and peak RSS.
+    """
+    for _ in range(warmup):
+        if before_each:
+            before_each()
+        launch(cmds, timeout=timeout)
+
+    runs = []
+    for _ in range(max(1, repeat)):
+        if before_each:
+            before_each()
+        last = launch(cmds, timeout=timeout, memory_log=memory_log)
+        runs.append({
+            'wall_seconds': last.duration_seconds,
+            'user_seconds': last.user_seconds,
+            'sys_seconds': last.sys_seconds,
+            'peak_rss_mb': round(last.peak_rss_mb, 1),
+            'ok': last.ok,
+            'launch': last,
+        })
+
+    stats = {key: describe([r[key] for r in runs])
+             for key in ('wall_seconds', 'user_seconds', 'sys_seconds', 'peak_rss_mb')}
+    return runs, stats
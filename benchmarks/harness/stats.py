@@ -0,0 +1,142 @@
+"""Robust summary statistics for repeated measurements."""
+
+import random
+import statistics
+from collections import Counter
+
+# Relative MAD (MAD / median) above which a measurement is flagged noisy.
+NOISY_REL_MAD = 0.10
+BOOTSTRAP_ITERATIONS = 2000
+CONFIDENCE = 0.95
+
+
+def mad(samples):
+    """Median absolute deviation from the median."""
+    center = statistics.median(samples)
+    return statistics.median(abs(x - center) for x in samples)
+
+
+def bootstrap_ci(samples, confidence=CONFIDENCE, iterations=BOOTSTRAP_ITERATIONS, seed=0):
+    """Percentile bootstrap confidence interval for the median.
+
+    Seeded so the same samples always give the same interval.
+    """
+    if len(samples) < 2:
+        return samples[0], samples[0]
+    rng = random.Random(seed)
+    n = len(samples)
+    medians = sorted(statistics.median(rng.choices(samples, k=n)) for _ in range(iterations))
+    tail = (1 - confidence) / 2
+    lo = medians[int(tail * (iterations - 1))]
+    hi = medians[int(round((1 - tail) * (iterations - 1)))]
+    return lo, hi
+
+
+def percentile(samples, q):
+    """Linearly interpolated q-th percentile (0-100) of the samples."""
+    ordered = sorted(samples)
+    pos = (len(ordered) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def describe(samples, noisy_rel_mad=NOISY_REL_MAD):
+    """Median, MAD, bootstrap CI, p95 and range of a list of samples.
+
+    A measurement is noisy when its MAD exceeds `noisy_rel_mad` of the
+    median; fewer than three samples can't be judged and never are.
+    """
+    samples = [float(x) for x in samples]
+    if not samples:
+        return {'n': 0}
+    center = statistics.median(samples)
+    spread = mad(samples)
+    lo, hi = bootstrap_ci(samples)
+    return {
+        'n': len(samples),
+        'median': center,
+        'mad': spread,
+        'mean': statistics.fmean(samples),
+        'min': min(samples),
+        'max': max(samples),
+        'p95': percentile(samples, 95),
+        'ci_low': lo,
+        'ci_high': hi,
+        'confidence': CONFIDENCE,
+        'noisy': len(samples) >= 3 and center > 0 and spread / center > noisy_rel_mad,
+    }
+
+
+def format_distribution(summary, unit='s', digits=3):
+    """One-line rendering: 'median ± MAD (95% CI lo–hi, n=K)'."""
+    if not summary or not summary.get('n'):
+        return '-'
+    text = f"{summary['median']:.{digits}f}{unit}"
+    if summary['n'] > 1:
+        text += (f" ± {summary['mad']:.{digits}f} "
+                 f"({summary['confidence']:.0%} CI {summary['ci_low']:.{digits}f}–"
+                 f"{summary['ci_high']:.{digits}f}, n={summary['n']})")
+    if summary.get('noisy'):
+        text += ' [noisy]'
+    return text
+
+
+def mann_whitney_greater(a, b):
+    """One-sided Mann-Whitney U test that samples `a` tend to exceed `b`.
+
+    Returns the p-value: exact when there are no ties and the samples are
+    small, otherwise the tie-corrected normal approximation.
+    """
+    a = [float(x) for x in a]
+    b = [float(x) for x in b]
+    m, n = len(a), len(b)
+    if not m or not n:
+        return 1.0
+    u = sum(1.0 if x > y else 0.5 if x == y else 0.0 for x in a for y in b)
+    pooled = a + b
+    if len(set(pooled)) == len(pooled) and m * n <= 400:
+        return _exact_u_tail(u, m, n)
+
+    mean = m * n / 2
+    ties = sum(c ** 3 - c for c in Counter(pooled).values())
+    var = m * n / 12 * ((m + n + 1) - ties / ((m + n) * (m + n - 1)))
+    if var <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / var ** 0.5
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+def bootstrap_greater(a, b, statistic=statistics.median, iterations=BOOTSTRAP_ITERATIONS,
+                      seed=0):
+    """One-sided bootstrap test that `statistic` of samples `a` exceeds that of `b`.
+
+    Resamples both sides independently and returns the share of resampled
+    differences statistic(a) - statistic(b) that are not above zero, a
+    p-value for the difference in that one statistic (e.g. the p95, where
+    a rank test only sees shifts of the whole distribution). Seeded so the
+    same samples always give the same p-value.
+    """
+    a = [float(x) for x in a]
+    b = [float(x) for x in b]
+    if not a or not b:
+        return 1.0
+    rng = random.Random(seed)
+    not_above = sum(
+        statistic(rng.choices(a, k=len(a))) <= statistic(rng.choices(b, k=len(b)))
+        for _ in range(iterations)
+    )
+    return not_above / iterations
+
+
+def _exact_u_tail(u, m, n):
+    # counts[k] = arrangements of m+n distinct values whose U statistic is k.
+    counts = [[[1] + [0] * (i * j) for j in range(n + 1)] for i in range(m + 1)]
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            prev_a, prev_b = counts[i - 1][j], counts[i][j - 1]
+            counts[i][j] = [(prev_a[k - j] if 0 <= k - j < len(prev_a) else 0)
+                            + (prev_b[k] if k < len(prev_b) else 0)
+                            for k in range(i * j + 1)]
+    dist = counts[m][n]
+    return sum(dist[int(u):]) / sum(dist)
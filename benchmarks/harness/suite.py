@@ -0,0 +1,221 @@
+"""Declarative benchmark suites and the runner that executes them."""
+
+import os
+import platform
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .collector import ResultsCollector
+from .repeat import measure
+from .stats import format_distribution
+
+
+@dataclass
+class Case:
+    """One measured command.
+
+    String fields may use the placeholders {script_dir}, {data_dir},
+    {report_dir} and {memory_dir}. `cmd` is an argv, or a list of argvs
+    that are launched concurrently and measured as one.
+    """
+    name: str
+    cmd: list
+    notes: str = ''
+    # Input file(s); their total size is reported as file_size_mb and a
+    # missing input skips the case.
+    input: object = None
+    # Executables that must be on PATH, and an argv that must exit 0.
+    requires: tuple = ()
+    probe: list = None
+    # Only run (and record) when this environment variable is "true".
+    when_env: str = None
+    timeout: float = None
+    warmup: int = None
+    repeat: int = None
+    failure_status: str = 'crashed'
+    # Record written instead of running when requirements are not met.
+    fallback: dict = None
+    # Notes override per outcome status, e.g. {'crashed': 'expected crash'}.
+    notes_by_status: dict = None
+    memory_log: str = None
+    # Overrides the measured file size, for cases without an input file.
+    file_size_mb: float = None
+    # Callable run before every launch, outside the timed region.
+    before_each: object = None
+
+
+@dataclass
+class Suite:
+    """A named list of cases plus suite-level defaults."""
+    name: str
+    cases: list
+    warmup: int = 0
+    repeat: int = 1
+    # Extra 'system' entries: key -> argv whose first output line is recorded.
+    versions: dict = field(default_factory=dict)
+
+
+def _expand(value, ctx):
+    if isinstance(value, str):
+        return value.format(**ctx)
+    if isinstance(value, (list, tuple)):
+        return [_expand(v, ctx) for v in value]
+    return value
+
+
+def _format_notes(notes, result):
+    try:
+        return notes.format(**result)
+    except (KeyError, IndexError, ValueError):
+        return notes
+
+
+def _file_size_mb(paths):
+    return sum(os.path.getsize(p) for p in paths) // (1024 * 1024)
+
+
+def system_info(versions):
+    """Platform details plus the output of each version command."""
+    info = {
+        'platform': platform.system(),
+        'arch': platform.machine(),
+        'python_version': platform.python_version(),
+    }
+    for key, argv in versions.items():
+        try:
+            out = subprocess.run(argv, capture_output=True, text=True, timeout=30)
+            info[key] = (out.stdout or out.stderr).strip().splitlines()[0]
+        except (OSError, subprocess.SubprocessError, IndexError):
+            info[key] = 'not installed'
+    return info
+
+
+def _skip_reason(case, ctx):
+    for exe in case.requires:
+        if shutil.which(exe) is None:
+            return f'{exe} not installed'
+    if case.probe:
+        try:
+            ok = subprocess.run(_expand(case.probe, ctx), capture_output=True,
+                                timeout=60).returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            ok = False
+        if not ok:
+            return f"'{' '.join(case.probe)}' unavailable"
+    inputs = _inputs(case, ctx)
+    missing = [p for p in inputs if not os.path.exists(p)]
+    if missing:
+        return f'{os.path.basename(missing[0])} not available'
+    return None
+
+
+def _inputs(case, ctx):
+    if case.input is None:
+        return []
+    inputs = case.input if isinstance(case.input, (list, tuple)) else [case.input]
+    return _expand(list(inputs), ctx)
+
+
+def _reported(run):
+    """Memory and element counts the command printed on its result line(s)."""
+    results = run.result_lines()
+    return {
+        'memory_mb': sum(r.get('memory_mb', 0) or 0 for r in results),
+        'elements_processed': sum(r.get('elements_processed', 0) or 0 for r in results),
+        'result': results[0] if len(results) == 1 else {},
+    }
+
+
+def enabled(case):
+    """False for cases gated on an environment variable that is not "true"."""
+    return not case.when_env or os.environ.get(case.when_env, 'false') == 'true'
+
+
+def run_case(case, ctx, warmup, repeat):
+    """Run a case W+K times and build its results record."""
+    reason = _skip_reason(case, ctx)
+    if reason:
+        if case.fallback is not None:
+            return {'name': case.name, 'elements_processed': 0, **case.fallback}
+        return {
+            'name': case.name, 'duration_seconds': 0, 'memory_mb': 0, 'status': 'skipped',
+            'notes': reason, 'file_size_mb': 0, 'elements_processed': 0,
+        }
+
+    warmup = case.warmup if case.warmup is not None else warmup
+    repeat = max(1, case.repeat if case.repeat is not None else repeat)
+    memory_log = _expand(case.memory_log, ctx) if case.memory_log else None
+
+    runs, stats = measure(_expand(case.cmd, ctx), warmup=warmup, repeat=repeat,
+                          timeout=case.timeout, memory_log=memory_log,
+                          before_each=case.before_each)
+    for run in runs:
+        reported = _reported(run['launch'])
+        run['memory_mb'] = reported['memory_mb'] or round(run['peak_rss_mb'])
+        run.update(elements_processed=reported['elements_processed'], result=reported['result'])
+
+    status = 'success' if all(r['ok'] for r in runs) else case.failure_status
+    notes = (case.notes_by_status or {}).get(status, case.notes)
+    last = runs[-1]
+    record = {
+        'name': case.name,
+        'duration_seconds': stats['wall_seconds']['median'],
+        'memory_mb': max(r['memory_mb'] for r in runs),
+        'status': status,
+        'notes': _format_notes(notes, last['result']),
+        'file_size_mb': case.file_size_mb if case.file_size_mb is not None
+        else _file_size_mb(_inputs(case, ctx)),
+        'elements_processed': last['elements_processed'],
+    }
+    if repeat > 1 or warmup:
+        record['warmup'] = warmup
+        record['runs'] = [
+            {k: r[k] for k in ('wall_seconds', 'user_seconds', 'sys_seconds', 'peak_rss_mb',
+                               'memory_mb', 'ok')}
+            for r in runs
+        ]
+        record['stats'] = stats
+        record['noisy'] = stats['wall_seconds']['noisy']
+    return record
+
+
+def run_suite(suite, *, script_dir, report_dir, data_dir, warmup=None, repeat=None, only=None):
+    """Run every case of a suite and write <suite>-results.json."""
+    memory_dir = Path(report_dir) / 'memory-profiles'
+    memory_dir.mkdir(parents=True, exist_ok=True)
+    ctx = {
+        'script_dir': str(script_dir),
+        'report_dir': str(report_dir),
+        'data_dir': str(data_dir),
+        'memory_dir': str(memory_dir),
+    }
+    warmup = suite.warmup if warmup is None else warmup
+    repeat = suite.repeat if repeat is None else repeat
+
+    collector = ResultsCollector(suite.name, report_dir, reset=True)
+    system = system_info(suite.versions)
+
+    for case in suite.cases:
+        if (only and case.name not in only) or not enabled(case):
+            continue
+        print(f"{case.name}")
+        print("-" * len(case.name))
+        record = run_case(case, ctx, warmup, repeat)
+        collector.add(record)
+        if 'stats' in record:
+            print(f"  Duration: {format_distribution(record['stats']['wall_seconds'])}")
+            print(f"  CPU: user {format_distribution(record['stats']['user_seconds'])}, "
+                  f"sys {format_distribution(record['stats']['sys_seconds'])}")
+        else:
+            print(f"  Duration: {record['duration_seconds']:.2f}s")
+        print(f"  Peak Memory: {record['memory_mb']:.0f}MB")
+        if record['elements_processed']:
+            print(f"  Elements: {record['elements_processed']}")
+        print(f"  Status: {record['status']}")
+        if record['status'] == 'skipped':
+            print(f"  ({record['notes']})")
+        print()
+
+    return collector.finalize(system=system)
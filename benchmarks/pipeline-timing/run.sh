@@ -21,34 +21,19 @@ echo "========================================"
 echo ""
 
 RESULTS_FILE="$REPORT_DIR/pipeline-timing-results.json"
-cat > "$RESULTS_FILE" << EOF
-{
-    "benchmark": "pipeline-timing",
-    "timestamp": "$(date -Iseconds)",
-    "stages": [],
-    "total_pipeline": {}
+# Results are appended as NDJSON by the benchmark harness and written to
+# $RESULTS_FILE once, before the projections. Timings get warm-up plus repeated runs,
+# summarized as median, MAD and a bootstrap CI under 'measurements'.
+harness() {
+    PYTHONPATH="$SCRIPT_DIR/..${PYTHONPATH:+:$PYTHONPATH}" \
+        python3 -m harness --report-dir "$REPORT_DIR" "$@"
 }
-EOF
 
-add_stage_result() {
-    local stage="$1"
-    local manual_time="$2"
-    local automated_time="$3"
-    local savings="$4"
+harness record --suite pipeline-timing --reset
 
-    python3 -c "
-import json
-with open('$RESULTS_FILE', 'r') as f:
-    data = json.load(f)
-data['stages'].append({
-    'stage': '$stage',
-    'manual_minutes': $manual_time,
-    'automated_minutes': $automated_time,
-    'savings_minutes': $savings
-})
-with open('$RESULTS_FILE', 'w') as f:
-    json.dump(data, f, indent=2)
-"
+add_stage_result() {
+    harness record --suite pipeline-timing \
+        stage="$1" manual_minutes="$2" automated_minutes="$3" savings_minutes="$4"
 }
 
 # ============================================
@@ -99,13 +84,8 @@ echo ""
 if command -v raps &> /dev/null && [ -n "${APS_CLIENT_ID:-}" ]; then
     echo "Running simulated pipeline..."
 
-    START_TIME=$(date +%s.%N)
-
-    # Stage 1: Authentication
-    AUTH_START=$(date +%s.%N)
-    raps auth status >/dev/null 2>&1 || true
-    AUTH_END=$(date +%s.%N)
-    AUTH_TIME=$(echo "$AUTH_END - $AUTH_START" | bc)
+    # Stage 1: Authentication (median of repeated runs)
+    AUTH_TIME=$(harness measure --name auth_status --attach pipeline-timing -- raps auth status) || true
     echo "  Auth check: ${AUTH_TIME}s"
 
     # Stage 2: Would upload (simulated)
@@ -117,10 +97,8 @@ if command -v raps &> /dev/null && [ -n "${APS_CLIENT_ID:-}" ]; then
     # Stage 4: Would notify (simulated)
     echo "  Notify: (simulated - webhook or slack integration)"
 
-    END_TIME=$(date +%s.%N)
-    TOTAL_TIME=$(echo "$END_TIME - $START_TIME" | bc)
     echo ""
-    echo "  Simulated pipeline overhead: ${TOTAL_TIME}s"
+    echo "  Simulated pipeline overhead: ${AUTH_TIME}s"
 else
     echo "  Credentials not available - using expected timings"
     echo "  Full automated pipeline: <60 seconds (vs 30+ minutes manual)"
@@ -128,6 +106,8 @@ fi
 
 echo ""
 
+harness finalize --suite pipeline-timing --key stages
+
 # ============================================
 # Weekly/Yearly Projections
 # ============================================
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Python Parallel Benchmark
+
+Aggregates category, material and level counts across all cores. The
+"elements" array is split into byte ranges that start on element
+boundaries, taken from the offset index in the generator's .meta.json
+when present or found with a quick newline scan otherwise. A process
+pool then decodes each range straight out of a read-only mmap of the
+file (the page cache is shared, nothing is copied to the workers), and
+the per-range counters are merged at the end.
+
+The boundary scan needs each element to start on its own line, as
+generate-test-data.py and json.dump(indent=...) write them; the
+.meta.json index works for any layout. Only uncompressed .json and
+.ndjson files can be split.
+
+Reported memory is the parent's peak RSS plus each worker's peak RSS.
+Mapped file pages count towards every worker that touched them, so
+this overstates the real footprint.
+"""
+
+import argparse
+import bisect
+import json
+import mmap
+import os
+import resource
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Bytes decoded at a time inside a range; bounds worker memory.
+WINDOW_SIZE = 8 * 1024 * 1024
+# Ranges per worker, so a slow range doesn't leave cores idle.
+TASKS_PER_WORKER = 4
+
+_decoder = json.JSONDecoder()
+_SKIP = frozenset(b' \t\r\n,')
+
+_mm = None
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def meta_path(input_file):
+    """Path of the .meta.json that generate-test-data.py writes next to input_file."""
+    stem, ext = os.path.splitext(input_file)
+    return stem + '.meta.json' if ext in ('.json', '.ndjson') else input_file + '.meta.json'
+
+
+def load_index(input_file):
+    """Element start offsets from the generator's .meta.json, or [] if unavailable."""
+    try:
+        with open(meta_path(input_file)) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if meta.get('compression', 'none') != 'none':
+        return []
+    if meta.get('uncompressed_size_bytes', meta.get('size_bytes')) != os.path.getsize(input_file):
+        return []
+    return [entry['offset'] for entry in meta.get('index', [])]
+
+
+# ── Range planning ─────────────────────────────────────────────
+
+def element_span(mm, ndjson):
+    """Byte range [start, end) holding the elements array contents."""
+    if ndjson:
+        return 0, len(mm)
+    key = mm.find(b'"elements"')
+    if key < 0:
+        raise ValueError('no "elements" array found')
+    start = mm.find(b'[', key) + 1
+    # The array's closing bracket is the last one before the summary.
+    summary = mm.rfind(b'"summary"', start)
+    end = mm.rfind(b']', start, summary if summary > 0 else len(mm))
+    return start, end if end >= start else len(mm)
+
+
+def scan_boundary(mm, pos, end, indent):
+    """First element start at or after pos: a line holding '{' at the element indent."""
+    while pos < end:
+        nl = mm.find(b'\n', pos, end)
+        if nl < 0:
+            return end
+        pos = nl + 1
+        line = pos
+        while pos < end and mm[pos] in (0x20, 0x09):
+            pos += 1
+        if pos < end and mm[pos] == 0x7b and pos - line == indent:
+            return pos
+    return end
+
+
+def plan_ranges(mm, start, end, tasks, index):
+    """Split [start, end) into at most `tasks` ranges that begin on element starts."""
+    span = end - start
+    while start < end and mm[start] in _SKIP:
+        start += 1
+    # Nested objects of a pretty-printed document also open lines with
+    # '{', so only lines indented like the first element count.
+    indent = start - (mm.rfind(b'\n', 0, start) + 1)
+    cuts = [start]
+    for i in range(1, tasks):
+        target = start + span * i // tasks
+        if index:
+            # Nearest indexed element at or after the target.
+            k = bisect.bisect_left(index, target)
+            cut = index[k] if k < len(index) else end
+        else:
+            cut = scan_boundary(mm, target, end, indent)
+        if cuts[-1] < cut < end:
+            cuts.append(cut)
+    cuts.append(end)
+    return list(zip(cuts, cuts[1:]))
+
+
+# ── Workers ────────────────────────────────────────────────────
+
+def _open_map(path):
+    global _mm
+    f = open(path, 'rb')
+    _mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    f.close()
+
+
+def aggregate_range(start, end):
+    """Decode every element that starts in [start, end) and count it."""
+    mm = _mm
+    t0 = time.process_time()
+    elements = walls = materials = 0
+    categories, material_names, levels = Counter(), Counter(), Counter()
+
+    pos = start
+    while pos < end:
+        while pos < end and mm[pos] in _SKIP:
+            pos += 1
+        if pos >= end or mm[pos] == 0x5d:  # ']'
+            break
+        # An element starting before `end` may finish after it, so the
+        # window runs past the range end but never past the file.
+        window = WINDOW_SIZE
+        while True:
+            raw = mm[pos:pos + window]
+            text = raw.decode('utf-8', 'ignore')
+            ascii_only = len(text) == len(raw)
+            i = 0
+            consumed = 0
+            while True:
+                while i < len(text) and text[i] in ' \t\r\n,':
+                    i += 1
+                if i >= len(text) or text[i] == ']':
+                    break
+                elem_pos = pos + (i if ascii_only else len(text[:i].encode()))
+                if elem_pos >= end:
+                    break
+                try:
+                    element, i = _decoder.raw_decode(text, i)
+                except json.JSONDecodeError:
+                    break
+                consumed = i
+                elements += 1
+                category = element.get('category')
+                categories[category] += 1
+                if category == 'Walls':
+                    walls += 1
+                levels[element.get('level')] += 1
+                for material in element.get('materials', ()):
+                    materials += 1
+                    material_names[material.get('name')] += 1
+            if consumed or pos + window >= len(mm):
+                break
+            # A single element larger than the window; widen and retry.
+            window *= 2
+        if not consumed:
+            raise ValueError(f'undecodable element at byte {pos}')
+        pos += consumed if ascii_only else len(text[:consumed].encode())
+
+    return {
+        'pid': os.getpid(),
+        'bytes': end - start,
+        'cpu_seconds': time.process_time() - t0,
+        'rss_mb': peak_rss_mb(),
+        'elements': elements,
+        'walls': walls,
+        'materials': materials,
+        'categories': categories,
+        'material_names': material_names,
+        'levels': levels,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-core JSON aggregation benchmark")
+    parser.add_argument('input_file', help='Path to an uncompressed generated metadata file')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: all cores)')
+    parser.add_argument('--no-index', action='store_true',
+                        help='Ignore the .meta.json offset index and scan for boundaries')
+    args = parser.parse_args()
+
+    input_file = args.input_file
+    file_size = os.path.getsize(input_file)
+    file_size_mb = file_size / (1024 * 1024)
+    workers = max(1, args.workers)
+
+    print(f"Processing: {input_file}")
+    print(f"File size: {file_size_mb:.2f} MB")
+    print(f"Workers: {workers}")
+
+    start_time = time.time()
+
+    try:
+        if input_file.endswith(('.gz', '.zst')):
+            raise ValueError("compressed input cannot be split; use python-streaming.py")
+
+        index = [] if args.no_index else load_index(input_file)
+        with open(input_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, end = element_span(mm, input_file.endswith('.ndjson'))
+            ranges = plan_ranges(mm, start, end, workers * TASKS_PER_WORKER, index)
+        print(f"Split into {len(ranges)} ranges ({'offset index' if index else 'boundary scan'})")
+
+        elements = walls = materials = 0
+        categories, material_names, levels = Counter(), Counter(), Counter()
+        cpu_by_pid, bytes_by_pid, rss_by_pid = Counter(), Counter(), {}
+
+        with ProcessPoolExecutor(workers, initializer=_open_map, initargs=(input_file,)) as pool:
+            futures = [pool.submit(aggregate_range, lo, hi) for lo, hi in ranges]
+            for future in futures:
+                part = future.result()
+                elements += part['elements']
+                walls += part['walls']
+                materials += part['materials']
+                categories.update(part['categories'])
+                material_names.update(part['material_names'])
+                levels.update(part['levels'])
+                cpu_by_pid[part['pid']] += part['cpu_seconds']
+                bytes_by_pid[part['pid']] += part['bytes']
+                rss_by_pid[part['pid']] = max(rss_by_pid.get(part['pid'], 0), part['rss_mb'])
+
+        duration = time.time() - start_time
+        peak_memory_mb = peak_rss_mb() + sum(rss_by_pid.values())
+        throughput = file_size_mb / duration if duration > 0 else 0
+
+        print("\n=== Results ===")
+        print(f"Duration: {duration:.2f}s")
+        print(f"Elements processed: {elements}")
+        print(f"Walls found: {walls}")
+        print(f"Materials found: {materials}")
+        print(f"Peak memory: {peak_memory_mb:.0f}MB")
+        print(f"Throughput: {throughput:.1f} MB/s total, {throughput / workers:.1f} MB/s per core")
+        for pid in sorted(cpu_by_pid):
+            cpu = cpu_by_pid[pid]
+            mb = bytes_by_pid[pid] / (1024 * 1024)
+            print(f"  worker {pid}: {mb:.0f}MB in {cpu:.2f}s CPU ({mb / cpu if cpu else 0:.1f} MB/s)")
+
+        print("\nCategories:")
+        for name, count in categories.most_common():
+            print(f"  {name}: {count}")
+        print("Materials:")
+        for name, count in material_names.most_common():
+            print(f"  {name}: {count}")
+        print(f"Levels: {len(levels)} distinct")
+
+        # Output JSON for benchmark collection
+        result = {
+            "status": "success",
+            "duration_seconds": duration,
+            "elements_processed": elements,
+            "memory_mb": int(peak_memory_mb),
+            "workers": workers,
+            "throughput_mb_per_s": throughput,
+            "throughput_mb_per_s_per_core": throughput / workers
+        }
+
+        print("\n" + json.dumps(result))
+
+    except Exception as e:
+        duration = time.time() - start_time
+
+        print(f"\n=== ERROR ===")
+        print(f"Error: {str(e)}")
+
+        result = {
+            "status": "crashed",
+            "error": str(e),
+            "duration_seconds": duration,
+            "memory_mb": 0
+        }
+
+        print("\n" + json.dumps(result))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
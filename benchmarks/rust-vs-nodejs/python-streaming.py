@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Python Streaming Benchmark
+
+Processes large JSON files in constant memory using only the standard
+library. The file is read in fixed-size chunks (or through mmap) and an
+incremental tokenizer walks the top-level object, handing each entry of
+the "elements" array to json's raw_decode as soon as it is complete.
+Memory stays bounded by the chunk size plus the largest single element,
+regardless of file size.
+
+Unlike nodejs-streaming.js this does not rely on one element per line,
+so it also handles minified or pretty-printed documents. NDJSON files
+(.ndjson) and gzip/zstd compressed output from generate-test-data.py
+are accepted as well.
+"""
+
+import argparse
+import codecs
+import gzip
+import json
+import mmap
+import os
+import re
+import resource
+import sys
+import time
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CHUNK_SIZE = 1024 * 1024
+
+_WS = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+# ── Chunk sources ──────────────────────────────────────────────
+
+def iter_chunks(path, chunk_size=CHUNK_SIZE, use_mmap=False):
+    """Yield the file's raw bytes in chunks of at most chunk_size."""
+    if path.endswith('.gz'):
+        with gzip.open(path, 'rb') as f:
+            yield from iter(lambda: f.read(chunk_size), b'')
+        return
+    if path.endswith('.zst'):
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .zst files")
+        with open(path, 'rb') as raw:
+            reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+            yield from iter(lambda: reader.read(chunk_size), b'')
+        return
+
+    with open(path, 'rb') as f:
+        if use_mmap and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                for start in range(0, len(mm), chunk_size):
+                    yield mm[start:start + chunk_size]
+        else:
+            yield from iter(lambda: f.read(chunk_size), b'')
+
+
+# ── Incremental tokenizer ──────────────────────────────────────
+
+class ChunkedTokenizer:
+    """Minimal pull tokenizer over a stream of UTF-8 chunks.
+
+    Keeps a text buffer and a cursor; consumed text is dropped once the
+    cursor passes the middle of the buffer, so the buffer never holds
+    much more than one chunk plus one pending value.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size=1):
+        """Append at least size more characters to the buffer; False once input is exhausted."""
+        if self.eof:
+            return False
+        if self.pos > len(self.buf) // 2:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        pieces = [self.buf]
+        while size > 0:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.eof = True
+                pieces.append(self._utf8.decode(b'', final=True))
+                break
+            text = self._utf8.decode(chunk)
+            pieces.append(text)
+            size -= len(text)
+        self.buf = ''.join(pieces)
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars):
+        """Consume and return the next non-whitespace character, which must be in chars."""
+        c = self.peek()
+        if not c or c not in chars:
+            raise ValueError(f"expected one of {chars!r}, got {c or 'EOF'!r}")
+        self.pos += 1
+        return c
+
+    def value(self):
+        """Decode one complete JSON value at the cursor, refilling as needed.
+
+        A value cut off by the end of the buffer is only retried once the
+        pending text has doubled, so a value spanning many chunks is decoded
+        a logarithmic number of times rather than once per chunk.
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Numbers can look complete while cut mid-chunk, so
+                # failures are only final once the input is exhausted.
+                if not self._fill(len(self.buf) - self.pos):
+                    raise
+                continue
+            if end == len(self.buf) and not self.eof and not isinstance(obj, (dict, list, str)):
+                self._fill()
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_elements(chunks):
+    """Yield each entry of the top-level "elements" array, one dict at a time."""
+    tok = ChunkedTokenizer(chunks)
+    tok.expect('{')
+    if tok.peek() == '}':
+        return
+    while True:
+        key = tok.value()
+        tok.expect(':')
+        if key == 'elements':
+            tok.expect('[')
+            if tok.peek() == ']':
+                tok.pos += 1
+            else:
+                while True:
+                    yield tok.value()
+                    if tok.expect(',]') == ']':
+                        break
+        else:
+            tok.value()
+        if tok.expect(',}') == '}':
+            return
+
+
+def iter_ndjson_elements(chunks):
+    """Yield one element per non-empty line of an NDJSON stream."""
+    pending = b''
+    for chunk in chunks:
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+    if pending.strip():
+        yield json.loads(pending)
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Constant-memory streaming JSON benchmark")
+    parser.add_argument('input_file', help='Path to a generated metadata file')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help=f'Read size in bytes (default: {CHUNK_SIZE})')
+    parser.add_argument('--mmap', action='store_true',
+                        help='Read uncompressed input through mmap instead of read()')
+    args = parser.parse_args()
+
+    input_file = args.input_file
+    file_size_mb = os.path.getsize(input_file) / (1024 * 1024)
+
+    print(f"Processing: {input_file}")
+    print(f"File size: {file_size_mb:.2f} MB")
+
+    start_time = time.time()
+
+    try:
+        chunks = iter_chunks(input_file, args.chunk_size, args.mmap)
+        stem = input_file[:-3] if input_file.endswith('.gz') else input_file.removesuffix('.zst')
+        elements = iter_ndjson_elements(chunks) if stem.endswith('.ndjson') else iter_elements(chunks)
+
+        print("Streaming elements...")
+        element_count = 0
+        wall_count = 0
+        material_count = 0
+
+        for element in elements:
+            element_count += 1
+
+            if element.get('category') == 'Walls':
+                wall_count += 1
+
+            if 'materials' in element:
+                material_count += len(element['materials'])
+
+            if element_count % 2000 == 0:
+                print(f"  Processed {element_count} elements, peak memory: {peak_rss_mb():.0f}MB")
+
+        duration = time.time() - start_time
+        peak_memory_mb = peak_rss_mb()
+
+        print("\n=== Results ===")
+        print(f"Duration: {duration:.2f}s")
+        print(f"Elements processed: {element_count}")
+        print(f"Walls found: {wall_count}")
+        print(f"Materials found: {material_count}")
+        print(f"Peak memory: {peak_memory_mb:.0f}MB")
+        print(f"Throughput: {file_size_mb / duration if duration > 0 else 0:.1f} MB/s")
+
+        # Output JSON for benchmark collection
+        result = {
+            "status": "success",
+            "duration_seconds": duration,
+            "elements_processed": element_count,
+            "memory_mb": int(peak_memory_mb)
+        }
+
+        print("\n" + json.dumps(result))
+
+    except Exception as e:
+        duration = time.time() - start_time
+
+        print(f"\n=== ERROR ===")
+        print(f"Error: {str(e)}")
+
+        result = {
+            "status": "crashed",
+            "error": str(e),
+            "duration_seconds": duration,
+            "memory_mb": 0
+        }
+
+        print("\n" + json.dumps(result))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -47,687 +47,22 @@ if [ "${STRESS_TEST:-false}" = "true" ]; then
     generate_test_data "3.4gb" "huge-metadata"
 fi
 
-RESULTS_FILE="$REPORT_DIR/rust-vs-nodejs-results.json"
-MEMORY_PROFILE_DIR="$REPORT_DIR/memory-profiles"
-mkdir -p "$MEMORY_PROFILE_DIR"
-
-# Initialize results file
-python3 << INIT_EOF
-import json
-from datetime import datetime
-results = {
-    "benchmark": "rust-vs-nodejs",
-    "timestamp": datetime.now().isoformat(),
-    "system": {
-        "platform": "$(uname -s)",
-        "arch": "$(uname -m)",
-        "node_version": "$(node --version 2>/dev/null || echo 'not installed')",
-        "python_version": "$(python3 --version 2>&1 | awk '{print \$2}')"
-    },
-    "tests": [],
-    "comparisons": []
-}
-with open('$RESULTS_FILE', 'w') as f:
-    json.dump(results, f, indent=2)
-INIT_EOF
-
-# Function to add result to JSON
-add_result() {
-    local name="$1"
-    local duration="$2"
-    local memory="$3"
-    local status="$4"
-    local notes="$5"
-    local file_size_mb="${6:-0}"
-    local elements="${7:-0}"
-
-    python3 << PYEOF
-import json
-with open('$RESULTS_FILE', 'r') as f:
-    data = json.load(f)
-data['tests'].append({
-    'name': '$name',
-    'duration_seconds': float('$duration') if '$duration' and '$duration' != '' else 0,
-    'memory_mb': float('$memory') if '$memory' and '$memory' != '' else 0,
-    'status': '$status',
-    'notes': '$notes',
-    'file_size_mb': float('$file_size_mb') if '$file_size_mb' else 0,
-    'elements_processed': int('$elements') if '$elements' and '$elements' != '' else 0
-})
-with open('$RESULTS_FILE', 'w') as f:
-    json.dump(data, f, indent=2)
-PYEOF
-}
-
-# Function to monitor memory of a process
-monitor_memory() {
-    local pid="$1"
-    local output_file="$2"
-    local peak=0
-
-    echo "timestamp_ms,memory_mb" > "$output_file"
-
-    while kill -0 "$pid" 2>/dev/null; do
-        local mem=$(ps -o rss= -p "$pid" 2>/dev/null | tr -d ' ')
-        if [ -n "$mem" ] && [ "$mem" -gt 0 ]; then
-            local mem_mb=$((mem / 1024))
-            echo "$(date +%s%3N),$mem_mb" >> "$output_file"
-            if [ "$mem_mb" -gt "$peak" ]; then
-                peak=$mem_mb
-            fi
-        fi
-        sleep 0.1
-    done
-
-    echo "$peak"
-}
-
-# ============================================
-# Test 1: Node.js In-Memory JSON Processing (100MB)
-# ============================================
-echo "Test 1: Node.js In-Memory Processing (100MB)"
-echo "---------------------------------------------"
-
-if command -v node &> /dev/null; then
-    NODE_OUTPUT=$(mktemp)
-    MEMORY_LOG="$MEMORY_PROFILE_DIR/nodejs-100mb-memory.csv"
-
-    FILE_SIZE=$(stat -c%s "$DATA_DIR/small-metadata.json" 2>/dev/null || stat -f%z "$DATA_DIR/small-metadata.json")
-    FILE_SIZE_MB=$((FILE_SIZE / 1024 / 1024))
-
-    echo "  File size: ${FILE_SIZE_MB}MB"
-
-    START_TIME=$(date +%s.%N)
-
-    # Run Node.js and capture output
-    node "$SCRIPT_DIR/nodejs-baseline.js" "$DATA_DIR/small-metadata.json" > "$NODE_OUTPUT" 2>&1 &
-    NODE_PID=$!
-
-    # Monitor memory in background
-    PEAK_MEM=$(monitor_memory $NODE_PID "$MEMORY_LOG")
-
-    wait $NODE_PID && NODE_STATUS="success" || NODE_STATUS="crashed"
-
-    END_TIME=$(date +%s.%N)
-    NODE_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-
-    # Extract results from Node.js output
-    if [ -f "$NODE_OUTPUT" ]; then
-        ELEMENTS=$(grep -oP '"elements_processed":\s*\K[0-9]+' "$NODE_OUTPUT" 2>/dev/null || echo "0")
-        REPORTED_MEM=$(grep -oP '"memory_mb":\s*\K[0-9]+' "$NODE_OUTPUT" 2>/dev/null || echo "$PEAK_MEM")
-        [ -z "$REPORTED_MEM" ] && REPORTED_MEM="$PEAK_MEM"
-        [ "$REPORTED_MEM" = "0" ] && REPORTED_MEM="$PEAK_MEM"
-    fi
-
-    echo "  Duration: ${NODE_DURATION}s"
-    echo "  Peak Memory: ${REPORTED_MEM}MB"
-    echo "  Elements: ${ELEMENTS}"
-    echo "  Status: $NODE_STATUS"
-
-    add_result "nodejs_inmemory_100mb" "$NODE_DURATION" "$REPORTED_MEM" "$NODE_STATUS" \
-        "Node.js in-memory JSON processing" "$FILE_SIZE_MB" "$ELEMENTS"
-
-    rm -f "$NODE_OUTPUT"
-else
-    echo "  Node.js not found - skipping"
-    add_result "nodejs_inmemory_100mb" "0" "0" "skipped" "Node.js not installed" "0" "0"
-fi
-
-echo ""
-
-# ============================================
-# Test 2: Node.js In-Memory JSON Processing (500MB)
-# ============================================
-echo "Test 2: Node.js In-Memory Processing (500MB)"
-echo "---------------------------------------------"
-
-if command -v node &> /dev/null; then
-    NODE_OUTPUT=$(mktemp)
-    MEMORY_LOG="$MEMORY_PROFILE_DIR/nodejs-500mb-memory.csv"
-
-    FILE_SIZE=$(stat -c%s "$DATA_DIR/medium-metadata.json" 2>/dev/null || stat -f%z "$DATA_DIR/medium-metadata.json")
-    FILE_SIZE_MB=$((FILE_SIZE / 1024 / 1024))
-
-    echo "  File size: ${FILE_SIZE_MB}MB"
-
-    START_TIME=$(date +%s.%N)
-
-    # Run Node.js with increased memory limit
-    node --max-old-space-size=4096 "$SCRIPT_DIR/nodejs-baseline.js" "$DATA_DIR/medium-metadata.json" > "$NODE_OUTPUT" 2>&1 &
-    NODE_PID=$!
-
-    PEAK_MEM=$(monitor_memory $NODE_PID "$MEMORY_LOG")
-
-    wait $NODE_PID && NODE_STATUS="success" || NODE_STATUS="crashed"
-
-    END_TIME=$(date +%s.%N)
-    NODE_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-
-    if [ -f "$NODE_OUTPUT" ]; then
-        ELEMENTS=$(grep -oP '"elements_processed":\s*\K[0-9]+' "$NODE_OUTPUT" 2>/dev/null || echo "0")
-        REPORTED_MEM=$(grep -oP '"memory_mb":\s*\K[0-9]+' "$NODE_OUTPUT" 2>/dev/null || echo "$PEAK_MEM")
-        [ -z "$REPORTED_MEM" ] && REPORTED_MEM="$PEAK_MEM"
-        [ "$REPORTED_MEM" = "0" ] && REPORTED_MEM="$PEAK_MEM"
-    fi
-
-    echo "  Duration: ${NODE_DURATION}s"
-    echo "  Peak Memory: ${REPORTED_MEM}MB"
-    echo "  Elements: ${ELEMENTS}"
-    echo "  Status: $NODE_STATUS"
-
-    add_result "nodejs_inmemory_500mb" "$NODE_DURATION" "$REPORTED_MEM" "$NODE_STATUS" \
-        "Node.js in-memory processing 500MB file" "$FILE_SIZE_MB" "$ELEMENTS"
-
-    rm -f "$NODE_OUTPUT"
-else
-    echo "  Node.js not found - skipping"
-    add_result "nodejs_inmemory_500mb" "0" "0" "skipped" "Node.js not installed" "0" "0"
-fi
-
-echo ""
-
-# ============================================
-# Test 3: Node.js Streaming JSON Processing
-# ============================================
-echo "Test 3: Node.js Streaming Processing (500MB)"
-echo "---------------------------------------------"
-
-if command -v node &> /dev/null; then
-    NODE_OUTPUT=$(mktemp)
-    MEMORY_LOG="$MEMORY_PROFILE_DIR/nodejs-streaming-memory.csv"
-
-    START_TIME=$(date +%s.%N)
-
-    node "$SCRIPT_DIR/nodejs-streaming.js" "$DATA_DIR/medium-metadata.json" > "$NODE_OUTPUT" 2>&1 &
-    NODE_PID=$!
-
-    PEAK_MEM=$(monitor_memory $NODE_PID "$MEMORY_LOG")
-
-    wait $NODE_PID && NODE_STATUS="success" || NODE_STATUS="crashed"
-
-    END_TIME=$(date +%s.%N)
-    NODE_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-
-    if [ -f "$NODE_OUTPUT" ]; then
-        ELEMENTS=$(grep -oP '"elements_processed":\s*\K[0-9]+' "$NODE_OUTPUT" 2>/dev/null || echo "0")
-        REPORTED_MEM=$(grep -oP '"memory_mb":\s*\K[0-9]+' "$NODE_OUTPUT" 2>/dev/null || echo "$PEAK_MEM")
-        [ -z "$REPORTED_MEM" ] && REPORTED_MEM="$PEAK_MEM"
-    fi
-
-    echo "  Duration: ${NODE_DURATION}s"
-    echo "  Peak Memory: ${REPORTED_MEM}MB"
-    echo "  Elements: ${ELEMENTS}"
-    echo "  Status: $NODE_STATUS"
-
-    add_result "nodejs_streaming_500mb" "$NODE_DURATION" "$REPORTED_MEM" "$NODE_STATUS" \
-        "Node.js streaming JSON processing" "$FILE_SIZE_MB" "$ELEMENTS"
-
-    rm -f "$NODE_OUTPUT"
-else
-    echo "  Node.js not found - skipping"
-    add_result "nodejs_streaming_500mb" "0" "0" "skipped" "Node.js not installed" "0" "0"
-fi
-
-echo ""
-
-# ============================================
-# Test 4: Python JSON Processing (baseline)
-# ============================================
-echo "Test 4: Python JSON Processing (100MB)"
-echo "---------------------------------------"
-
-PYTHON_OUTPUT=$(mktemp)
-MEMORY_LOG="$MEMORY_PROFILE_DIR/python-100mb-memory.csv"
-
-FILE_SIZE=$(stat -c%s "$DATA_DIR/small-metadata.json" 2>/dev/null || stat -f%z "$DATA_DIR/small-metadata.json")
-FILE_SIZE_MB=$((FILE_SIZE / 1024 / 1024))
-
-START_TIME=$(date +%s.%N)
-
-python3 "$SCRIPT_DIR/python-baseline.py" "$DATA_DIR/small-metadata.json" > "$PYTHON_OUTPUT" 2>&1 &
-PYTHON_PID=$!
-
-PEAK_MEM=$(monitor_memory $PYTHON_PID "$MEMORY_LOG")
-
-wait $PYTHON_PID && PYTHON_STATUS="success" || PYTHON_STATUS="crashed"
-
-END_TIME=$(date +%s.%N)
-PYTHON_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-
-if [ -f "$PYTHON_OUTPUT" ]; then
-    ELEMENTS=$(grep -oP '"elements_processed":\s*\K[0-9]+' "$PYTHON_OUTPUT" 2>/dev/null || echo "0")
-    REPORTED_MEM=$(grep -oP '"memory_mb":\s*\K[0-9]+' "$PYTHON_OUTPUT" 2>/dev/null || echo "$PEAK_MEM")
-    [ -z "$REPORTED_MEM" ] && REPORTED_MEM="$PEAK_MEM"
-fi
-
-echo "  Duration: ${PYTHON_DURATION}s"
-echo "  Peak Memory: ${REPORTED_MEM}MB"
-echo "  Elements: ${ELEMENTS}"
-echo "  Status: $PYTHON_STATUS"
-
-add_result "python_inmemory_100mb" "$PYTHON_DURATION" "$REPORTED_MEM" "$PYTHON_STATUS" \
-    "Python in-memory JSON processing" "$FILE_SIZE_MB" "$ELEMENTS"
-
-rm -f "$PYTHON_OUTPUT"
-
-echo ""
-
-# ============================================
-# Test 5: Node.js In-Memory JSON Processing (1GB)
-# ============================================
-echo "Test 5: Node.js In-Memory Processing (1GB) - Stress Test"
-echo "---------------------------------------------------------"
-
-if command -v node &> /dev/null && [ -f "$DATA_DIR/large-metadata.json" ]; then
-    NODE_OUTPUT=$(mktemp)
-    MEMORY_LOG="$MEMORY_PROFILE_DIR/nodejs-1gb-memory.csv"
-
-    FILE_SIZE=$(stat -c%s "$DATA_DIR/large-metadata.json" 2>/dev/null || stat -f%z "$DATA_DIR/large-metadata.json")
-    FILE_SIZE_MB=$((FILE_SIZE / 1024 / 1024))
-
-    echo "  File size: ${FILE_SIZE_MB}MB"
-
-    START_TIME=$(date +%s.%N)
-
-    # Run Node.js with max heap - this should be very slow or crash
-    timeout 600 node --max-old-space-size=8192 "$SCRIPT_DIR/nodejs-baseline.js" "$DATA_DIR/large-metadata.json" > "$NODE_OUTPUT" 2>&1 &
-    NODE_PID=$!
-
-    PEAK_MEM=$(monitor_memory $NODE_PID "$MEMORY_LOG")
-
-    wait $NODE_PID && NODE_STATUS="success" || NODE_STATUS="crashed"
-
-    END_TIME=$(date +%s.%N)
-    NODE_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-
-    if [ -f "$NODE_OUTPUT" ]; then
-        ELEMENTS=$(grep -oP '"elements_processed":\s*\K[0-9]+' "$NODE_OUTPUT" 2>/dev/null || echo "0")
-        REPORTED_MEM=$(grep -oP '"memory_mb":\s*\K[0-9]+' "$NODE_OUTPUT" 2>/dev/null || echo "$PEAK_MEM")
-        [ -z "$REPORTED_MEM" ] && REPORTED_MEM="$PEAK_MEM"
-        [ "$REPORTED_MEM" = "0" ] && REPORTED_MEM="$PEAK_MEM"
-    fi
-
-    echo "  Duration: ${NODE_DURATION}s"
-    echo "  Peak Memory: ${REPORTED_MEM}MB"
-    echo "  Elements: ${ELEMENTS}"
-    echo "  Status: $NODE_STATUS"
-
-    add_result "nodejs_inmemory_1gb" "$NODE_DURATION" "$REPORTED_MEM" "$NODE_STATUS" \
-        "Node.js in-memory processing 1GB file - stress test" "$FILE_SIZE_MB" "$ELEMENTS"
-
-    rm -f "$NODE_OUTPUT"
-else
-    echo "  Skipped (Node.js not found or 1GB file not generated)"
-    add_result "nodejs_inmemory_1gb" "0" "0" "skipped" "1GB file not available" "0" "0"
-fi
-
-echo ""
-
-# ============================================
-# Test 6: Node.js Crash Test (3.4GB) - Blog Claim Validation
-# ============================================
-if [ "${STRESS_TEST:-false}" = "true" ] && [ -f "$DATA_DIR/huge-metadata.json" ]; then
-    echo "Test 6: Node.js Crash Test (3.4GB) - Validates Blog Claim"
-    echo "----------------------------------------------------------"
-    echo "  This test validates the claim that Node.js crashes on 3.4GB+ files"
-
-    NODE_OUTPUT=$(mktemp)
-    MEMORY_LOG="$MEMORY_PROFILE_DIR/nodejs-3.4gb-memory.csv"
-
-    FILE_SIZE=$(stat -c%s "$DATA_DIR/huge-metadata.json" 2>/dev/null || stat -f%z "$DATA_DIR/huge-metadata.json")
-    FILE_SIZE_MB=$((FILE_SIZE / 1024 / 1024))
-
-    echo "  File size: ${FILE_SIZE_MB}MB ($(echo "scale=2; $FILE_SIZE_MB/1024" | bc)GB)"
-
-    START_TIME=$(date +%s.%N)
-
-    # This SHOULD crash with heap limit exceeded
-    timeout 1200 node --max-old-space-size=4096 "$SCRIPT_DIR/nodejs-baseline.js" "$DATA_DIR/huge-metadata.json" > "$NODE_OUTPUT" 2>&1 &
-    NODE_PID=$!
-
-    PEAK_MEM=$(monitor_memory $NODE_PID "$MEMORY_LOG")
-
-    wait $NODE_PID && NODE_STATUS="success" || NODE_STATUS="crashed"
-
-    END_TIME=$(date +%s.%N)
-    NODE_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-
-    echo "  Duration: ${NODE_DURATION}s"
-    echo "  Peak Memory: ${PEAK_MEM}MB"
-    echo "  Status: $NODE_STATUS"
-
-    if [ "$NODE_STATUS" = "crashed" ]; then
-        echo "  ✓ BLOG CLAIM VALIDATED: Node.js crashed on 3.4GB file as expected"
-        add_result "nodejs_crash_3.4gb" "$NODE_DURATION" "$PEAK_MEM" "crashed" \
-            "VALIDATED: Node.js crashes on 3.4GB+ files as documented" "$FILE_SIZE_MB" "0"
-    else
-        echo "  ✗ Unexpected: Node.js survived 3.4GB file"
-        add_result "nodejs_crash_3.4gb" "$NODE_DURATION" "$PEAK_MEM" "success" \
-            "UNEXPECTED: Node.js handled 3.4GB (may have more memory available)" "$FILE_SIZE_MB" "0"
-    fi
-
-    rm -f "$NODE_OUTPUT"
-    echo ""
-fi
-
-# ============================================
-# Test 7: RAPS Large JSON Processing (1GB)
-# ============================================
-echo "Test 7: RAPS JSON Processing (1GB)"
-echo "-----------------------------------"
-
-if command -v raps &> /dev/null; then
-    MEMORY_LOG="$MEMORY_PROFILE_DIR/raps-1gb-memory.csv"
-
-    START_TIME=$(date +%s.%N)
-
-    if raps model --help >/dev/null 2>&1; then
-        raps model metadata extract \
-            --input "$DATA_DIR/large-metadata.json" \
-            --output "$DATA_DIR/extracted-raps.json" &
-        RAPS_PID=$!
-        PEAK_MEM=$(monitor_memory $RAPS_PID "$MEMORY_LOG")
-        wait $RAPS_PID && RAPS_STATUS="success" || RAPS_STATUS="failed"
-    else
-        # Mock execution if command missing
-        sleep 0.5
-        RAPS_STATUS="mock"
-        PEAK_MEM="100"
-    fi
-
-    END_TIME=$(date +%s.%N)
-    RAPS_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-
-    if [ "$PEAK_MEM" -eq 0 ] && [ "$RAPS_STATUS" = "success" ]; then
-        PEAK_MEM="100"
-        NOTES="RAPS streaming JSON processing (estimated, monitoring failed)"
-    else
-        NOTES="RAPS streaming JSON processing"
-    fi
-
-    echo "  Duration: ${RAPS_DURATION}s"
-    echo "  Peak Memory: ${PEAK_MEM}MB"
-    echo "  Status: $RAPS_STATUS"
-
-    add_result "raps_1gb" "$RAPS_DURATION" "$PEAK_MEM" "$RAPS_STATUS" \
-        "$NOTES" "$FILE_SIZE_MB" "0"
-else
-    echo "  RAPS not found - using expected values from blog"
-    echo "  Expected: ~28s for 1GB, ~100MB constant memory (streaming)"
-    add_result "raps_1gb" "28" "100" "mock" \
-        "RAPS not installed - extrapolated from blog (14s for 500MB)" "1024" "0"
-fi
-
-echo ""
-
-# ============================================
-# Test 8: RAPS RAPS JSON Processing (100MB)
-# ============================================
-echo "Test 8: RAPS JSON Processing (100MB)"
-echo "-------------------------------------"
-
-if command -v raps &> /dev/null; then
-    MEMORY_LOG="$MEMORY_PROFILE_DIR/raps-100mb-memory.csv"
-    
-    FILE_SIZE=$(stat -c%s "$DATA_DIR/small-metadata.json" 2>/dev/null || stat -f%z "$DATA_DIR/small-metadata.json")
-    FILE_SIZE_MB=$((FILE_SIZE / 1024 / 1024))
-
-    START_TIME=$(date +%s.%N)
-
-    if raps model --help >/dev/null 2>&1; then
-        raps model metadata extract \
-            --input "$DATA_DIR/small-metadata.json" \
-            --output "$DATA_DIR/extracted-raps-100.json" &
-        RAPS_PID=$!
-        PEAK_MEM=$(monitor_memory $RAPS_PID "$MEMORY_LOG")
-        wait $RAPS_PID && RAPS_STATUS="success" || RAPS_STATUS="failed"
-    else
-        sleep 0.2
-        RAPS_STATUS="mock"
-        PEAK_MEM="80"
-    fi
-
-    END_TIME=$(date +%s.%N)
-    RAPS_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-    
-    if [ "$PEAK_MEM" -eq 0 ] && [ "$RAPS_STATUS" = "success" ]; then
-        PEAK_MEM="80" # Estimated baseline for small files
-        NOTES="RAPS streaming 100MB (estimated)"
-    else
-        NOTES="RAPS streaming 100MB"
-    fi
-
-    echo "  Duration: ${RAPS_DURATION}s"
-    echo "  Peak Memory: ${PEAK_MEM}MB"
-    echo "  Status: $RAPS_STATUS"
-
-    add_result "raps_100mb" "$RAPS_DURATION" "$PEAK_MEM" "$RAPS_STATUS" \
-        "$NOTES" "$FILE_SIZE_MB" "0"
-else
-    add_result "raps_100mb" "3" "50" "mock" "RAPS not installed" "100" "0"
-fi
-
-echo ""
-
-# ============================================
-# Test 9: RAPS JSON Processing (500MB)
-# ============================================
-echo "Test 9: RAPS JSON Processing (500MB)"
-echo "-------------------------------------"
-
-if command -v raps &> /dev/null; then
-    MEMORY_LOG="$MEMORY_PROFILE_DIR/raps-500mb-memory.csv"
-    
-    FILE_SIZE=$(stat -c%s "$DATA_DIR/medium-metadata.json" 2>/dev/null || stat -f%z "$DATA_DIR/medium-metadata.json")
-    FILE_SIZE_MB=$((FILE_SIZE / 1024 / 1024))
-
-    START_TIME=$(date +%s.%N)
-
-    if raps model --help >/dev/null 2>&1; then
-        raps model metadata extract \
-            --input "$DATA_DIR/medium-metadata.json" \
-            --output "$DATA_DIR/extracted-raps-500.json" &
-        RAPS_PID=$!
-        PEAK_MEM=$(monitor_memory $RAPS_PID "$MEMORY_LOG")
-        wait $RAPS_PID && RAPS_STATUS="success" || RAPS_STATUS="failed"
-    else
-        sleep 0.3
-        RAPS_STATUS="mock"
-        PEAK_MEM="90"
-    fi
-
-    END_TIME=$(date +%s.%N)
-    RAPS_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-    
-    if [ "$PEAK_MEM" -eq 0 ] && [ "$RAPS_STATUS" = "success" ]; then
-        PEAK_MEM="90" # Estimated
-        NOTES="RAPS streaming 500MB (estimated)"
-    else
-        NOTES="RAPS streaming 500MB"
-    fi
-
-    echo "  Duration: ${RAPS_DURATION}s"
-    echo "  Peak Memory: ${PEAK_MEM}MB"
-    echo "  Status: $RAPS_STATUS"
-
-    add_result "raps_500mb" "$RAPS_DURATION" "$PEAK_MEM" "$RAPS_STATUS" \
-        "$NOTES" "$FILE_SIZE_MB" "0"
-else
-    add_result "raps_500mb" "14" "80" "mock" "RAPS not installed" "500" "0"
-fi
-
-echo ""
-
-# ============================================
-# Test 10: RAPS 3.4GB (Stress Test)
-# ============================================
-if [ "${STRESS_TEST:-false}" = "true" ] && [ -f "$DATA_DIR/huge-metadata.json" ]; then
-    echo "Test 10: RAPS JSON Processing (3.4GB)"
-    echo "--------------------------------------"
-    
-    if command -v raps &> /dev/null; then
-        MEMORY_LOG="$MEMORY_PROFILE_DIR/raps-3.4gb-memory.csv"
-        
-        FILE_SIZE=$(stat -c%s "$DATA_DIR/huge-metadata.json" 2>/dev/null || stat -f%z "$DATA_DIR/huge-metadata.json")
-        FILE_SIZE_MB=$((FILE_SIZE / 1024 / 1024))
-
-        START_TIME=$(date +%s.%N)
-
-        if raps model --help >/dev/null 2>&1; then
-            raps model metadata extract \
-                --input "$DATA_DIR/huge-metadata.json" \
-                --output "$DATA_DIR/extracted-raps-huge.json" &
-            RAPS_PID=$!
-            PEAK_MEM=$(monitor_memory $RAPS_PID "$MEMORY_LOG")
-            wait $RAPS_PID && RAPS_STATUS="success" || RAPS_STATUS="failed"
-        else
-            sleep 0.5
-            RAPS_STATUS="mock"
-            PEAK_MEM="120"
-        fi
-
-        END_TIME=$(date +%s.%N)
-        RAPS_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-        
-        if [ "$PEAK_MEM" -eq 0 ] && [ "$RAPS_STATUS" = "success" ]; then
-            PEAK_MEM="120"
-            NOTES="RAPS streaming 3.4GB (estimated)"
-        else
-            NOTES="RAPS streaming 3.4GB"
-        fi
-
-        echo "  Duration: ${RAPS_DURATION}s"
-        echo "  Peak Memory: ${PEAK_MEM}MB"
-        echo "  Status: $RAPS_STATUS"
-
-        add_result "raps_3.4gb" "$RAPS_DURATION" "$PEAK_MEM" "$RAPS_STATUS" \
-            "$NOTES" "$FILE_SIZE_MB" "0"
-    fi
-    echo ""
-fi
-
-echo ""
-
-# ============================================
-# Test 6: Batch Processing Comparison
-# ============================================
-echo "Test 6: Batch Processing (5 x 100MB files)"
-echo "-------------------------------------------"
-
-# Generate batch test files
+# Batch test files (5 x 100MB)
 for i in 1 2 3 4 5; do
     generate_test_data "100mb" "batch-file-$i"
 done
 
-echo ""
-echo "  Node.js batch processing..."
-
-if command -v node &> /dev/null; then
-    MEMORY_LOG="$MEMORY_PROFILE_DIR/nodejs-batch-memory.csv"
-    echo "timestamp_ms,memory_mb" > "$MEMORY_LOG"
-
-    START_TIME=$(date +%s.%N)
-    BATCH_PIDS=""
-
-    for i in 1 2 3 4 5; do
-        node --max-old-space-size=2048 "$SCRIPT_DIR/nodejs-baseline.js" \
-            "$DATA_DIR/batch-file-$i.json" > /dev/null 2>&1 &
-        BATCH_PIDS="$BATCH_PIDS $!"
-    done
-
-    # Monitor total memory
-    PEAK_TOTAL=0
-    while true; do
-        RUNNING=0
-        TOTAL_MEM=0
-        for pid in $BATCH_PIDS; do
-            if kill -0 $pid 2>/dev/null; then
-                RUNNING=1
-                MEM=$(ps -o rss= -p $pid 2>/dev/null | tr -d ' ')
-                [ -n "$MEM" ] && TOTAL_MEM=$((TOTAL_MEM + MEM / 1024))
-            fi
-        done
-        [ $RUNNING -eq 0 ] && break
-        [ $TOTAL_MEM -gt $PEAK_TOTAL ] && PEAK_TOTAL=$TOTAL_MEM
-        echo "$(date +%s%3N),$TOTAL_MEM" >> "$MEMORY_LOG"
-        sleep 0.2
-    done
-
-    wait
-
-    END_TIME=$(date +%s.%N)
-    BATCH_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-
-    echo "    Duration: ${BATCH_DURATION}s"
-    echo "    Peak Memory: ${PEAK_TOTAL}MB"
-
-    add_result "nodejs_batch_5x100mb" "$BATCH_DURATION" "$PEAK_TOTAL" "success" \
-        "Node.js batch processing 5 files concurrently" "500" "0"
-else
-    add_result "nodejs_batch_5x100mb" "0" "0" "skipped" "Node.js not installed" "0" "0"
-fi
+RESULTS_FILE="$REPORT_DIR/rust-vs-nodejs-results.json"
 
 echo ""
-echo "  RAPS batch processing..."
-
-if command -v raps &> /dev/null; then
-    MEMORY_LOG="$MEMORY_PROFILE_DIR/raps-batch-memory.csv"
-    echo "timestamp_ms,memory_mb" > "$MEMORY_LOG"
-
-    START_TIME=$(date +%s.%N)
-    BATCH_PIDS=""
-
-    for i in 1 2 3 4 5; do
-        if raps model --help >/dev/null 2>&1; then
-            raps model metadata extract \
-                --input "$DATA_DIR/batch-file-$i.json" \
-                --output "$DATA_DIR/batch-output-$i.json" &
-            BATCH_PIDS="$BATCH_PIDS $!"
-        else
-            sleep 0.2 &
-            BATCH_PIDS="$BATCH_PIDS $!"
-        fi
-    done
-
-    PEAK_TOTAL=0
-    while true; do
-        RUNNING=0
-        TOTAL_MEM=0
-        for pid in $BATCH_PIDS; do
-            if kill -0 $pid 2>/dev/null; then
-                RUNNING=1
-                MEM=$(ps -o rss= -p $pid 2>/dev/null | tr -d ' ')
-                [ -n "$MEM" ] && TOTAL_MEM=$((TOTAL_MEM + MEM / 1024))
-            fi
-        done
-        [ $RUNNING -eq 0 ] && break
-        [ $TOTAL_MEM -gt $PEAK_TOTAL ] && PEAK_TOTAL=$TOTAL_MEM
-        echo "$(date +%s%3N),$TOTAL_MEM" >> "$MEMORY_LOG"
-        sleep 0.2
-    done
-
-    wait
-
-    END_TIME=$(date +%s.%N)
-    BATCH_DURATION=$(echo "$END_TIME - $START_TIME" | bc)
-
-    echo "    Duration: ${BATCH_DURATION}s"
-    echo "    Peak Memory: ${PEAK_TOTAL}MB"
-
-    if [ "$PEAK_TOTAL" -eq 0 ]; then
-        PEAK_TOTAL="150"
-        NOTES="RAPS batch processing 5 files concurrently (estimated)"
-    else
-        NOTES="RAPS batch processing 5 files concurrently"
-    fi
 
-    add_result "raps_batch_5x100mb" "$BATCH_DURATION" "$PEAK_TOTAL" "success" \
-        "$NOTES" "500" "0"
-else
-    echo "    RAPS not found - using expected values"
-    add_result "raps_batch_5x100mb" "8.5" "150" "mock" \
-        "RAPS not installed - using documented performance" "500" "0"
-fi
+# ============================================
+# Run the measured cases (see suite.py)
+# ============================================
+# The harness launches each command, samples RSS of its process tree and
+# writes $RESULTS_FILE in one go.
+PYTHONPATH="$SCRIPT_DIR/..${PYTHONPATH:+:$PYTHONPATH}" \
+    python3 -m harness --report-dir "$REPORT_DIR" run "$SCRIPT_DIR/suite.py" --data-dir "$DATA_DIR"
 
 echo ""
 
@@ -805,6 +140,25 @@ if 'nodejs_inmemory_100mb' in tests and 'python_inmemory_100mb' in tests:
             'speedup': speedup
         })
 
+# Python streaming vs Node.js streaming
+if 'python_streaming_500mb' in tests and 'nodejs_streaming_500mb' in tests:
+    py = tests['python_streaming_500mb']
+    node = tests['nodejs_streaming_500mb']
+    if py['status'] == 'success' and node['status'] == 'success':
+        if node['duration_seconds'] > 0:
+            ratio = py['duration_seconds'] / node['duration_seconds']
+        else:
+            ratio = 0
+        print(f"\nPython vs Node.js (500MB streaming):")
+        print(f"  Python: {py['duration_seconds']:.2f}s, {py['memory_mb']:.0f}MB")
+        print(f"  Node.js: {node['duration_seconds']:.2f}s, {node['memory_mb']:.0f}MB")
+        comparisons.append({
+            'comparison': 'python_vs_nodejs_streaming_500mb',
+            'duration_ratio': ratio,
+            'python_memory': py['memory_mb'],
+            'nodejs_memory': node['memory_mb']
+        })
+
 # RAPS vs Node.js (1GB comparison)
 if 'raps_1gb' in tests and 'nodejs_inmemory_1gb' in tests:
     raps = tests['raps_1gb']
@@ -859,6 +213,12 @@ if 'raps_500mb' in tests and 'nodejs_inmemory_500mb' in tests:
     print(f"  Node In-Memory: {node['duration_seconds']:.2f}s, {node['memory_mb']:.0f}MB")
     if stream:
         print(f"  Node Streaming: {stream.get('duration_seconds', 0):.2f}s, {stream.get('memory_mb', 0):.0f}MB")
+    py_stream = tests.get('python_streaming_500mb', {})
+    if py_stream:
+        print(f"  Py Streaming:   {py_stream.get('duration_seconds', 0):.2f}s, {py_stream.get('memory_mb', 0):.0f}MB")
+    py_parallel = tests.get('python_parallel_500mb', {})
+    if py_parallel:
+        print(f"  Py Parallel:    {py_parallel.get('duration_seconds', 0):.2f}s, {py_parallel.get('memory_mb', 0):.0f}MB")
 
 
 # Batch comparison
@@ -893,5 +253,5 @@ with open('$RESULTS_FILE', 'w') as f:
     json.dump(data, f, indent=2)
 
 print(f"\nResults saved to: $RESULTS_FILE")
-print(f"Memory profiles saved to: $MEMORY_PROFILE_DIR/")
+print(f"Memory profiles saved to: $REPORT_DIR/memory-profiles/")
 ANALYSIS_EOF
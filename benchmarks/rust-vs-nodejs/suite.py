@@ -0,0 +1,129 @@
+"""
+Rust vs Node.js suite definition for the benchmark harness.
+
+Run through run.sh, which generates the test data first and prints the
+comparison analysis afterwards.
+"""
+
+from harness import Case, Suite
+
+SMALL = '{data_dir}/small-metadata.json'
+MEDIUM = '{data_dir}/medium-metadata.json'
+LARGE = '{data_dir}/large-metadata.json'
+HUGE = '{data_dir}/huge-metadata.json'
+BATCH = [f'{{data_dir}}/batch-file-{i}.json' for i in range(1, 6)]
+
+
+def raps_extract(source, output):
+    return ['raps', 'model', 'metadata', 'extract', '--input', source, '--output', output]
+
+
+RAPS = dict(requires=('raps',), probe=['raps', 'model', '--help'], failure_status='failed')
+
+SUITE = Suite(
+    name='rust-vs-nodejs',
+    versions={'node_version': ['node', '--version'], 'raps_version': ['raps', '--version']},
+    cases=[
+        # Node.js in-memory JSON.parse
+        Case('nodejs_inmemory_100mb',
+             ['node', '{script_dir}/nodejs-baseline.js', SMALL],
+             notes='Node.js in-memory JSON processing',
+             input=SMALL, requires=('node',),
+             memory_log='{memory_dir}/nodejs-100mb-memory.csv'),
+        Case('nodejs_inmemory_500mb',
+             ['node', '--max-old-space-size=4096', '{script_dir}/nodejs-baseline.js', MEDIUM],
+             notes='Node.js in-memory processing 500MB file',
+             input=MEDIUM, requires=('node',),
+             memory_log='{memory_dir}/nodejs-500mb-memory.csv'),
+        Case('nodejs_streaming_500mb',
+             ['node', '{script_dir}/nodejs-streaming.js', MEDIUM],
+             notes='Node.js streaming JSON processing',
+             input=MEDIUM, requires=('node',),
+             memory_log='{memory_dir}/nodejs-streaming-memory.csv'),
+
+        # Python contenders
+        Case('python_inmemory_100mb',
+             ['python3', '{script_dir}/python-baseline.py', SMALL],
+             notes='Python in-memory JSON processing',
+             input=SMALL,
+             memory_log='{memory_dir}/python-100mb-memory.csv'),
+        Case('python_streaming_500mb',
+             ['python3', '{script_dir}/python-streaming.py', MEDIUM],
+             notes='Python constant-memory streaming JSON processing',
+             input=MEDIUM,
+             memory_log='{memory_dir}/python-streaming-memory.csv'),
+        Case('python_parallel_500mb',
+             ['python3', '{script_dir}/python-parallel.py', MEDIUM],
+             notes='Python mmap + process pool, {workers} workers, '
+                   '{throughput_mb_per_s_per_core:.1f} MB/s per core',
+             input=MEDIUM,
+             memory_log='{memory_dir}/python-parallel-memory.csv'),
+
+        # Stress tests
+        Case('nodejs_inmemory_1gb',
+             ['node', '--max-old-space-size=8192', '{script_dir}/nodejs-baseline.js', LARGE],
+             notes='Node.js in-memory processing 1GB file - stress test',
+             input=LARGE, requires=('node',), timeout=600,
+             memory_log='{memory_dir}/nodejs-1gb-memory.csv'),
+        Case('nodejs_crash_3.4gb',
+             ['node', '--max-old-space-size=4096', '{script_dir}/nodejs-baseline.js', HUGE],
+             notes_by_status={
+                 'crashed': 'VALIDATED: Node.js crashes on 3.4GB+ files as documented',
+                 'success': 'UNEXPECTED: Node.js handled 3.4GB (may have more memory available)',
+             },
+             input=HUGE, requires=('node',), when_env='STRESS_TEST', timeout=1200,
+             memory_log='{memory_dir}/nodejs-3.4gb-memory.csv'),
+        Case('python_streaming_3.4gb',
+             ['python3', '{script_dir}/python-streaming.py', HUGE],
+             notes='Python constant-memory streaming on the file that crashes Node.js in-memory',
+             input=HUGE, when_env='STRESS_TEST', timeout=1200,
+             memory_log='{memory_dir}/python-streaming-3.4gb-memory.csv'),
+
+        # RAPS streaming extraction
+        Case('raps_1gb',
+             raps_extract(LARGE, '{data_dir}/extracted-raps.json'),
+             notes='RAPS streaming JSON processing',
+             input=LARGE, memory_log='{memory_dir}/raps-1gb-memory.csv',
+             fallback={'duration_seconds': 28, 'memory_mb': 100, 'status': 'mock',
+                       'notes': 'RAPS not installed - extrapolated from blog (14s for 500MB)',
+                       'file_size_mb': 1024},
+             **RAPS),
+        Case('raps_100mb',
+             raps_extract(SMALL, '{data_dir}/extracted-raps-100.json'),
+             notes='RAPS streaming 100MB',
+             input=SMALL, memory_log='{memory_dir}/raps-100mb-memory.csv',
+             fallback={'duration_seconds': 3, 'memory_mb': 50, 'status': 'mock',
+                       'notes': 'RAPS not installed', 'file_size_mb': 100},
+             **RAPS),
+        Case('raps_500mb',
+             raps_extract(MEDIUM, '{data_dir}/extracted-raps-500.json'),
+             notes='RAPS streaming 500MB',
+             input=MEDIUM, memory_log='{memory_dir}/raps-500mb-memory.csv',
+             fallback={'duration_seconds': 14, 'memory_mb': 80, 'status': 'mock',
+                       'notes': 'RAPS not installed', 'file_size_mb': 500},
+             **RAPS),
+        Case('raps_3.4gb',
+             raps_extract(HUGE, '{data_dir}/extracted-raps-huge.json'),
+             notes='RAPS streaming 3.4GB',
+             input=HUGE, when_env='STRESS_TEST',
+             memory_log='{memory_dir}/raps-3.4gb-memory.csv',
+             **RAPS),
+
+        # Batch: five files at once, memory summed across processes
+        Case('nodejs_batch_5x100mb',
+             [['node', '--max-old-space-size=2048', '{script_dir}/nodejs-baseline.js', f]
+              for f in BATCH],
+             notes='Node.js batch processing 5 files concurrently',
+             input=BATCH, requires=('node',), file_size_mb=500,
+             memory_log='{memory_dir}/nodejs-batch-memory.csv'),
+        Case('raps_batch_5x100mb',
+             [raps_extract(f, f.replace('batch-file-', 'batch-output-')) for f in BATCH],
+             notes='RAPS batch processing 5 files concurrently',
+             input=BATCH, file_size_mb=500,
+             memory_log='{memory_dir}/raps-batch-memory.csv',
+             fallback={'duration_seconds': 8.5, 'memory_mb': 150, 'status': 'mock',
+                       'notes': 'RAPS not installed - using documented performance',
+                       'file_size_mb': 500},
+             **RAPS),
+    ],
+)
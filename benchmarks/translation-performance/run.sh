@@ -22,33 +22,18 @@ echo "========================================"
 echo ""
 
 RESULTS_FILE="$REPORT_DIR/translation-performance-results.json"
-cat > "$RESULTS_FILE" << EOF
-{
-    "benchmark": "translation-performance",
-    "timestamp": "$(date -Iseconds)",
-    "tests": []
+
+# Results are appended as NDJSON by the benchmark harness and written to
+# $RESULTS_FILE once, before the summary.
+harness() {
+    PYTHONPATH="$SCRIPT_DIR/..${PYTHONPATH:+:$PYTHONPATH}" \
+        python3 -m harness --report-dir "$REPORT_DIR" "$@"
 }
-EOF
 
-add_test_result() {
-    local name="$1"
-    local status="$2"
-    local duration="$3"
-    local notes="$4"
+harness record --suite translation-performance --reset
 
-    python3 -c "
-import json
-with open('$RESULTS_FILE', 'r') as f:
-    data = json.load(f)
-data['tests'].append({
-    'name': '$name',
-    'status': '$status',
-    'duration_seconds': $duration,
-    'notes': '$notes'
-})
-with open('$RESULTS_FILE', 'w') as f:
-    json.dump(data, f, indent=2)
-"
+add_test_result() {
+    harness record --suite translation-performance name="$1" status="$2" duration_seconds="$3" notes="$4"
 }
 
 # ============================================
@@ -181,6 +166,8 @@ echo ""
 
 add_test_result "error_handling" "documented" "0" "Retry logic with exponential backoff"
 
+harness finalize --suite translation-performance
+
 # ============================================
 # Summary
 # ============================================
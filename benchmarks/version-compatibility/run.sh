@@ -21,31 +21,18 @@ echo "========================================"
 echo ""
 
 RESULTS_FILE="$REPORT_DIR/version-compatibility-results.json"
-cat > "$RESULTS_FILE" << EOF
-{
-    "benchmark": "version-compatibility",
-    "timestamp": "$(date -Iseconds)",
-    "tests": []
+
+# Results are appended as NDJSON by the benchmark harness and written to
+# $RESULTS_FILE once, before the summary.
+harness() {
+    PYTHONPATH="$SCRIPT_DIR/..${PYTHONPATH:+:$PYTHONPATH}" \
+        python3 -m harness --report-dir "$REPORT_DIR" "$@"
 }
-EOF
 
-add_test_result() {
-    local name="$1"
-    local status="$2"
-    local notes="$3"
+harness record --suite version-compatibility --reset
 
-    python3 -c "
-import json
-with open('$RESULTS_FILE', 'r') as f:
-    data = json.load(f)
-data['tests'].append({
-    'name': '$name',
-    'status': '$status',
-    'notes': '$notes'
-})
-with open('$RESULTS_FILE', 'w') as f:
-    json.dump(data, f, indent=2)
-"
+add_test_result() {
+    harness record --suite version-compatibility name="$1" status="$2" notes="$3"
 }
 
 # ============================================
@@ -211,6 +198,8 @@ COMPARE
 
 echo ""
 
+harness finalize --suite version-compatibility
+
 # ============================================
 # Summary
 # ============================================
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark Regression Gate for RAPS Examples
+
+Compares a combined-results.json, or a single <suite>-results.json,
+against the stored timing baseline for this host and raps version, prints
+a markdown diff table and exits 1 when any benchmark got significantly
+slower.
+
+Usage:
+    python3 scripts/bench-compare.py                       # compare reports/ to the baseline
+    python3 scripts/bench-compare.py --output diff.md      # also write the table to a file
+    python3 scripts/bench-compare.py --update              # record these results as the baseline
+    python3 scripts/bench-compare.py --against 4.2.0       # compare to another raps version
+    python3 scripts/bench-compare.py reports/cli-startup-results.json --statistic p95 \
+        --history benchmark-results/cli-startup-history.ndjson
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+WORKSPACE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(WORKSPACE_DIR / 'benchmarks'))
+
+from harness.baseline import (  # noqa: E402
+    DEFAULT_ALPHA, DEFAULT_TOLERANCE, STATISTICS, BaselineStore, compare, history_entry,
+    host_fingerprint, host_info, markdown_table, timing_samples,
+)
+
+REPORT_DIR = os.environ.get('REPORT_DIR', 'reports')
+DEFAULT_BASELINE = WORKSPACE_DIR / 'benchmark-results' / 'baselines.json'
+
+
+def raps_version(combined):
+    """The raps version the results were produced with."""
+    version = None
+    for suite in (combined.get('suites') or {'': combined}).values():
+        recorded = suite.get('system', {}).get('raps_version')
+        if recorded and recorded != 'not installed':
+            version = recorded
+            break
+    if version is None:
+        try:
+            out = subprocess.run(['raps', '--version'], capture_output=True, text=True, timeout=30)
+            version = out.stdout.strip().splitlines()[0]
+        except (OSError, subprocess.SubprocessError, IndexError):
+            return 'unknown'
+    # `raps --version` prints "raps X.Y.Z".
+    return version.removeprefix('raps ').strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare benchmark results against a stored baseline')
+    parser.add_argument('results', nargs='?', type=Path,
+                        default=Path(REPORT_DIR) / 'combined-results.json',
+                        help='Results file to check (default: $REPORT_DIR/combined-results.json)')
+    parser.add_argument('--baseline', type=Path,
+                        default=Path(os.environ.get('BENCH_BASELINE', DEFAULT_BASELINE)),
+                        help='Baseline store (default: $BENCH_BASELINE or benchmark-results/baselines.json)')
+    parser.add_argument('--tolerance', type=float,
+                        default=float(os.environ.get('BENCH_TOLERANCE', DEFAULT_TOLERANCE)),
+                        help='Allowed slowdown as a fraction of the baseline statistic '
+                             '(default: $BENCH_TOLERANCE or 0.10)')
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA,
+                        help='Significance level of the Mann-Whitney test (default: 0.05)')
+    parser.add_argument('--statistic', choices=sorted(STATISTICS), default='median',
+                        help='Statistic compared against the tolerance (default: median)')
+    parser.add_argument('--raps-version', help='raps version of the results (default: detected)')
+    parser.add_argument('--against', metavar='VERSION',
+                        help='Baseline raps version to compare to (default: same version, '
+                             'else the most recently recorded one)')
+    parser.add_argument('--exclude', action='append', default=[], metavar='PATTERN',
+                        help='Skip benchmarks matching this suite/name glob (repeatable)')
+    parser.add_argument('--output', type=Path, help='Also write the markdown table here')
+    parser.add_argument('--history', type=Path, metavar='NDJSON',
+                        help='Append median and p95 of every benchmark to this history file')
+    parser.add_argument('--update', action='store_true',
+                        help='Record the results as the baseline for this host and version')
+    args = parser.parse_args()
+
+    if not args.results.exists():
+        print(f"Results not found: {args.results}", file=sys.stderr)
+        return 2
+    with open(args.results) as f:
+        combined = json.load(f)
+
+    info = host_info()
+    host = host_fingerprint(info)
+    version = args.raps_version or raps_version(combined)
+    current = {key: samples for key, samples in timing_samples(combined).items()
+               if not any(fnmatch.fnmatch(key, pattern) for pattern in args.exclude)}
+    store = BaselineStore(args.baseline)
+
+    against = args.against
+    if against is None:
+        recorded = store.versions(host)
+        against = version if version in recorded else (recorded[-1] if recorded else None)
+    baseline = store.get(host, against) if against else None
+    if baseline is not None:
+        # Only the suites present in the results; a single-suite file isn't missing the rest.
+        suites = combined.get('suites') or {combined.get('benchmark'): None}
+        baseline = {k: v for k, v in baseline.items()
+                    if k.split('/', 1)[0] in suites
+                    and not any(fnmatch.fnmatch(k, pattern) for pattern in args.exclude)}
+
+    regressions = []
+    if baseline is None:
+        md = (f"No baseline for host {host} ({info['cpu']}, {info['cpus']} CPUs)"
+              f"{f' and raps {against}' if against else ''}.\n")
+    else:
+        rows = compare(baseline, current, tolerance=args.tolerance, alpha=args.alpha,
+                       statistic=args.statistic)
+        regressions = [r for r in rows if r['result'] == 'regression']
+        md = (f"## Benchmark comparison\n\n"
+              f"raps {version} vs baseline raps {against} on host {host}, "
+              f"{args.statistic}, tolerance {args.tolerance:.0%}, alpha {args.alpha}\n\n"
+              f"{markdown_table(rows, args.statistic)}\n"
+              f"{len(regressions)} regression(s) in {len(rows)} benchmark(s).\n")
+
+    print(md)
+    if args.output:
+        args.output.write_text(md)
+
+    if args.history:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.history, 'a') as f:
+            f.write(json.dumps(history_entry(current, host, version)) + '\n')
+
+    if args.update:
+        store.put(host, version, current, info=info)
+        store.save()
+        print(f"Baseline for raps {version} on host {host} saved to: {args.baseline}")
+        return 0
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -81,6 +81,45 @@ def load_results():
     return results
 
 
+def format_distribution(summary: dict, unit: str = 's', digits: int = 3) -> str:
+    """Render a repeat-run summary as 'median ± MAD (95% CI lo–hi, n=K)'."""
+    if not summary or not summary.get('n'):
+        return '-'
+    text = f"{summary['median']:.{digits}f}{unit}"
+    if summary['n'] > 1:
+        text += (f" ± {summary['mad']:.{digits}f} "
+                 f"({summary.get('confidence', 0.95):.0%} CI {summary['ci_low']:.{digits}f}–"
+                 f"{summary['ci_high']:.{digits}f}, n={summary['n']})")
+    return text
+
+
+def format_duration(item: dict) -> str:
+    """Duration cell: the distribution when repeated, else the single value."""
+    stats = item.get('stats', {}).get('wall_seconds')
+    if stats:
+        return format_distribution(stats) + (' ⚠ noisy' if stats.get('noisy') else '')
+    return f"{item.get('duration_seconds', '-')}s"
+
+
+def distribution_bar(summary: dict, scale: float) -> str:
+    """Inline box plot: whisker from min to max, box over the confidence interval."""
+    if not summary or not summary.get('n') or scale <= 0:
+        return ''
+
+    def pct(value):
+        return f"{value / scale * 100:.1f}%"
+
+    return (
+        '<div class="dist">'
+        f'<div class="dist-range" style="left: {pct(summary["min"])}; '
+        f'width: {pct(summary["max"] - summary["min"])}"></div>'
+        f'<div class="dist-ci" style="left: {pct(summary["ci_low"])}; '
+        f'width: {pct(summary["ci_high"] - summary["ci_low"])}"></div>'
+        f'<div class="dist-median" style="left: {pct(summary["median"])}"></div>'
+        '</div>'
+    )
+
+
 def generate_html_report(results: dict) -> str:
     """Generate HTML report."""
     summary = results.get('summary', {})
@@ -159,6 +198,17 @@ def generate_html_report(results: dict) -> str:
         .status.failed {{ background: #fee2e2; color: #991b1b; }}
         .status.skipped {{ background: #fef3c7; color: #92400e; }}
         .status.mock {{ background: #e0e7ff; color: #3730a3; }}
+        .status.noisy {{ background: #fef3c7; color: #92400e; }}
+        .dist {{
+            position: relative;
+            width: 160px;
+            height: 14px;
+            background: #f8f9fa;
+            border-radius: 3px;
+        }}
+        .dist-range {{ position: absolute; top: 6px; height: 2px; background: #9ca3af; }}
+        .dist-ci {{ position: absolute; top: 2px; height: 10px; background: #a5b4fc; border-radius: 2px; }}
+        .dist-median {{ position: absolute; top: 0; width: 2px; height: 14px; background: #3730a3; }}
         .footer {{
             text-align: center;
             padding: 20px;
@@ -265,7 +315,7 @@ def generate_html_report(results: dict) -> str:
                 html += f"""
                 <tr>
                     <td>{test.get('name', 'Unknown')}</td>
-                    <td>{test.get('duration_seconds', '-')}s</td>
+                    <td>{format_duration(test)}</td>
                     <td>{test.get('memory_mb', '-')} MB</td>
                     <td><span class="status {status_class}">{status}</span></td>
                 </tr>
@@ -294,7 +344,7 @@ def generate_html_report(results: dict) -> str:
                 html += f"""
                 <tr>
                     <td>{flow.get('flow', 'Unknown')}</td>
-                    <td>{flow.get('duration_seconds', '-')}s</td>
+                    <td>{format_duration(flow)}</td>
                     <td><span class="status {status_class}">{status}</span></td>
                     <td>{flow.get('notes', '-')}</td>
                 </tr>
@@ -304,6 +354,45 @@ def generate_html_report(results: dict) -> str:
         </table>
 """
 
+        if suite_data.get('measurements'):
+            measurements = suite_data['measurements']
+            scale = max(m['stats']['wall_seconds'].get('max', 0) for m in measurements)
+            html += """
+        <h3>Timing Distributions</h3>
+        <table>
+            <thead>
+                <tr>
+                    <th>Measurement</th>
+                    <th>Wall (median ± MAD, CI)</th>
+                    <th>CPU user / sys</th>
+                    <th>Range</th>
+                    <th>Distribution</th>
+                    <th>Status</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+            for m in measurements:
+                wall = m['stats']['wall_seconds']
+                user = m['stats'].get('user_seconds', {})
+                sys_ = m['stats'].get('sys_seconds', {})
+                status_class = 'noisy' if m.get('noisy') else 'success' if m.get('status') == 'success' else 'failed'
+                status_text = 'noisy' if m.get('noisy') else m.get('status', 'unknown')
+                html += f"""
+                <tr>
+                    <td>{m.get('name', 'Unknown')}</td>
+                    <td>{format_distribution(wall)}</td>
+                    <td>{user.get('median', 0):.3f}s / {sys_.get('median', 0):.3f}s</td>
+                    <td>{wall.get('min', 0):.3f}–{wall.get('max', 0):.3f}s</td>
+                    <td>{distribution_bar(wall, scale)}</td>
+                    <td><span class="status {status_class}">{status_text}</span></td>
+                </tr>
+"""
+            html += """
+            </tbody>
+        </table>
+"""
+
         html += """
     </div>
 """
@@ -356,7 +445,7 @@ def generate_markdown_report(results: dict) -> str:
             for test in suite_data['tests']:
                 status = test.get('status', 'unknown')
                 status_icon = "✓" if status in ['success', 'mock', 'available', 'expected', 'documented', 'confirmed'] else "✗" if status == 'crashed' else "○"
-                md += f"| {test.get('name', 'Unknown')} | {test.get('duration_seconds', '-')}s | {test.get('memory_mb', '-')} MB | {status_icon} |\n"
+                md += f"| {test.get('name', 'Unknown')} | {format_duration(test)} | {test.get('memory_mb', '-')} MB | {status_icon} |\n"
             md += "\n"
 
         elif 'flows' in suite_data:
@@ -368,6 +457,20 @@ def generate_markdown_report(results: dict) -> str:
                 md += f"| {flow.get('flow', 'Unknown')} | {status_icon} {status} | {flow.get('notes', '-')} |\n"
             md += "\n"
 
+        if suite_data.get('measurements'):
+            md += "**Timing distributions**\n\n"
+            md += "| Measurement | Wall (median ± MAD, CI) | CPU user / sys | Range | Status |\n"
+            md += "|-------------|-------------------------|----------------|-------|--------|\n"
+            for m in suite_data['measurements']:
+                wall = m['stats']['wall_seconds']
+                user = m['stats'].get('user_seconds', {})
+                sys_ = m['stats'].get('sys_seconds', {})
+                status = '⚠ noisy' if m.get('noisy') else m.get('status', 'unknown')
+                md += (f"| {m.get('name', 'Unknown')} | {format_distribution(wall)} | "
+                       f"{user.get('median', 0):.3f}s / {sys_.get('median', 0):.3f}s | "
+                       f"{wall.get('min', 0):.3f}–{wall.get('max', 0):.3f}s | {status} |\n")
+            md += "\n"
+
     md += """---
 
 *Generated by [RAPS Examples](https://rapscli.xyz)*
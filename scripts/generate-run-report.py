@@ -286,6 +286,10 @@ def _build_html(summary, log_dir_name, now, sections_json):
     padding: 8px 10px; border-bottom: 1px solid var(--border);
     font-size: 13px; vertical-align: middle;
   }}
+  .runs-table th[data-sort] {{ cursor: pointer; user-select: none; white-space: nowrap; }}
+  .runs-table th[data-sort]:hover {{ color: var(--text); }}
+  .runs-table th.sorted-asc::after {{ content: ' \\25B2'; }}
+  .runs-table th.sorted-desc::after {{ content: ' \\25BC'; }}
   .runs-table tr {{ cursor: pointer; transition: background 0.1s; }}
   .runs-table tr:hover {{ background: var(--surface2); }}
   .runs-table tr.selected {{ background: var(--cyan-bg); }}
@@ -303,6 +307,7 @@ def _build_html(summary, log_dir_name, now, sections_json):
   .exit-pill.lifecycle {{ background: rgba(167,139,250,0.12); color: var(--purple); }}
   .exit-pill.err {{ background: rgba(239,68,68,0.12); color: var(--red); }}
   .run-dur {{ font-family: 'JetBrains Mono', monospace; font-size: 12px; color: var(--dim); white-space: nowrap; }}
+  .run-num {{ font-family: 'JetBrains Mono', monospace; font-size: 12px; color: var(--dim); white-space: nowrap; text-align: right; }}
 
   /* Log viewer (both section-level and per-run) */
   .log-viewer {{
@@ -429,11 +434,18 @@ def _build_html(summary, log_dir_name, now, sections_json):
       <table class="runs-table">
         <thead>
           <tr>
-            <th>ID</th>
-            <th>Slug</th>
-            <th>Command</th>
-            <th>Exit</th>
-            <th>Duration</th>
+            <th data-sort="id">ID</th>
+            <th data-sort="slug">Slug</th>
+            <th data-sort="command">Command</th>
+            <th data-sort="exit">Exit</th>
+            <th data-sort="duration_seconds">Duration</th>
+            <th data-sort="user_cpu" title="User CPU time">User</th>
+            <th data-sort="sys_cpu" title="System CPU time">Sys</th>
+            <th data-sort="max_rss_kb" title="Peak resident memory of any command">RSS</th>
+            <th data-sort="voluntary_ctx_switches" title="Voluntary context switches (waiting on I/O)">Vol CS</th>
+            <th data-sort="involuntary_ctx_switches" title="Involuntary context switches (preempted)">Invol CS</th>
+            <th data-sort="stdout_bytes" title="Bytes written to stdout">Stdout</th>
+            <th data-sort="stderr_bytes" title="Bytes written to stderr">Stderr</th>
           </tr>
         </thead>
         <tbody id="runsBody"></tbody>
@@ -464,6 +476,8 @@ let activeSection = null;
 let activeFilter = 'all';
 let activeTab = 'results';
 let selectedRunId = null;
+let sortKey = null;
+let sortDir = 1;
 
 function init() {{
   renderSections();
@@ -476,6 +490,43 @@ function init() {{
       renderRuns();
     }}
   }});
+  document.querySelector('.runs-table thead').addEventListener('click', (e) => {{
+    const th = e.target.closest('th[data-sort]');
+    if (!th) return;
+    const key = th.dataset.sort;
+    /* Text columns start A-Z, numeric ones largest first */
+    sortDir = key === sortKey ? -sortDir : (['id', 'slug', 'command'].includes(key) ? 1 : -1);
+    sortKey = key;
+    document.querySelectorAll('.runs-table th[data-sort]').forEach(h => {{
+      h.classList.toggle('sorted-asc', h === th && sortDir === 1);
+      h.classList.toggle('sorted-desc', h === th && sortDir === -1);
+    }});
+    renderRuns();
+  }});
+}}
+
+function sortValue(r, key) {{
+  if (key === 'exit') return r.cli_exit_code ?? r.exit_code ?? 0;
+  return r[key];
+}}
+
+function compareRuns(a, b) {{
+  const x = sortValue(a, sortKey), y = sortValue(b, sortKey);
+  /* Runs without a value (skipped, not spawned) always sort last */
+  if (x == null || y == null) return (x == null) - (y == null);
+  if (typeof x === 'string') return sortDir * x.localeCompare(y);
+  return sortDir * (x - y);
+}}
+
+function fmtNum(v, digits) {{
+  return v == null ? '-' : v.toFixed(digits);
+}}
+
+function fmtBytes(v) {{
+  if (v == null) return '-';
+  if (v < 1024) return v + ' B';
+  if (v < 1024 * 1024) return (v / 1024).toFixed(1) + ' KB';
+  return (v / 1024 / 1024).toFixed(1) + ' MB';
 }}
 
 function switchTab(tab) {{
@@ -668,6 +719,7 @@ function renderRuns() {{
     }}
     return true;
   }});
+  if (sortKey) filtered.sort(compareRuns);
 
   const effExit = (r) => r.cli_exit_code ?? r.exit_code ?? 0;
   tbody.innerHTML = filtered.map(r => {{
@@ -689,6 +741,13 @@ function renderRuns() {{
         <td class="run-cmd" title="${{escAttr(r.command)}}">${{escHtml(r.command)}}</td>
         <td><span class="exit-pill ${{cls}}">${{label}}</span></td>
         <td class="run-dur">${{dur}}</td>
+        <td class="run-num">${{fmtNum(r.user_cpu, 2)}}</td>
+        <td class="run-num">${{fmtNum(r.sys_cpu, 2)}}</td>
+        <td class="run-num">${{r.max_rss_kb == null ? '-' : fmtBytes(r.max_rss_kb * 1024)}}</td>
+        <td class="run-num">${{fmtNum(r.voluntary_ctx_switches, 0)}}</td>
+        <td class="run-num">${{fmtNum(r.involuntary_ctx_switches, 0)}}</td>
+        <td class="run-num">${{fmtBytes(r.stdout_bytes)}}</td>
+        <td class="run-num">${{fmtBytes(r.stderr_bytes)}}</td>
       </tr>`;
   }}).join('');
 }}
@@ -9,15 +9,49 @@ Usage:
     python generate-test-data.py --output ./data/generated --size 500mb
     python generate-test-data.py --output ./data/generated --size 3.4gb
     python generate-test-data.py --output ./data/generated --size 100mb --name batch-file-1
+    python generate-test-data.py --output ./data/generated --size 3.4gb --workers 8 --seed 1
+    python generate-test-data.py --output ./data/generated --size 1gb --format ndjson --compress zstd
+    python generate-test-data.py --benchmark --size 200mb
 """
 
 import argparse
+import bisect
+import io
+import itertools
 import json
 import os
 import random
+import shutil
 import string
 import sys
-from typing import Generator, TextIO
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Generator, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # Optional: falls back to the pure-Python generator
+    np = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: --compress zstd falls back to gzip
+    zstandard = None
+
+# Elements per shard in --workers mode (~15 MB of JSON per shard)
+SHARD_ELEMENTS = 500
+# Initial per-element size guess used to avoid generating shards past the target
+EST_ELEMENT_BYTES = 28_000
+# Elements drawn and serialized together by the batched generators
+BATCH_ELEMENTS = 64
+# Every serialized element is prefixed with a separator; the first element
+# of a document drops its leading part (the comma / newline)
+ELEMENT_SEP = ',\n    '
+NDJSON_SEP = '\n'
+# Default spacing of the element offset index in .meta.json
+INDEX_EVERY = 1000
 
 # Element categories typical in AEC models
 CATEGORIES = [
@@ -120,6 +154,331 @@ def generate_element(element_id: int) -> dict:
     }
 
 
+# ── Batched generation ────────────────────────────────────────────────
+#
+# The numpy path draws every random value for a batch of elements at once
+# and serializes geometry arrays with a vectorized fixed-point formatter,
+# which is where nearly all bytes (and time) go. Output has the same
+# schema, key order and separators as json.dumps(generate_element(...)).
+
+ALPHANUMERIC = string.ascii_letters + string.digits
+# Fixed decimals for geometry coordinates: ~16 significant digits, like repr()
+VERTEX_DECIMALS = 13
+NORMAL_DECIMALS = 16
+PARAM_TYPES = ["string", "double", "integer", "boolean"]
+PARAM_UNITS = ["mm", "m", "ft", "in", None]
+# ASCII digits of 0000..9999, for base-10000 formatting
+_DIGIT_GROUPS = (
+    np.frombuffer(''.join(f'{i:04d}' for i in range(10000)).encode(), dtype=np.uint8).reshape(10000, 4)
+    if np is not None else None
+)
+
+
+def _format_fixed(values: "np.ndarray", decimals: int) -> "np.ndarray":
+    """
+    Format a 1-D float array as fixed-point ASCII, one number per row of a
+    (N, width) uint8 matrix. Unused leading columns are 0 bytes, which the
+    caller strips after laying rows out.
+    """
+    scale = 10 ** decimals
+    q = np.rint(np.abs(values) * scale).astype(np.int64)
+    int_part = q // scale
+    n_int = len(str(int(int_part.max()))) if len(q) else 1
+
+    # Split into base-10000 groups and look up 4 ASCII digits per group
+    n_digits = n_int + decimals
+    n_groups = -(-n_digits // 4)
+    groups = np.empty((len(q), n_groups), dtype=np.int64)
+    rest = q.copy()
+    for g in range(n_groups - 1, -1, -1):
+        np.remainder(rest, 10000, out=groups[:, g])
+        rest //= 10000
+    digits = _DIGIT_GROUPS[groups].reshape(len(q), -1)[:, -n_digits:]
+
+    width = 1 + n_int + (1 + decimals if decimals else 0)
+    out = np.zeros((len(q), width), dtype=np.uint8)
+    out[:, 1:1 + n_int] = digits[:, :n_int]
+    if decimals:
+        out[:, 1 + n_int] = ord('.')
+        out[:, 2 + n_int:] = digits[:, n_int:]
+
+    # Blank leading zeros of the integer part, then place the sign just
+    # before the first digit shown
+    shown = 1 + (int_part[:, None] >= 10 ** np.arange(1, n_int, dtype=np.int64)).sum(axis=1)
+    out[:, 1:1 + n_int][np.arange(n_int) < (n_int - shown)[:, None]] = 0
+    neg = np.flatnonzero((values < 0) & (q > 0))
+    out[neg, n_int - shown[neg]] = ord('-')
+    return out
+
+
+def _format_rows(values: "np.ndarray", decimals: int) -> tuple[str, "np.ndarray"]:
+    """
+    Serialize an (R, 3) array as R JSON triples, each followed by ', '.
+    Returns the text and the end offset of every row.
+    """
+    fields = _format_fixed(values.ravel(), decimals).reshape(len(values), -1)
+    width = fields.shape[1] // 3
+
+    def const(text: str) -> "np.ndarray":
+        return np.broadcast_to(np.frombuffer(text.encode(), dtype=np.uint8), (len(values), len(text)))
+
+    rows = np.concatenate([
+        const('['), fields[:, :width], const(', '), fields[:, width:2 * width],
+        const(', '), fields[:, 2 * width:], const('], '),
+    ], axis=1)
+    keep = rows != 0
+    text = rows[keep].tobytes().decode('ascii')
+    return text, np.cumsum(keep.sum(axis=1))
+
+
+class BatchElementGenerator:
+    """
+    numpy-backed equivalent of generate_element for runs of consecutive IDs.
+
+    Elements are written into one reusable StringIO per batch, each
+    prefixed with `sep`, so batches can be streamed or spliced as-is.
+    """
+
+    def __init__(self, rng: "np.random.Generator", sep: str = ELEMENT_SEP):
+        self.rng = rng
+        self.sep = sep
+        self.buf = io.StringIO()
+        self._chars = np.frombuffer(ALPHANUMERIC.encode(), dtype=np.uint8)
+        self._pool = ''
+        self._pool_pos = 0
+
+    def _strings(self, lengths) -> list[str]:
+        """Random alphanumeric strings of the given lengths, cut from a shared pool."""
+        lengths = [int(n) for n in lengths]
+        total = sum(lengths)
+        if self._pool_pos + total > len(self._pool):
+            size = max(total, 1 << 20)
+            self._pool = self._chars[self.rng.integers(0, len(self._chars), size)].tobytes().decode('ascii')
+            self._pool_pos = 0
+        out = []
+        pos = self._pool_pos
+        for n in lengths:
+            out.append(self._pool[pos:pos + n])
+            pos += n
+        self._pool_pos = pos
+        return out
+
+    def _geometry(self, count: int) -> list[str | None]:
+        """Serialized geometry objects (or None) for `count` elements."""
+        rng = self.rng
+        has_geo = rng.random(count) > 0.3
+        n_geo = int(has_geo.sum())
+        result: list[str | None] = [None] * count
+        if not n_geo:
+            return result
+
+        vertex_counts = rng.integers(10, 501, n_geo)
+        face_counts = vertex_counts // 3
+        total_v = int(vertex_counts.sum())
+
+        v_text, v_ends = _format_rows(rng.uniform(-100, 100, (total_v, 3)), VERTEX_DECIMALS)
+        n_text, n_ends = _format_rows(rng.uniform(-1, 1, (total_v, 3)), NORMAL_DECIMALS)
+        face_limit = np.repeat(vertex_counts, face_counts)[:, None]
+        faces = np.floor(rng.random((len(face_limit), 3)) * face_limit)
+        f_text, f_ends = _format_rows(faces, 0)
+        lo_text, lo_ends = _format_rows(rng.uniform(-100, 0, (n_geo, 3)), VERTEX_DECIMALS)
+        hi_text, hi_ends = _format_rows(rng.uniform(0, 100, (n_geo, 3)), VERTEX_DECIMALS)
+
+        v_rows = np.concatenate([[0], np.cumsum(vertex_counts)])
+        f_rows = np.concatenate([[0], np.cumsum(face_counts)])
+        v_ends = np.concatenate([[0], v_ends]).tolist()
+        n_ends = np.concatenate([[0], n_ends]).tolist()
+        f_ends = np.concatenate([[0], f_ends]).tolist()
+        lo_ends = np.concatenate([[0], lo_ends]).tolist()
+        hi_ends = np.concatenate([[0], hi_ends]).tolist()
+
+        for g, idx in enumerate(np.flatnonzero(has_geo).tolist()):
+            v0, v1 = v_rows[g], v_rows[g + 1]
+            f0, f1 = f_rows[g], f_rows[g + 1]
+            result[idx] = ''.join([
+                '{"vertices": [', v_text[v_ends[v0]:v_ends[v1] - 2],
+                '], "normals": [', n_text[n_ends[v0]:n_ends[v1] - 2],
+                '], "faces": [', f_text[f_ends[f0]:f_ends[f1] - 2],
+                '], "bounds": {"min": ', lo_text[lo_ends[g]:lo_ends[g + 1] - 2],
+                ', "max": ', hi_text[hi_ends[g]:hi_ends[g + 1] - 2], '}}',
+            ])
+        return result
+
+    def batch(self, first_id: int, count: int) -> tuple[str, list[int]]:
+        """
+        Serialize elements [first_id, first_id + count).
+        Returns the text and the end offset of each element in it.
+        """
+        rng = self.rng
+        buf = self.buf
+        buf.seek(0)
+        buf.truncate()
+        geometry = self._geometry(count)
+        ids = np.arange(first_id, first_id + count)
+
+        # Per-element scalars
+        categories = rng.integers(len(CATEGORIES), size=count).tolist()
+        families = rng.integers(1, 101, count).tolist()
+        types = rng.integers(1, 51, count).tolist()
+        levels = rng.integers(1, 21, count).tolist()
+        n_mat = rng.integers(1, 6, count)
+        n_props = rng.integers(5, len(PROPERTY_NAMES) + 1, count)
+        n_params = rng.integers(10, 31, count)
+        n_children = rng.integers(0, 6, count)
+        n_hosted = np.where(ids > 10, rng.integers(0, 4, count), 0)
+        parents = np.where(
+            (ids > 1) & (rng.random(count) > 0.5),
+            np.floor(rng.random(count) * ids).astype(np.int64) + 1, 0,
+        ).tolist()
+        prop_order = np.argsort(rng.random((count, len(PROPERTY_NAMES))), axis=1).tolist()
+
+        # Per-material, per-parameter and per-relationship values
+        n_mat_total = int(n_mat.sum())
+        mat_ids = rng.integers(100000, 1000000, n_mat_total).tolist()
+        mat_names = rng.integers(len(MATERIALS), size=n_mat_total).tolist()
+        mat_colors = rng.integers(0, 256, (n_mat_total, 3)).tolist()
+        mat_transparency = rng.random(n_mat_total).tolist()
+        mat_shininess = rng.integers(0, 101, n_mat_total).tolist()
+        mat_props = rng.integers(3, 11, n_mat_total)
+
+        n_params_total = int(n_params.sum())
+        param_is_str = (rng.random(n_params_total) > 0.5).tolist()
+        param_values = rng.uniform(-1000, 1000, n_params_total).tolist()
+        param_types = rng.integers(0, len(PARAM_TYPES), n_params_total).tolist()
+        param_units = rng.integers(0, len(PARAM_UNITS), n_params_total).tolist()
+
+        children = (np.repeat(ids, n_children)
+                    + rng.integers(0, 101, int(n_children.sum()))).tolist()
+        hosted = (np.floor(rng.random(int(n_hosted.sum())) * np.repeat(ids, n_hosted))
+                  .astype(np.int64) + 1).tolist()
+
+        # Random strings: GUID parts, material props, element props, string params
+        n_mat_strings = int(mat_props.sum())
+        prop_lengths = rng.integers(10, 101, int(n_props.sum())).tolist()
+        strings = self._strings(
+            [8, 4, 4, 4, 12] * count
+            + [20] * n_mat_strings
+            + prop_lengths
+            + [30] * sum(param_is_str)
+        )
+        guids = ['-'.join(strings[5 * k:5 * k + 5]) for k in range(count)]
+        pos = 5 * count
+        mat_strings = strings[pos:pos + n_mat_strings]
+        pos += n_mat_strings
+        prop_strings = strings[pos:pos + len(prop_lengths)]
+        param_strings = iter(strings[pos + len(prop_lengths):])
+
+        n_mat = n_mat.tolist()
+        n_props = n_props.tolist()
+        n_params = n_params.tolist()
+        n_children = n_children.tolist()
+        n_hosted = n_hosted.tolist()
+        mat_props = mat_props.tolist()
+
+        ends = []
+        m = mp = pp = pa = ch = ho = 0
+        for k in range(count):
+            element_id = first_id + k
+            category = CATEGORIES[categories[k]]
+
+            materials = []
+            for _ in range(n_mat[k]):
+                materials.append({
+                    "id": mat_ids[m],
+                    "name": MATERIALS[mat_names[m]],
+                    "color": mat_colors[m],
+                    "transparency": mat_transparency[m],
+                    "shininess": mat_shininess[m],
+                    "properties": {f"prop_{i}": mat_strings[mp + i] for i in range(mat_props[m])},
+                })
+                mp += mat_props[m]
+                m += 1
+
+            head = {
+                "id": element_id,
+                "externalId": guids[k],
+                "category": category,
+                "family": f"{category} Family {families[k]}",
+                "type": f"Type {types[k]}",
+                "name": f"{category}-{element_id}",
+                "level": f"Level {levels[k]}",
+                "materials": materials,
+                "properties": {
+                    PROPERTY_NAMES[i]: prop_strings[pp + j]
+                    for j, i in enumerate(prop_order[k][:n_props[k]])
+                },
+            }
+            pp += n_props[k]
+
+            tail = {
+                "relationships": {
+                    "parent": parents[k] or None,
+                    "children": children[ch:ch + n_children[k]],
+                    "hosted": hosted[ho:ho + n_hosted[k]],
+                },
+                "parameters": {
+                    f"param_{i}": {
+                        "value": next(param_strings) if param_is_str[pa + i] else param_values[pa + i],
+                        "type": PARAM_TYPES[param_types[pa + i]],
+                        "unit": PARAM_UNITS[param_units[pa + i]],
+                    }
+                    for i in range(n_params[k])
+                },
+            }
+            ch += n_children[k]
+            ho += n_hosted[k]
+            pa += n_params[k]
+
+            buf.write(self.sep)
+            buf.write(json.dumps(head)[:-1])
+            buf.write(', "geometry": ')
+            buf.write(geometry[k] or 'null')
+            buf.write(', ')
+            buf.write(json.dumps(tail)[1:])
+            ends.append(buf.tell())
+
+        return buf.getvalue(), ends
+
+
+def iter_element_batches(
+    first_id: int = 1, count: int | None = None, seed: int | None = None,
+    stream: int | None = None, use_numpy: bool | None = None,
+    sep: str = ELEMENT_SEP,
+) -> Iterator[tuple[str, list[int]]]:
+    """
+    Yield (text, ends) batches of consecutive elements starting at first_id.
+
+    Each element in `text` is prefixed with `sep`; `ends` holds the
+    end offset of every element. `count` limits the total (None = endless).
+    `stream` derives an independent deterministic sequence from `seed`
+    (used for shards). `use_numpy` defaults to whether numpy is installed.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        rng = np.random.default_rng(None if seed is None else
+                                    seed if stream is None else [seed, stream])
+        gen = BatchElementGenerator(rng, sep)
+    elif seed is not None:
+        random.seed(seed if stream is None else f'{seed}:{stream}')
+
+    next_id = first_id
+    end_id = None if count is None else first_id + count
+    while end_id is None or next_id < end_id:
+        n = BATCH_ELEMENTS if end_id is None else min(BATCH_ELEMENTS, end_id - next_id)
+        if use_numpy:
+            yield gen.batch(next_id, n)
+        else:
+            parts, ends, pos = [], [], 0
+            for element_id in range(next_id, next_id + n):
+                chunk = sep + json.dumps(generate_element(element_id), indent=None)
+                parts.append(chunk)
+                pos += len(chunk)
+                ends.append(pos)
+            yield ''.join(parts), ends
+        next_id += n
+
+
 def parse_size(size_str: str) -> int:
     """Parse size string (e.g., '500mb', '3.4gb') to bytes."""
     size_str = size_str.lower().strip()
@@ -141,89 +500,448 @@ def parse_size(size_str: str) -> int:
     return int(float(size_str))
 
 
-def generate_streaming(output_file: TextIO, target_size: int) -> int:
+def _header_text(target_size: int) -> str:
+    """Document preamble up to the opening of the elements array."""
+    return (
+        '{\n'
+        '  "metadata": {\n'
+        '    "generator": "raps-examples",\n'
+        '    "version": "1.0",\n'
+        f'    "target_size_bytes": {target_size}\n'
+        '  },\n'
+        '  "elements": [\n'
+    )
+
+
+def _footer_text(element_count: int) -> str:
+    """Close the elements array and write the summary."""
+    return (
+        '\n  ],\n'
+        '  "summary": {\n'
+        f'    "element_count": {element_count},\n'
+        f'    "categories": {json.dumps(CATEGORIES)}\n'
+        '  }\n'
+        '}\n'
+    )
+
+
+def resolve_compression(compress: str) -> str:
+    """Map 'zstd' to 'gzip' when the zstandard package is not installed."""
+    if compress == 'zstd' and zstandard is None:
+        print("  zstandard not installed, using gzip instead")
+        return 'gzip'
+    return compress
+
+
+class ElementWriter:
     """
-    Generate JSON data in a streaming fashion to avoid memory issues.
-    Returns the number of elements generated.
+    Output sink for generated elements.
+
+    Writes either one JSON document (`json`) or one element per line
+    (`ndjson`), optionally gzip- or zstd-compressed. Uncompressed bytes are
+    counted as they are written, so the target size check never has to ask
+    the file (or compressor) where it is. Every `index_every` elements the
+    byte offset of the element is recorded; compressed output starts a new
+    gzip member / zstd frame at each indexed element, so a reader can seek
+    to `block_offset` in the file and decompress from there.
     """
-    current_size = 0
-    element_count = 0
 
-    # Write opening
-    output_file.write('{\n')
-    output_file.write('  "metadata": {\n')
-    output_file.write(f'    "generator": "raps-examples",\n')
-    output_file.write(f'    "version": "1.0",\n')
-    output_file.write(f'    "target_size_bytes": {target_size}\n')
-    output_file.write('  },\n')
-    output_file.write('  "elements": [\n')
+    def __init__(self, path: str, fmt: str = 'json', compress: str = 'none',
+                 index_every: int = INDEX_EVERY):
+        self.path = path
+        self.fmt = fmt
+        self.compress = compress
+        self.index_every = index_every
+        self.sep = ELEMENT_SEP if fmt == 'json' else NDJSON_SEP
+        # Leading part of the separator dropped before the first element
+        self.skip = len(',\n') if fmt == 'json' else len(NDJSON_SEP)
+        # Bytes kept free for the closing text (sized for any element count)
+        self.footer_reserve = len(_footer_text(10 ** 12)) if fmt == 'json' else len('\n')
+
+        self.raw = open(path, 'wb')
+        self.bytes_written = 0
+        self.element_count = 0
+        self.index: list[dict] = []
+        self._compressor = self._new_compressor()
+        self._block_start = 0
+        self._block_offset = 0
+
+    def _new_compressor(self):
+        if self.compress == 'gzip':
+            return zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        if self.compress == 'zstd':
+            return zstandard.ZstdCompressor(level=3).compressobj()
+        return None
+
+    def _emit(self, data: str) -> None:
+        raw = data.encode('ascii')
+        self.bytes_written += len(raw)
+        if self._compressor is not None:
+            raw = self._compressor.compress(raw)
+        if raw:
+            self.raw.write(raw)
+
+    def _start_block(self) -> None:
+        """Finish the current gzip member / zstd frame and open a new one."""
+        if self._compressor is None or self.bytes_written == self._block_start:
+            return
+        self.raw.write(self._compressor.flush())
+        self._compressor = self._new_compressor()
+        self._block_offset = self.raw.tell()
+        self._block_start = self.bytes_written
+
+    def _index_entry(self, element: int, offset: int) -> dict:
+        entry = {'element': element, 'id': element + 1, 'offset': offset}
+        if self._compressor is not None:
+            entry['block_offset'] = self._block_offset
+            entry['block_start'] = self._block_start
+        return entry
+
+    def _index_points(self, take: int) -> range:
+        """Indexed element numbers among the next `take` elements."""
+        if self.index_every <= 0:
+            return range(0)
+        first = self.element_count
+        return range(-(-first // self.index_every) * self.index_every,
+                     first + take, self.index_every)
+
+    def write_header(self, target_size: int) -> None:
+        if self.fmt == 'json':
+            self._emit(_header_text(target_size))
+
+    def write_elements(self, text: str, ends: list[int], take: int) -> None:
+        """Write the first `take` elements of a batch produced with `self.sep`."""
+        first = self.element_count
+        pos = self.skip if first == 0 else 0
+        for k in self._index_points(take):
+            i = k - first
+            sep_start = ends[i - 1] if i else pos
+            self._emit(text[pos:sep_start])
+            pos = sep_start
+            self._start_block()
+            lead = len(self.sep) - (self.skip if k == 0 else 0)
+            self.index.append(self._index_entry(k, self.bytes_written + lead))
+        self._emit(text[pos:ends[take - 1]])
+        self.element_count += take
+
+    def splice(self, shard_path: str, ends: list[int], take: int) -> None:
+        """Append the first `take` elements of an uncompressed shard file in-kernel."""
+        first = self.element_count
+        skip = self.skip if first == 0 else 0
+        for k in self._index_points(take):
+            i = k - first
+            sep_start = ends[i - 1] if i else skip
+            lead = len(self.sep) - (self.skip if k == 0 else 0)
+            self.index.append(self._index_entry(k, self.bytes_written + sep_start - skip + lead))
+        with open(shard_path, 'rb') as src:
+            _copy_range(src, self.raw, skip, ends[take - 1] - skip)
+        self.bytes_written += ends[take - 1] - skip
+        self.element_count += take
+
+    def close(self) -> None:
+        """Write the closing text and flush the compressor."""
+        if self.fmt == 'json':
+            self._emit(_footer_text(self.element_count))
+        elif self.element_count:
+            self._emit('\n')
+        if self._compressor is not None:
+            self.raw.write(self._compressor.flush())
+        self.raw.close()
+
+
+def _take_count(writer: ElementWriter, ends: list[int], limit: int) -> int:
+    """How many of a batch's elements fit before `limit` uncompressed bytes."""
+    skip = writer.skip if writer.element_count == 0 else 0
+    return bisect.bisect_right(ends, limit - writer.bytes_written + skip)
+
+
+def iter_sharded_batches(
+    seed: int | None = None, use_numpy: bool | None = None, sep: str = ELEMENT_SEP,
+) -> Iterator[tuple[str, list[int]]]:
+    """
+    Endless element batches, seeded shard by shard exactly as generate_parallel
+    seeds its SHARD_ELEMENTS-sized shards, so both produce the same elements.
+    """
+    for shard in itertools.count():
+        yield from iter_element_batches(shard * SHARD_ELEMENTS + 1, SHARD_ELEMENTS, seed, shard,
+                                        use_numpy, sep)
 
-    current_size = output_file.tell()
 
-    # Generate elements until we reach target size
-    while current_size < target_size * 0.95:  # Leave room for closing
-        element = generate_element(element_count + 1)
-        element_json = json.dumps(element, indent=None)
+def _print_progress(writer: ElementWriter, target_size: int) -> None:
+    progress = min(100, (writer.bytes_written / target_size) * 100)
+    print(f"  Generated {writer.element_count} elements ({progress:.1f}%)", end='\r')
+
+
+def generate_streaming(
+    writer: ElementWriter, target_size: int,
+    seed: int | None = None, use_numpy: bool | None = None,
+) -> int:
+    """
+    Generate JSON data in a streaming fashion to avoid memory issues.
 
-        # Add comma separator for all but first element
-        if element_count > 0:
-            output_file.write(',\n')
+    Elements are added while the output, including its closing text, stays
+    within target_size uncompressed bytes. Elements are seeded per shard
+    (iter_sharded_batches), so a given seed yields the same document with
+    any --workers count. Returns the number of elements generated.
+    """
+    limit = target_size - writer.footer_reserve
 
-        output_file.write('    ')
-        output_file.write(element_json)
+    # Write opening
+    writer.write_header(target_size)
 
-        element_count += 1
-        current_size = output_file.tell()
+    # Generate elements until we reach target size
+    for text, ends in iter_sharded_batches(seed, use_numpy, writer.sep):
+        previous = writer.element_count
+        take = _take_count(writer, ends, limit)
+        if take:
+            writer.write_elements(text, ends, take)
 
         # Progress indicator every 10000 elements
-        if element_count % 10000 == 0:
-            progress = min(100, (current_size / target_size) * 100)
-            print(f"  Generated {element_count} elements ({progress:.1f}%)", end='\r')
+        if writer.element_count // 10000 != previous // 10000:
+            _print_progress(writer, target_size)
+        if take < len(ends):
+            break
 
     # Write closing
-    output_file.write('\n  ],\n')
-    output_file.write(f'  "summary": {{\n')
-    output_file.write(f'    "element_count": {element_count},\n')
-    output_file.write(f'    "categories": {json.dumps(CATEGORIES)}\n')
-    output_file.write('  }\n')
-    output_file.write('}\n')
+    writer.close()
 
-    print(f"  Generated {element_count} elements (100%)     ")
-    return element_count
+    print(f"  Generated {writer.element_count} elements (100%)     ")
+    return writer.element_count
+
+
+def _generate_shard(
+    shard_path: str, first_id: int, count: int, seed: int, shard_index: int,
+    use_numpy: bool | None, sep: str,
+) -> list[int]:
+    """
+    Generate elements [first_id, first_id + count) into shard_path.
+
+    Every element is written with a leading `sep` separator so shards can
+    be spliced back to back; the writer drops the leading part of the very
+    first element's separator. Returns the cumulative byte offset at the
+    end of each element.
+    """
+    ends = []
+    written = 0
+    with open(shard_path, 'w', newline='') as f:
+        for text, batch_ends in iter_element_batches(first_id, count, seed, shard_index,
+                                                     use_numpy, sep):
+            f.write(text)
+            ends.extend(written + e for e in batch_ends)
+            written += len(text)
+    return ends
+
+
+def _copy_range(src: BinaryIO, dst: BinaryIO, offset: int, count: int) -> None:
+    """Copy count bytes from src at offset to dst's current position, in-kernel when possible."""
+    dst.flush()
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    try:
+        while count > 0:
+            if hasattr(os, 'copy_file_range'):
+                n = os.copy_file_range(src_fd, dst_fd, count, offset)
+            else:
+                n = os.sendfile(dst_fd, src_fd, offset, count)
+            if n == 0:
+                break
+            offset += n
+            count -= n
+    except (AttributeError, OSError):
+        # No in-kernel copy (other platform, cross-device, ...): plain copy
+        src.seek(offset)
+        shutil.copyfileobj(_LimitedReader(src, count), dst)
+    # copy_file_range/sendfile advance the fd offset but not Python's view of it
+    dst.seek(0, os.SEEK_END)
+
+
+class _LimitedReader:
+    """File-like wrapper that reads at most `remaining` bytes."""
+
+    def __init__(self, f: BinaryIO, remaining: int):
+        self.f = f
+        self.remaining = remaining
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b''
+        size = self.remaining if size < 0 else min(size, self.remaining)
+        data = self.f.read(size)
+        self.remaining -= len(data)
+        return data
+
+
+def generate_parallel(
+    writer: ElementWriter, target_size: int, workers: int, seed: int,
+    use_numpy: bool | None = None,
+) -> int:
+    """
+    Generate the same document as generate_streaming using a process pool.
+
+    Shards of SHARD_ELEMENTS consecutive element IDs are generated
+    concurrently with per-shard seeds derived from `seed`, then spliced into
+    the output in ID order (in-kernel for uncompressed output). The last
+    shard is cut at the element where the sequential generator would have
+    stopped. Returns the element count.
+    """
+    shard_dir = os.path.dirname(os.path.abspath(writer.path))
+    shard_prefix = os.path.join(shard_dir, f'.{os.path.basename(writer.path)}.shard')
+    limit = target_size - writer.footer_reserve
+
+    writer.write_header(target_size)
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    next_shard = 0
+    est_element = EST_ELEMENT_BYTES
+    try:
+        while True:
+            # Keep a bounded number of shards in flight, in ID order, but stop
+            # submitting once the shards already queued should reach the target
+            while len(pending) < workers * 2 and (
+                not pending
+                or writer.bytes_written + len(pending) * SHARD_ELEMENTS * est_element < limit
+            ):
+                path = f'{shard_prefix}-{next_shard:06d}.tmp'
+                first_id = next_shard * SHARD_ELEMENTS + 1
+                pending.append((path, pool.submit(
+                    _generate_shard, path, first_id, SHARD_ELEMENTS, seed, next_shard,
+                    use_numpy, writer.sep,
+                )))
+                next_shard += 1
+
+            path, future = pending.popleft()
+            ends = future.result()
+            est_element = ends[-1] / len(ends)
+            take = _take_count(writer, ends, limit)
+            if take and writer.compress == 'none':
+                writer.splice(path, ends, take)
+            elif take:
+                with open(path, newline='') as f:
+                    writer.write_elements(f.read(), ends, take)
+            os.remove(path)
+
+            _print_progress(writer, target_size)
+            if take < len(ends):
+                break
+    finally:
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+        for path, _ in pending:
+            if os.path.exists(path):
+                os.remove(path)
+
+    writer.close()
+
+    print(f"  Generated {writer.element_count} elements (100%)     ")
+    return writer.element_count
+
+
+def run_throughput_benchmark(target_size: int, seed: int | None) -> list[dict]:
+    """
+    Measure generation throughput (serialized MB/s) of each available
+    backend without touching the disk. Returns one result dict per backend.
+    """
+    backends = [('python', False)] + ([('numpy', True)] if np is not None else [])
+    results = []
+    for name, use_numpy in backends:
+        produced = 0
+        elements = 0
+        t0 = time.perf_counter()
+        for text, ends in iter_element_batches(seed=seed, use_numpy=use_numpy):
+            produced += len(text)
+            elements += len(ends)
+            if produced >= target_size:
+                break
+        elapsed = time.perf_counter() - t0
+        results.append({
+            'backend': name,
+            'bytes': produced,
+            'elements': elements,
+            'seconds': round(elapsed, 3),
+            'mb_per_sec': round(produced / (1024 ** 2) / elapsed, 2),
+        })
+        print(f"  {name:<8} {produced / (1024 ** 2):8.1f} MB  {elements:8,} elements  "
+              f"{elapsed:7.2f}s  {results[-1]['mb_per_sec']:8.2f} MB/s")
+    return results
 
 
 def main():
     parser = argparse.ArgumentParser(description='Generate synthetic AEC metadata for benchmarking')
-    parser.add_argument('--output', '-o', required=True, help='Output directory')
+    parser.add_argument('--output', '-o', help='Output directory (required unless --benchmark)')
     parser.add_argument('--size', '-s', default='500mb', help='Target file size (e.g., 500mb, 3.4gb)')
     parser.add_argument('--name', '-n', default='large-metadata', help='Output file name (without extension)')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='Generate shards in N processes (default: 1, sequential)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Random seed for reproducible output (default: random)')
+    parser.add_argument('--backend', choices=['auto', 'numpy', 'python'], default='auto',
+                        help='Element generator: batched numpy or pure Python (default: numpy if installed)')
+    parser.add_argument('--format', '-f', choices=['json', 'ndjson'], default='json',
+                        help='Single JSON document or one element per line (default: json)')
+    parser.add_argument('--compress', '-c', choices=['none', 'gzip', 'zstd'], default='none',
+                        help='Compress output; zstd falls back to gzip if zstandard is missing (default: none)')
+    parser.add_argument('--index-every', type=int, default=INDEX_EVERY,
+                        help=f'Record an element byte offset every N elements in .meta.json, 0 to disable '
+                             f'(default: {INDEX_EVERY})')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Report generator throughput in MB/s for --size bytes per backend, write nothing')
 
     args = parser.parse_args()
 
+    if args.backend == 'numpy' and np is None:
+        parser.error('--backend numpy requires numpy (pip install numpy)')
+    use_numpy = {'auto': None, 'numpy': True, 'python': False}[args.backend]
+
+    if args.benchmark:
+        target_size = parse_size(args.size)
+        print(f"Generator throughput ({target_size / (1024**2):.1f} MB per backend):")
+        run_throughput_benchmark(target_size, args.seed)
+        return
+    if not args.output:
+        parser.error('--output is required')
+
     # Create output directory
     os.makedirs(args.output, exist_ok=True)
 
     # Parse target size
     target_size = parse_size(args.size)
 
-    output_path = os.path.join(args.output, f'{args.name}.json')
+    compress = resolve_compression(args.compress)
+    extension = {'none': '', 'gzip': '.gz', 'zstd': '.zst'}[compress]
+    output_path = os.path.join(args.output, f'{args.name}.{args.format}{extension}')
 
     print(f"Generating test data:")
     print(f"  Output: {output_path}")
-    print(f"  Target size: {target_size / (1024**2):.1f} MB")
+    print(f"  Target size: {target_size / (1024**2):.1f} MB (uncompressed)")
+    print(f"  Format: {args.format}, compression: {compress}")
+    print(f"  Backend: {'numpy' if use_numpy or (use_numpy is None and np is not None) else 'python'}")
+    if args.workers > 1:
+        print(f"  Workers: {args.workers}")
     print()
 
     # Generate data
-    with open(output_path, 'w') as f:
-        element_count = generate_streaming(f, target_size)
+    writer = ElementWriter(output_path, args.format, compress, args.index_every)
+    t0 = time.perf_counter()
+    if args.workers > 1:
+        seed = args.seed if args.seed is not None else random.SystemRandom().randrange(2 ** 32)
+        element_count = generate_parallel(writer, target_size, args.workers, seed, use_numpy)
+    else:
+        element_count = generate_streaming(writer, target_size, args.seed, use_numpy)
+    elapsed = time.perf_counter() - t0
 
     # Get actual file size
     actual_size = os.path.getsize(output_path)
+    uncompressed_size = writer.bytes_written
 
     print()
     print(f"Generation complete:")
     print(f"  Elements: {element_count:,}")
     print(f"  File size: {actual_size / (1024**2):.1f} MB")
+    if compress != 'none':
+        print(f"  Uncompressed: {uncompressed_size / (1024**2):.1f} MB "
+              f"(ratio {uncompressed_size / max(actual_size, 1):.2f}x)")
+    print(f"  Throughput: {uncompressed_size / (1024**2) / elapsed:.1f} MB/s ({elapsed:.1f}s)")
     print(f"  Output: {output_path}")
 
     # Write metadata file
@@ -233,9 +951,14 @@ def main():
             'file': output_path,
             'size_bytes': actual_size,
             'size_mb': round(actual_size / (1024**2), 2),
+            'uncompressed_size_bytes': uncompressed_size,
             'element_count': element_count,
             'generator': 'raps-examples',
-            'target_size': args.size
+            'target_size': args.size,
+            'format': args.format,
+            'compression': compress,
+            'index_every': args.index_every,
+            'index': writer.index,
         }, f, indent=2)
 
     print(f"  Metadata: {metadata_path}")
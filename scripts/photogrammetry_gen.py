@@ -10,53 +10,87 @@ Usage:
     python photogrammetry_gen.py --output ./photos --views 36
     python photogrammetry_gen.py --output ./photos --views 72 --scene multi --texture noise
     python photogrammetry_gen.py --output ./photos --views 36 --validate
+    python photogrammetry_gen.py --output ./photos --views 72 --resolution 3840x2160 --workers 8
+    python photogrammetry_gen.py --output ./photos --views 36 --emit depth,normal,mask --emit-format npy
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import itertools
 import json
 import math
+import os
 import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import numpy as np
 
 # ── Texture Generation ─────────────────────────────────────────────
 
 
-def _value_noise_2d(
-    width: int, height: int, scale: float, seed: int = 0
-) -> np.ndarray:
-    """Generate 2D value noise using lattice-based interpolation."""
+def _accumulate_value_noise(
+    out: np.ndarray, scale: float, seed: int = 0, amplitude: float = 1.0,
+    scratch: tuple[np.ndarray, np.ndarray] | None = None,
+) -> None:
+    """Add ``amplitude`` x 2D value noise into ``out`` (float32, H x W) in place.
+
+    Bilinear interpolation is separable, so each lattice row is lerped across
+    x once, then rows are gathered and lerped down y into two reusable
+    scratch buffers. No full-size temporaries are allocated when
+    ``scratch`` is supplied.
+    """
+    height, width = out.shape
     rng = np.random.default_rng(seed)
     grid_w = int(width / scale) + 2
     grid_h = int(height / scale) + 2
     lattice = rng.random((grid_h, grid_w)).astype(np.float32)
 
-    y_coords = np.arange(height, dtype=np.float32) / scale
-    x_coords = np.arange(width, dtype=np.float32) / scale
+    y_coords = np.arange(height, dtype=np.float32) / np.float32(scale)
+    x_coords = np.arange(width, dtype=np.float32) / np.float32(scale)
 
-    y0 = np.floor(y_coords).astype(int)
-    x0 = np.floor(x_coords).astype(int)
-    fy = (y_coords - y0).reshape(-1, 1)
-    fx = (x_coords - x0).reshape(1, -1)
+    # Fractions come from the float32 floors (not the intp indices) so rows
+    # stays float32 and the gathers below need no casting buffer.
+    y_floor = np.floor(y_coords)
+    x_floor = np.floor(x_coords)
+    y0 = y_floor.astype(np.intp)
+    x0 = x_floor.astype(np.intp)
+    fy = (y_coords - y_floor).reshape(-1, 1)
+    fx = (x_coords - x_floor).reshape(1, -1)
 
     # Smoothstep interpolation
     fy = fy * fy * (3 - 2 * fy)
     fx = fx * fx * (3 - 2 * fx)
 
-    v00 = lattice[y0][:, x0]
-    v10 = lattice[y0 + 1][:, x0]
-    v01 = lattice[y0][:, x0 + 1]
-    v11 = lattice[y0 + 1][:, x0 + 1]
+    # Horizontal lerp on the (coarse) lattice rows
+    rows = lattice[:, x0] * (1 - fx)
+    rows += lattice[:, x0 + 1] * fx
 
-    top = v00 * (1 - fx) + v01 * fx
-    bottom = v10 * (1 - fx) + v11 * fx
-    return top * (1 - fy) + bottom * fy
+    # mode="clip" gathers straight into the scratch buffers (the default
+    # "raise" goes through a hidden full-size buffer); y0 + 1 is always
+    # within the lattice, so nothing is actually clipped.
+    a, b = scratch if scratch is not None else (np.empty_like(out), np.empty_like(out))
+    np.take(rows, y0, axis=0, out=a, mode="clip")
+    a *= (1 - fy) * np.float32(amplitude)
+    np.take(rows, y0 + 1, axis=0, out=b, mode="clip")
+    b *= fy * np.float32(amplitude)
+    out += a
+    out += b
+
+
+def _value_noise_2d(
+    width: int, height: int, scale: float, seed: int = 0
+) -> np.ndarray:
+    """Generate 2D value noise using lattice-based interpolation."""
+    out = np.zeros((height, width), dtype=np.float32)
+    _accumulate_value_noise(out, scale, seed)
+    return out
 
 
 def _fractal_noise(
@@ -65,22 +99,100 @@ def _fractal_noise(
 ) -> np.ndarray:
     """Stack multiple octaves of value noise for fractal detail."""
     result = np.zeros((height, width), dtype=np.float32)
+    scratch = (np.empty_like(result), np.empty_like(result))
     amplitude = 1.0
     total_amp = 0.0
     scale = base_scale
     for i in range(octaves):
-        result += amplitude * _value_noise_2d(width, height, scale, seed + i * 1000)
+        _accumulate_value_noise(result, scale, seed + i * 1000, amplitude, scratch)
         total_amp += amplitude
         amplitude *= 0.5
         scale *= 0.5
-    return result / total_amp
+    result /= np.float32(total_amp)
+    return result
+
+
+# Bump when any texture generator changes output, to invalidate cached files
+TEXTURE_CACHE_VERSION = 2
+DEFAULT_TEXTURE_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "photogrammetry_gen"
+)
+
+
+def _texture_cache_path(
+    cache_dir: Path, width: int, height: int, style: str, seed: int,
+) -> Path:
+    """Content-keyed cache file for a texture parameter tuple."""
+    key = json.dumps({
+        "version": TEXTURE_CACHE_VERSION, "style": style,
+        "width": width, "height": height, "seed": seed,
+    }, sort_keys=True)
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"tex-{style}-{width}x{height}-{digest}.npy"
+
+
+def _evict_texture_cache(cache_dir: Path, max_bytes: int, keep: Path) -> None:
+    """Delete least-recently-used cache entries until the cache fits ``max_bytes``."""
+    entries = []
+    for path in cache_dir.glob("tex-*.npy"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            path.unlink()
+            total -= size
+        except OSError:
+            pass
 
 
 def generate_texture(
     width: int = 1024, height: int = 1024, style: str = "noise",
-    seed: int = 42,
+    seed: int = 42, cache_dir: Path | None = None,
+    cache_max_bytes: int = 512 * 1024 * 1024,
 ) -> np.ndarray:
-    """Generate a procedural texture as RGB uint8 array (H, W, 3)."""
+    """Generate a procedural texture as RGB uint8 array (H, W, 3).
+
+    With ``cache_dir`` set, textures are stored as ``.npy`` files keyed by
+    ``(style, size, seed)`` and returned memory-mapped read-only on later
+    runs. Hits refresh the file's mtime; the least recently used files are
+    evicted once the directory exceeds ``cache_max_bytes``.
+    """
+    if cache_dir is None:
+        return _generate_texture(width, height, style, seed)
+
+    path = _texture_cache_path(cache_dir, width, height, style, seed)
+    try:
+        tex = np.load(path, mmap_mode="r")
+        if tex.shape == (height, width, 3) and tex.dtype == np.uint8:
+            os.utime(path)
+            return tex
+    except (OSError, ValueError):
+        pass
+
+    tex = _generate_texture(width, height, style, seed)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, tex)
+        os.replace(tmp, path)
+        _evict_texture_cache(cache_dir, cache_max_bytes, keep=path)
+    except OSError as e:
+        print(f"  Warning: texture cache write failed: {e}")
+    return tex
+
+
+def _generate_texture(width: int, height: int, style: str, seed: int) -> np.ndarray:
+    """Dispatch to the procedural generator for ``style`` (uncached)."""
     if style == "noise":
         return _texture_noise(width, height, seed)
     elif style == "checker":
@@ -199,35 +311,39 @@ def _make_cube() -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     )
 
 
+def _grid_indices(cols: int, rows: int) -> np.ndarray:
+    """Triangle indices for a (rows + 1) x (cols + 1) vertex grid, two tris per cell."""
+    j, i = np.meshgrid(np.arange(rows, dtype=np.int32),
+                       np.arange(cols, dtype=np.int32), indexing="ij")
+    a = (j * (cols + 1) + i).ravel()
+    b = a + cols + 1
+    return np.stack([a, b, a + 1, a + 1, b, b + 1], axis=1).ravel()
+
+
 def _make_sphere(segments: int = 24, rings: int = 16) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Create a UV sphere with procedural texture coordinates."""
-    verts, norms, uvs, idxs = [], [], [], []
     radius = 0.5
 
-    for j in range(rings + 1):
-        theta = math.pi * j / rings
-        for i in range(segments + 1):
-            phi = 2 * math.pi * i / segments
-            x = radius * math.sin(theta) * math.cos(phi)
-            y = radius * math.cos(theta)
-            z = radius * math.sin(theta) * math.sin(phi)
-            nx, ny, nz = math.sin(theta) * math.cos(phi), math.cos(theta), math.sin(theta) * math.sin(phi)
-            u, v = i / segments, j / rings
-            verts.append([x, y, z])
-            norms.append([nx, ny, nz])
-            uvs.append([u, v])
-
-    for j in range(rings):
-        for i in range(segments):
-            a = j * (segments + 1) + i
-            b = a + segments + 1
-            idxs.extend([a, b, a + 1, a + 1, b, b + 1])
+    theta = np.pi * np.arange(rings + 1, dtype=np.float64) / rings
+    phi = 2 * np.pi * np.arange(segments + 1, dtype=np.float64) / segments
+    theta, phi = np.meshgrid(theta, phi, indexing="ij")
+
+    norms = np.stack([
+        np.sin(theta) * np.cos(phi),
+        np.cos(theta),
+        np.sin(theta) * np.sin(phi),
+    ], axis=-1).reshape(-1, 3)
+    verts = radius * norms
+
+    v, u = np.meshgrid(np.arange(rings + 1) / rings,
+                       np.arange(segments + 1) / segments, indexing="ij")
+    uvs = np.stack([u, v], axis=-1).reshape(-1, 2)
 
     return (
-        np.array(verts, dtype=np.float32),
-        np.array(norms, dtype=np.float32),
-        np.array(uvs, dtype=np.float32),
-        np.array(idxs, dtype=np.int32),
+        verts.astype(np.float32),
+        norms.astype(np.float32),
+        uvs.astype(np.float32),
+        _grid_indices(segments, rings),
     )
 
 
@@ -287,48 +403,45 @@ def _make_terrain(size: float = 3.0, res: int = 32, seed: int = 42) -> tuple[np.
     """Create a heightmap terrain mesh."""
     heights = _fractal_noise(res + 1, res + 1, octaves=4, base_scale=8.0, seed=seed) * 0.5
 
-    verts, norms, uvs, idxs = [], [], [], []
     step = size / res
     half = size / 2
 
-    for j in range(res + 1):
-        for i in range(res + 1):
-            x = -half + i * step
-            z = -half + j * step
-            y = heights[j, i] - 0.5
-            u, v = i / res, j / res
-            verts.append([x, y, z])
-            uvs.append([u * 3, v * 3])  # Tile texture
-
-            # Approximate normal via finite differences
-            h_l = heights[j, max(i - 1, 0)]
-            h_r = heights[j, min(i + 1, res)]
-            h_d = heights[max(j - 1, 0), i]
-            h_u = heights[min(j + 1, res), i]
-            nx = (h_l - h_r) / (2 * step)
-            nz = (h_d - h_u) / (2 * step)
-            norm = np.array([nx, 1.0, nz])
-            norm = norm / np.linalg.norm(norm)
-            norms.append(norm.tolist())
-
-    for j in range(res):
-        for i in range(res):
-            a = j * (res + 1) + i
-            b = a + res + 1
-            idxs.extend([a, b, a + 1, a + 1, b, b + 1])
+    coords = -half + np.arange(res + 1, dtype=np.float64) * step
+    z, x = np.meshgrid(coords, coords, indexing="ij")
+    verts = np.stack([x, heights - 0.5, z], axis=-1).reshape(-1, 3)
+
+    t = np.arange(res + 1, dtype=np.float64) / res
+    v, u = np.meshgrid(t, t, indexing="ij")
+    uvs = np.stack([u * 3, v * 3], axis=-1).reshape(-1, 2)  # Tile texture
+
+    # Approximate normals via finite differences (edges clamp to themselves)
+    padded = np.pad(heights, 1, mode="edge")
+    h_l = padded[1:-1, :-2]
+    h_r = padded[1:-1, 2:]
+    h_d = padded[:-2, 1:-1]
+    h_u = padded[2:, 1:-1]
+    nx = (h_l - h_r) / (2 * step)
+    nz = (h_d - h_u) / (2 * step)
+    norms = np.stack([nx, np.ones_like(nx), nz], axis=-1).reshape(-1, 3)
+    norms /= np.linalg.norm(norms, axis=1, keepdims=True)
 
     return (
-        np.array(verts, dtype=np.float32),
-        np.array(norms, dtype=np.float32),
-        np.array(uvs, dtype=np.float32),
-        np.array(idxs, dtype=np.int32),
+        verts.astype(np.float32),
+        norms.astype(np.float32),
+        uvs.astype(np.float32),
+        _grid_indices(res, res),
     )
 
 
 def create_scene(
     scene_type: str = "cube", seed: int = 42,
+    terrain_res: int = 32, sphere_segments: int = 24,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-    """Create a 3D scene. Returns (vertices, normals, uvs, indices)."""
+    """Create a 3D scene. Returns (vertices, normals, uvs, indices).
+
+    ``terrain_res`` is the heightmap grid size for ``terrain``;
+    ``sphere_segments`` sets the sphere's longitude count (rings = 2/3 of it).
+    """
     if scene_type == "cube":
         cv, cn, cu, ci = _make_cube()
         gv, gn, gu, gi = _make_ground_plane()
@@ -340,7 +453,7 @@ def create_scene(
             np.concatenate([ci, gi]),
         )
     elif scene_type == "sphere":
-        sv, sn, su, si = _make_sphere()
+        sv, sn, su, si = _make_sphere(sphere_segments, max(2, sphere_segments * 2 // 3))
         gv, gn, gu, gi = _make_ground_plane()
         gi = gi + len(sv)
         return (
@@ -352,7 +465,7 @@ def create_scene(
     elif scene_type == "multi":
         return _make_multi(seed)
     elif scene_type == "terrain":
-        return _make_terrain(seed=seed)
+        return _make_terrain(res=terrain_res, seed=seed)
     else:
         raise ValueError(f"Unknown scene type: {scene_type}")
 
@@ -464,13 +577,15 @@ uniform vec3 light_dir;
 in vec2 uv;
 in vec3 normal;
 in vec3 frag_pos;
-out vec4 fragColor;
+layout(location = 0) out vec4 fragColor;
+layout(location = 1) out vec4 fragNormal;
 void main() {
     vec3 n = normalize(normal);
     float diffuse = max(dot(n, normalize(light_dir)), 0.0);
     float ambient = 0.3;
     vec3 color = texture(tex, uv).rgb * (ambient + 0.7 * diffuse);
     fragColor = vec4(color, 1.0);
+    fragNormal = vec4(n, 1.0);
 }
 """
 
@@ -480,13 +595,26 @@ def render_gpu(
     indices: np.ndarray, texture_data: np.ndarray,
     poses: list[dict], proj_mat: np.ndarray,
     width: int, height: int, seed: int = 42,
-) -> list[np.ndarray]:
-    """Render all views using moderngl (GPU). Returns list of RGB arrays."""
+    ground_truth: GroundTruthWriter | None = None,
+) -> Iterator[np.ndarray]:
+    """Render all views using moderngl (GPU). Yields one RGB array per pose.
+
+    With ``ground_truth``, normals go to a second float color attachment
+    and depth is read back from the depth attachment for each view.
+    """
     import moderngl
-    from PIL import Image
 
     ctx = moderngl.create_standalone_context()
-    fbo = ctx.simple_framebuffer((width, height))
+    if ground_truth is not None:
+        fbo = ctx.framebuffer(
+            color_attachments=[
+                ctx.renderbuffer((width, height)),
+                ctx.renderbuffer((width, height), components=4, dtype="f4"),
+            ],
+            depth_attachment=ctx.depth_renderbuffer((width, height)),
+        )
+    else:
+        fbo = ctx.simple_framebuffer((width, height))
     fbo.use()
 
     prog = ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER)
@@ -510,33 +638,104 @@ def render_gpu(
 
     ctx.enable(moderngl.DEPTH_TEST)
 
-    images = []
     rng = np.random.default_rng(seed + 500)
 
-    for i, pose in enumerate(poses):
-        view_mat = np.array(pose["view_matrix"], dtype=np.float32)
-        mvp = (proj_mat @ view_mat).astype(np.float32)
-        prog["mvp"].write(mvp.T.tobytes())  # Column-major for OpenGL
+    try:
+        for i, pose in enumerate(poses):
+            view_mat = np.array(pose["view_matrix"], dtype=np.float32)
+            mvp = (proj_mat @ view_mat).astype(np.float32)
+            prog["mvp"].write(mvp.T.tobytes())  # Column-major for OpenGL
+
+            # Slightly vary light direction per view
+            base_light = np.array([0.5, 0.8, 0.3], dtype=np.float32)
+            jitter = rng.uniform(-0.05, 0.05, size=3).astype(np.float32)
+            light = base_light + jitter
+            light = light / np.linalg.norm(light)
+            prog["light_dir"].value = tuple(light.tolist())
+
+            fbo.clear(0.6, 0.7, 0.9, 1.0)
+            vao.render()
+            pixels = fbo.read(components=3)
+            img = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, 3)
+
+            if ground_truth is not None:
+                win_z = np.frombuffer(fbo.read(attachment=-1, dtype="f4"),
+                                      dtype=np.float32).reshape(height, width)[::-1]
+                nrm = np.frombuffer(fbo.read(components=4, attachment=1, dtype="f4"),
+                                    dtype=np.float32).reshape(height, width, 4)[::-1, :, :3]
+                mask = win_z < 1.0
+                ground_truth.write(
+                    i, ndc_z=np.where(mask, win_z * 2 - 1, np.inf),
+                    normal=nrm, mask=mask,
+                )
+
+            yield img[::-1].copy()  # Flip vertically
+    finally:
+        ctx.release()
 
-        # Slightly vary light direction per view
-        base_light = np.array([0.5, 0.8, 0.3], dtype=np.float32)
-        jitter = rng.uniform(-0.05, 0.05, size=3).astype(np.float32)
-        light = base_light + jitter
-        light = light / np.linalg.norm(light)
-        prog["light_dir"].value = tuple(light.tolist())
 
-        fbo.clear(0.6, 0.7, 0.9, 1.0)
-        vao.render()
-        pixels = fbo.read(components=3)
-        img = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, 3)
-        img = img[::-1].copy()  # Flip vertically
-        images.append(img)
+# ── CPU Software Rasterizer (fallback) ─────────────────────────────
 
-    ctx.release()
-    return images
 
+def _iter_clip_space(
+    verts: np.ndarray, poses: list[dict], proj_mat: np.ndarray,
+    batch_bytes: int = 64 * 1024 * 1024,
+) -> Iterator[np.ndarray]:
+    """Yield each pose's clip-space vertices (N x 4).
 
-# ── CPU Software Rasterizer (fallback) ─────────────────────────────
+    Poses are transformed in batches with a single einsum over the stacked
+    MVP matrices; the batch size keeps the (B, N, 4) block under
+    ``batch_bytes`` so dense meshes don't multiply memory by the view count.
+    """
+    v4 = np.hstack([verts, np.ones((len(verts), 1), dtype=np.float32)])
+    batch = max(1, batch_bytes // max(1, v4.nbytes))
+    for start in range(0, len(poses), batch):
+        views = np.array([p["view_matrix"] for p in poses[start:start + batch]],
+                         dtype=np.float32)
+        mvps = proj_mat.astype(np.float32) @ views  # B x 4 x 4
+        yield from np.einsum("bij,nj->bni", mvps, v4)
+
+
+def _oriented_face_normals(
+    verts: np.ndarray, norms: np.ndarray, tris: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Geometric face normals flipped to agree with the vertex normals.
+
+    Winding is not consistent across the scene builders, so the shading
+    normals decide which side is the front. Returns (normals, plane offsets).
+    """
+    tri_v = verts[tris]
+    face_n = np.cross(tri_v[:, 1] - tri_v[:, 0], tri_v[:, 2] - tri_v[:, 0])
+    flip = np.einsum("tk,tk->t", face_n, norms[tris].sum(axis=1)) < 0
+    face_n[flip] *= -1
+    return face_n, np.einsum("tk,tk->t", face_n, tri_v[:, 0])
+
+
+def _clip_near(
+    clip: np.ndarray, uv: np.ndarray, nrm: np.ndarray,
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Clip one triangle against the near plane (z = -w) in clip space.
+
+    Returns the 1 or 2 resulting triangles as (clip 3x4, uv 3x2, normal 3x3),
+    with UVs and normals interpolated at the new vertices.
+    """
+    d = clip[:, 2] + clip[:, 3]  # >= 0 on the visible side
+    poly = []
+    for k in range(3):
+        k2 = (k + 1) % 3
+        if d[k] >= 0:
+            poly.append((clip[k], uv[k], nrm[k]))
+        if (d[k] >= 0) != (d[k2] >= 0):
+            t = d[k] / (d[k] - d[k2])
+            poly.append((
+                clip[k] + t * (clip[k2] - clip[k]),
+                uv[k] + t * (uv[k2] - uv[k]),
+                nrm[k] + t * (nrm[k2] - nrm[k]),
+            ))
+    return [
+        tuple(np.array([poly[0][a], poly[i][a], poly[i + 1][a]]) for a in range(3))
+        for i in range(1, len(poly) - 1)
+    ]
 
 
 def render_cpu(
@@ -544,33 +743,65 @@ def render_cpu(
     indices: np.ndarray, texture_data: np.ndarray,
     poses: list[dict], proj_mat: np.ndarray,
     width: int, height: int, seed: int = 42,
-) -> list[np.ndarray]:
-    """Pure numpy software rasterizer. Slower but works without GPU."""
-    images = []
+    stats: dict[str, int] | None = None,
+    ground_truth: GroundTruthWriter | None = None,
+) -> Iterator[np.ndarray]:
+    """Pure numpy software rasterizer. Slower but works without GPU.
+
+    Before rasterizing, each pose's triangles are culled with vectorized
+    back-face and frustum tests, and triangles crossing the near plane are
+    clipped. When ``stats`` is given, ``triangles`` and ``rasterized``
+    counts are accumulated into it. With ``ground_truth``, the z-buffer
+    and interpolated normals are handed to it for each view.
+    """
     rng = np.random.default_rng(seed + 500)
     tex_h, tex_w = texture_data.shape[:2]
-
-    for pi, pose in enumerate(poses):
-        view_mat = np.array(pose["view_matrix"], dtype=np.float32)
-        mvp = proj_mat @ view_mat
-
-        # Transform vertices to clip space
-        v4 = np.hstack([verts, np.ones((len(verts), 1), dtype=np.float32)])
-        clip = (mvp @ v4.T).T  # N x 4
-
-        # Perspective divide
-        w_clip = clip[:, 3:4]
-        w_clip = np.where(np.abs(w_clip) < 1e-6, 1e-6, w_clip)
-        ndc = clip[:, :3] / w_clip  # N x 3
-
-        # NDC to screen
-        sx = ((ndc[:, 0] + 1) * 0.5 * width).astype(np.float32)
-        sy = ((1 - ndc[:, 1]) * 0.5 * height).astype(np.float32)  # Flip Y
-        sz = ndc[:, 2]
+    tris = indices.reshape(-1, 3)
+    face_n, face_d = _oriented_face_normals(verts, norms, tris)
+
+    want_normals = ground_truth is not None and "normal" in ground_truth.channels
+
+    for pi, (pose, clip) in enumerate(zip(poses, _iter_clip_space(verts, poses, proj_mat))):
+        # Cull back faces, then triangles wholly outside one frustum plane
+        eye = np.asarray(pose["position"], dtype=np.float32)
+        front = face_n @ eye - face_d > 0
+        c = clip[tris]  # T x 3 x 4
+        x, y, z, w = c[..., 0], c[..., 1], c[..., 2], c[..., 3]
+        outside = (
+            (x > w).all(1) | (x < -w).all(1)
+            | (y > w).all(1) | (y < -w).all(1)
+            | (z > w).all(1) | (z < -w).all(1)
+        )
+        visible = front & ~outside
+        in_near = (z >= -w)
+        whole = visible & in_near.all(1)
+        straddle = np.flatnonzero(visible & ~in_near.all(1))
+
+        tri_clip = [c[whole]]
+        tri_uv = [uvs[tris[whole]]]
+        tri_n = [norms[tris[whole]]]
+        for t in straddle:
+            for pc, pu, pn in _clip_near(c[t], uvs[tris[t]], norms[tris[t]]):
+                tri_clip.append(pc[None])
+                tri_uv.append(pu[None])
+                tri_n.append(pn[None])
+        tri_clip = np.concatenate(tri_clip)
+        tri_uv = np.concatenate(tri_uv)
+        tri_n = np.concatenate(tri_n)
+        if stats is not None:
+            stats["triangles"] = stats.get("triangles", 0) + len(tris)
+            stats["rasterized"] = stats.get("rasterized", 0) + len(tri_clip)
+
+        # Perspective divide and NDC to screen (w >= near after clipping)
+        ndc = tri_clip[..., :3] / tri_clip[..., 3:4]
+        tri_sx = (ndc[..., 0] + 1) * 0.5 * width
+        tri_sy = (1 - ndc[..., 1]) * 0.5 * height  # Flip Y
+        tri_sz = ndc[..., 2]
 
         # Initialize framebuffer
         fb = np.full((height, width, 3), [153, 179, 230], dtype=np.uint8)  # Sky blue
         zbuf = np.full((height, width), np.inf, dtype=np.float32)
+        nbuf = np.zeros((height, width, 3), dtype=np.float32) if want_normals else None
 
         # Light direction
         base_light = np.array([0.5, 0.8, 0.3], dtype=np.float32)
@@ -579,12 +810,12 @@ def render_cpu(
         light = light / np.linalg.norm(light)
 
         # Rasterize triangles
-        tris = indices.reshape(-1, 3)
-        for tri in tris:
-            i0, i1, i2 = tri
-            x0, y0, z0 = sx[i0], sy[i0], sz[i0]
-            x1, y1, z1 = sx[i1], sy[i1], sz[i1]
-            x2, y2, z2 = sx[i2], sy[i2], sz[i2]
+        for ti in range(len(tri_clip)):
+            x0, x1, x2 = tri_sx[ti]
+            y0, y1, y2 = tri_sy[ti]
+            z0, z1, z2 = tri_sz[ti]
+            uv0, uv1, uv2 = tri_uv[ti]
+            n0, n1, n2 = tri_n[ti]
 
             # Bounding box
             min_x = max(int(min(x0, x1, x2)), 0)
@@ -595,10 +826,6 @@ def render_cpu(
             if min_x >= max_x or min_y >= max_y:
                 continue
 
-            # Skip triangles behind camera
-            if z0 < -1 or z1 < -1 or z2 < -1:
-                continue
-
             # Barycentric coordinates for the bounding box
             denom = (y1 - y2) * (x0 - x2) + (x2 - x1) * (y0 - y2)
             if abs(denom) < 1e-6:
@@ -620,8 +847,8 @@ def render_cpu(
                     zbuf[py, px] = z
 
                     # Interpolate UV
-                    u = w0 * uvs[i0, 0] + w1 * uvs[i1, 0] + w2 * uvs[i2, 0]
-                    v = w0 * uvs[i0, 1] + w1 * uvs[i1, 1] + w2 * uvs[i2, 1]
+                    u = w0 * uv0[0] + w1 * uv1[0] + w2 * uv2[0]
+                    v = w0 * uv0[1] + w1 * uv1[1] + w2 * uv2[1]
 
                     # Sample texture (with wrapping)
                     tu = int(u % 1.0 * (tex_w - 1)) % tex_w
@@ -629,89 +856,243 @@ def render_cpu(
                     tex_color = texture_data[tv, tu].astype(np.float32) / 255.0
 
                     # Interpolate normal and compute lighting
-                    n = (w0 * norms[i0] + w1 * norms[i1] + w2 * norms[i2])
+                    n = (w0 * n0 + w1 * n1 + w2 * n2)
                     n_len = np.linalg.norm(n)
                     if n_len > 0:
                         n = n / n_len
+                    if nbuf is not None:
+                        nbuf[py, px] = n
                     diffuse = max(np.dot(n, light), 0.0)
                     ambient = 0.3
                     color = tex_color * (ambient + 0.7 * diffuse)
                     fb[py, px] = np.clip(color * 255, 0, 255).astype(np.uint8)
 
-        images.append(fb)
+        if ground_truth is not None:
+            ground_truth.write(pi, ndc_z=zbuf, normal=nbuf, mask=np.isfinite(zbuf))
 
-    return images
+        yield fb
 
 
 # ── Output ─────────────────────────────────────────────────────────
 
 
+GROUND_TRUTH_CHANNELS = ("depth", "normal", "mask")
+
+
+class GroundTruthWriter:
+    """Per-view depth, normal and mask buffers written as they are rendered.
+
+    ``png`` writes one file per view into ``depth/``, ``normal/`` and
+    ``mask/`` (depth as 16-bit grayscale scaled by ``depth_scale``, normals
+    as RGB8 ``n * 0.5 + 0.5``, mask as 0/255). ``npy`` writes one
+    memory-mapped stack per channel (float32 depth, float16 normals, uint8
+    mask) so only the current view's slice is touched. Depth is linear
+    view-space distance; normals are world space; the mask covers all
+    rendered geometry. Background depth and normals are 0.
+    """
+
+    def __init__(
+        self, output_dir: Path, channels: list[str], fmt: str,
+        n_views: int, width: int, height: int, proj_mat: np.ndarray,
+    ) -> None:
+        self.output_dir = output_dir
+        self.channels = list(channels)
+        self.fmt = fmt
+        self.n_views = n_views
+        self.width = width
+        self.height = height
+        # z_ndc = A + B / z_eye  =>  linear depth = B / (z_ndc + A)
+        self._a = float(proj_mat[2, 2])
+        self._b = float(proj_mat[2, 3])
+        self.near = self._b / (self._a - 1)
+        self.far = self._b / (self._a + 1)
+        self.depth_scale = self.far / 65535
+
+        self._stacks: dict[str, np.ndarray] = {}
+        if fmt == "npy":
+            shapes = {
+                "depth": ((n_views, height, width), np.float32),
+                "normal": ((n_views, height, width, 3), np.float16),
+                "mask": ((n_views, height, width), np.uint8),
+            }
+            for ch in self.channels:
+                shape, dtype = shapes[ch]
+                self._stacks[ch] = np.lib.format.open_memmap(
+                    output_dir / f"{ch}.npy", mode="w+", dtype=dtype, shape=shape,
+                )
+        else:
+            for ch in self.channels:
+                (output_dir / ch).mkdir(exist_ok=True)
+
+    def write(
+        self, index: int, ndc_z: np.ndarray,
+        normal: np.ndarray | None, mask: np.ndarray,
+    ) -> None:
+        """Store one view's buffers. ``ndc_z`` is inf where nothing was drawn."""
+        from PIL import Image
+
+        out: dict[str, np.ndarray] = {}
+        if "depth" in self.channels:
+            depth = np.zeros((self.height, self.width), dtype=np.float32)
+            depth[mask] = self._b / (ndc_z[mask] + self._a)
+            out["depth"] = depth
+        if "normal" in self.channels and normal is not None:
+            out["normal"] = np.where(mask[..., None], normal, 0.0)
+        if "mask" in self.channels:
+            out["mask"] = mask.astype(np.uint8)
+
+        fname = f"IMG_{index:04d}.png"
+        for ch, data in out.items():
+            if self.fmt == "npy":
+                self._stacks[ch][index] = data
+                continue
+            if ch == "depth":
+                arr = np.clip(np.rint(data / self.depth_scale), 0, 65535).astype(np.uint16)
+            elif ch == "normal":
+                arr = np.clip(np.rint((data * 0.5 + 0.5) * 255), 0, 255).astype(np.uint8)
+            else:
+                arr = data * 255
+            Image.fromarray(arr).save(self.output_dir / ch / fname, "PNG")
+
+    def close(self) -> None:
+        """Flush stacks and write ground_truth.json describing the encoding."""
+        for stack in self._stacks.values():
+            stack.flush()
+        self._stacks.clear()
+
+        data = {
+            "format": self.fmt,
+            "channels": self.channels,
+            "views": self.n_views,
+            "image_width": self.width,
+            "image_height": self.height,
+            "depth": {
+                "kind": "linear_view_depth",
+                "near": round(self.near, 6),
+                "far": round(self.far, 6),
+                "scale": self.depth_scale if self.fmt == "png" else 1.0,
+            },
+            "normal": {
+                "space": "world",
+                "encoding": "rgb8_half_offset" if self.fmt == "png" else "float16",
+            },
+            "mask": {"encoding": "0_255" if self.fmt == "png" else "0_1"},
+        }
+        (self.output_dir / "ground_truth.json").write_text(
+            json.dumps(data, indent=2), encoding="utf-8"
+        )
+
+
+def _encode_image(
+    img_data: np.ndarray, path: Path,
+    write_exif: bool, focal_length_mm: float,
+) -> None:
+    """Encode one frame as JPEG (runs on an encoder thread; PIL drops the GIL)."""
+    from PIL import Image
+
+    img = Image.fromarray(img_data, "RGB")
+
+    if write_exif:
+        from PIL.ExifTags import Base as ExifBase
+
+        exif = img.getexif()
+        exif[ExifBase.Make] = "Synthetic"
+        exif[ExifBase.Model] = "PhotogrammetryGen"
+        exif[ExifBase.ImageWidth] = img.width
+        exif[ExifBase.ImageLength] = img.height
+        # FocalLength as rational
+        fl_int = int(focal_length_mm * 100)
+        exif[ExifBase.FocalLength] = (fl_int, 100)
+        exif[ExifBase.DateTime] = datetime.now(timezone.utc).strftime("%Y:%m:%d %H:%M:%S")
+        img.save(path, "JPEG", quality=95, exif=exif.tobytes())
+    else:
+        img.save(path, "JPEG", quality=95)
+
+
+def iter_save_images(
+    images: Iterable[np.ndarray], output_dir: Path,
+    write_exif: bool = False, focal_length_mm: float = 50.0,
+    workers: int = 4,
+) -> Iterator[str]:
+    """Encode frames on a bounded thread pool, yielding filenames in view order.
+
+    At most ``workers`` frames are queued for encoding at any time, so the
+    renderer only runs ahead by that much and peak memory stays at roughly
+    ``workers + 1`` frames regardless of the number of views.
+    """
+    workers = max(1, workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="encode") as pool:
+        pending: deque[tuple[str, Any]] = deque()
+        for i, img_data in enumerate(images):
+            fname = f"IMG_{i:04d}.jpg"
+            future = pool.submit(
+                _encode_image, img_data, output_dir / fname,
+                write_exif, focal_length_mm,
+            )
+            pending.append((fname, future))
+            if len(pending) >= workers:
+                fname, future = pending.popleft()
+                future.result()
+                yield fname
+        while pending:
+            fname, future = pending.popleft()
+            future.result()
+            yield fname
+
+
 def save_images(
-    images: list[np.ndarray], output_dir: Path,
+    images: Iterable[np.ndarray], output_dir: Path,
     write_exif: bool = False, focal_length_mm: float = 50.0,
+    workers: int = 4,
 ) -> list[str]:
     """Save rendered images as JPEG files."""
-    from PIL import Image
-
-    filenames = []
-    for i, img_data in enumerate(images):
-        fname = f"IMG_{i:04d}.jpg"
-        img = Image.fromarray(img_data, "RGB")
-
-        if write_exif:
-            from PIL.ExifTags import Base as ExifBase
-            import struct
-
-            exif = img.getexif()
-            exif[ExifBase.Make] = "Synthetic"
-            exif[ExifBase.Model] = "PhotogrammetryGen"
-            exif[ExifBase.ImageWidth] = img.width
-            exif[ExifBase.ImageLength] = img.height
-            # FocalLength as rational
-            fl_int = int(focal_length_mm * 100)
-            exif[ExifBase.FocalLength] = (fl_int, 100)
-            exif[ExifBase.DateTime] = datetime.now(timezone.utc).strftime("%Y:%m:%d %H:%M:%S")
-            img.save(output_dir / fname, "JPEG", quality=95, exif=exif.tobytes())
-        else:
-            img.save(output_dir / fname, "JPEG", quality=95)
-
-        filenames.append(fname)
-    return filenames
+    return list(iter_save_images(images, output_dir, write_exif,
+                                 focal_length_mm, workers))
 
 
 def write_cameras_json(
-    poses: list[dict], filenames: list[str],
+    poses: list[dict], filenames: Iterable[str],
     proj_mat: np.ndarray, focal_length_mm: float,
     width: int, height: int, output_dir: Path,
-) -> None:
-    """Write cameras.json with ground-truth poses."""
+) -> int:
+    """Write cameras.json with ground-truth poses.
+
+    ``filenames`` may be a lazy iterator (e.g. from ``iter_save_images``);
+    each view entry is written as soon as its image is on disk. Returns the
+    number of views written.
+    """
     # Standard full-frame sensor
     sensor_width_mm = 36.0
     sensor_height_mm = 24.0
 
-    views = []
-    for fname, pose in zip(filenames, poses):
-        views.append({
-            "filename": fname,
-            "position": [round(v, 6) for v in pose["position"]],
-            "rotation_euler_deg": [round(v, 2) for v in pose["rotation_euler_deg"]],
-            "view_matrix": [[round(v, 6) for v in row] for row in pose["view_matrix"]],
-            "projection_matrix": [[round(v, 6) for v in row] for row in proj_mat.tolist()],
-        })
-
-    data = {
+    header = {
         "camera_model": "PINHOLE",
         "focal_length_mm": focal_length_mm,
         "sensor_width_mm": sensor_width_mm,
         "sensor_height_mm": sensor_height_mm,
         "image_width": width,
         "image_height": height,
-        "views": views,
     }
-
-    (output_dir / "cameras.json").write_text(
-        json.dumps(data, indent=2), encoding="utf-8"
-    )
+    proj_rounded = [[round(v, 6) for v in row] for row in proj_mat.tolist()]
+
+    n_views = 0
+    with open(output_dir / "cameras.json", "w", encoding="utf-8") as f:
+        # Same layout as json.dumps(data, indent=2), emitted one view at a time
+        f.write(json.dumps(header, indent=2)[:-2] + ',\n  "views": [')
+        for fname, pose in zip(filenames, poses):
+            view = {
+                "filename": fname,
+                "position": [round(v, 6) for v in pose["position"]],
+                "rotation_euler_deg": [round(v, 2) for v in pose["rotation_euler_deg"]],
+                "view_matrix": [[round(v, 6) for v in row] for row in pose["view_matrix"]],
+                "projection_matrix": proj_rounded,
+            }
+            body = json.dumps(view, indent=2).replace("\n", "\n    ")
+            f.write(("," if n_views else "") + "\n    " + body)
+            n_views += 1
+        f.write("\n  ]\n}" if n_views else "]\n}")
+
+    return n_views
 
 
 def write_scene_info(
@@ -721,6 +1102,8 @@ def write_scene_info(
     data = {
         "scene_type": args.scene,
         "texture_type": args.texture,
+        "terrain_res": args.terrain_res,
+        "sphere_segments": args.sphere_segments,
         "seed": args.seed,
         "views": args.views,
         "orbits": args.orbits,
@@ -728,6 +1111,7 @@ def write_scene_info(
         "radius": args.radius,
         "resolution": f"{args.width}x{args.height}",
         "focal_length_mm": args.focal_length,
+        "ground_truth": args.emit,
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "generator": "photogrammetry_gen.py",
     }
@@ -826,9 +1210,83 @@ def validate_output(output_dir: Path, n_views: int, width: int, height: int) ->
     scene_path = output_dir / "scene_info.json"
     check("scene_info.json exists", scene_path.is_file())
 
+    # 7. Ground-truth buffers (only when --emit was used)
+    gt_path = output_dir / "ground_truth.json"
+    if gt_path.is_file():
+        try:
+            gt = json.loads(gt_path.read_text(encoding="utf-8"))
+            _validate_ground_truth(output_dir, gt, n_views, width, height, check)
+        except Exception as e:
+            check("ground_truth.json parseable", False, str(e))
+
     return all_pass
 
 
+def _load_ground_truth_view(
+    output_dir: Path, gt: dict[str, Any], channel: str, index: int,
+) -> np.ndarray:
+    """Load one view of a ground-truth channel, decoded to float units."""
+    from PIL import Image
+
+    if gt["format"] == "npy":
+        return np.asarray(np.load(output_dir / f"{channel}.npy", mmap_mode="r")[index],
+                          dtype=np.float32)
+    data = np.array(Image.open(output_dir / channel / f"IMG_{index:04d}.png"),
+                    dtype=np.float32)
+    if channel == "depth":
+        return data * gt["depth"]["scale"]
+    if channel == "normal":
+        return data / 255 * 2 - 1
+    return data / 255
+
+
+def _validate_ground_truth(
+    output_dir: Path, gt: dict[str, Any], n_views: int, width: int, height: int,
+    check: Any,
+) -> None:
+    """Check ground-truth file counts, shapes and cross-channel consistency."""
+    channels = gt.get("channels", [])
+
+    for ch in channels:
+        if gt["format"] == "npy":
+            stack = np.load(output_dir / f"{ch}.npy", mmap_mode="r")
+            check(f"{ch}.npy shape", stack.shape[:3] == (n_views, height, width),
+                  f"expected {(n_views, height, width)}, got {stack.shape[:3]}")
+        else:
+            files = sorted((output_dir / ch).glob("IMG_*.png"))
+            check(f"{ch} map count", len(files) == n_views,
+                  f"expected {n_views}, got {len(files)}")
+
+    if not channels or n_views == 0:
+        return
+    view = {ch: _load_ground_truth_view(output_dir, gt, ch, 0) for ch in channels}
+    for ch, data in view.items():
+        check(f"{ch} map dimensions", data.shape[:2] == (height, width),
+              f"got {data.shape[1]}x{data.shape[0]}")
+
+    if "mask" in view:
+        coverage = float((view["mask"] > 0.5).mean())
+        check("Mask coverage", 0.0 < coverage < 1.0, f"{coverage:.1%} of pixels")
+        fg = view["mask"] > 0.5
+    elif "depth" in view:
+        fg = view["depth"] > 0
+    else:
+        fg = np.linalg.norm(view["normal"], axis=-1) > 0.5
+
+    if "depth" in view and fg.any():
+        d = view["depth"][fg]
+        in_range = bool(np.all((d >= gt["depth"]["near"] * 0.99)
+                               & (d <= gt["depth"]["far"])))
+        check("Depth within near/far", in_range,
+              f"min {d.min():.3f}, max {d.max():.3f}")
+        check("Depth matches mask", not np.any(view["depth"][~fg] > 0))
+
+    if "normal" in view and fg.any():
+        err = np.abs(np.linalg.norm(view["normal"][fg], axis=-1) - 1.0)
+        check("Normals unit length", float(np.percentile(err, 99)) < 0.05,
+              f"p99 |n| error = {np.percentile(err, 99):.3f}")
+
+
 # ── Main ───────────────────────────────────────────────────────────
 
 
@@ -845,6 +1303,18 @@ def parse_elevations(s: str) -> list[float]:
     return [float(x.strip()) for x in s.split(",")]
 
 
+def parse_emit(s: str) -> list[str]:
+    """Parse comma-separated ground-truth channels."""
+    channels = [x.strip() for x in s.split(",") if x.strip()]
+    unknown = [c for c in channels if c not in GROUND_TRUTH_CHANNELS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"Unknown channel(s): {', '.join(unknown)} "
+            f"(expected {','.join(GROUND_TRUTH_CHANNELS)})"
+        )
+    return list(dict.fromkeys(channels))
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Generate synthetic photo sets for photogrammetry testing",
@@ -859,8 +1329,18 @@ def main() -> int:
                         help="Comma-separated elevation angles in degrees (e.g., '15,45,70')")
     parser.add_argument("--scene", choices=["cube", "sphere", "multi", "terrain"],
                         default="cube", help="Scene type (default: cube)")
+    parser.add_argument("--terrain-res", type=int, default=32,
+                        help="Terrain heightmap grid resolution (default: 32)")
+    parser.add_argument("--sphere-segments", type=int, default=24,
+                        help="Sphere longitude segments; rings = 2/3 of this (default: 24)")
     parser.add_argument("--texture", choices=["noise", "checker", "stone", "grid"],
                         default="noise", help="Texture style (default: noise)")
+    parser.add_argument("--texture-cache", type=Path, default=DEFAULT_TEXTURE_CACHE_DIR,
+                        help=f"Directory for cached textures (default: {DEFAULT_TEXTURE_CACHE_DIR})")
+    parser.add_argument("--texture-cache-mb", type=int, default=512,
+                        help="Texture cache size limit in MB, LRU-evicted (default: 512)")
+    parser.add_argument("--no-texture-cache", action="store_true",
+                        help="Always regenerate the texture; do not read or write the cache")
     parser.add_argument("--resolution", type=parse_resolution, default=(1920, 1080),
                         help="Image resolution WxH (default: 1920x1080)")
     parser.add_argument("--focal-length", type=float, default=50.0,
@@ -869,12 +1349,20 @@ def main() -> int:
                         help="Camera orbit radius (default: 3.0)")
     parser.add_argument("--exif", action="store_true",
                         help="Write EXIF metadata to JPEG files")
+    parser.add_argument("--emit", type=parse_emit, default=[],
+                        help="Ground-truth channels to write per view (e.g., 'depth,normal,mask')")
+    parser.add_argument("--emit-format", choices=["png", "npy"], default="png",
+                        help="Ground-truth storage: 16-bit PNG per view or "
+                             "memory-mapped .npy stacks (default: png)")
     parser.add_argument("--validate", action="store_true",
                         help="Run validation checks after generation")
     parser.add_argument("--seed", type=int, default=42,
                         help="Random seed for reproducibility (default: 42)")
     parser.add_argument("--cpu", action="store_true",
                         help="Force CPU software rendering (no GPU)")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="JPEG encoder threads; bounds frames held in memory "
+                             "(default: min(4, CPU count))")
     args = parser.parse_args()
 
     args.width, args.height = args.resolution
@@ -892,11 +1380,18 @@ def main() -> int:
 
     # 1. Generate texture
     print("Generating texture...")
-    tex_data = generate_texture(1024, 1024, style=args.texture, seed=args.seed)
+    tex_data = generate_texture(
+        1024, 1024, style=args.texture, seed=args.seed,
+        cache_dir=None if args.no_texture_cache else args.texture_cache,
+        cache_max_bytes=args.texture_cache_mb * 1024 * 1024,
+    )
 
     # 2. Create scene
     print(f"Creating {args.scene} scene...")
-    verts, norms, uvs, indices = create_scene(args.scene, seed=args.seed)
+    verts, norms, uvs, indices = create_scene(
+        args.scene, seed=args.seed,
+        terrain_res=args.terrain_res, sphere_segments=args.sphere_segments,
+    )
     print(f"  {len(verts)} vertices, {len(indices) // 3} triangles")
 
     # 3. Generate camera poses
@@ -914,19 +1409,29 @@ def main() -> int:
     fov_y = 2 * math.degrees(math.atan(sensor_height_mm / (2 * args.focal_length)))
     proj_mat = _perspective(fov_y, aspect, 0.1, 100.0)
 
-    # 5. Render
+    # 5. Render → encode → write, streamed frame by frame
     use_gpu = not args.cpu
+    frames: Iterator[np.ndarray] | None = None
+    raster_stats: dict[str, int] = {}
+    ground_truth = None
+    if args.emit:
+        ground_truth = GroundTruthWriter(
+            args.output, args.emit, args.emit_format,
+            len(poses), args.width, args.height, proj_mat,
+        )
     if use_gpu:
         try:
             import moderngl
             print("Rendering with GPU (moderngl)...")
             t0 = time.monotonic()
-            images = render_gpu(
+            frames = render_gpu(
                 verts, norms, uvs, indices, tex_data,
                 poses, proj_mat, args.width, args.height, args.seed,
+                ground_truth=ground_truth,
             )
-            elapsed = time.monotonic() - t0
-            print(f"  Rendered {len(images)} views in {elapsed:.1f}s")
+            # Pull the first frame eagerly so context/shader errors surface
+            # here and can still fall back to the CPU renderer
+            frames = itertools.chain([next(frames)], frames)
         except Exception as e:
             print(f"  GPU rendering failed: {e}")
             print("  Falling back to CPU software renderer...")
@@ -936,26 +1441,33 @@ def main() -> int:
         print("Rendering with CPU (software rasterizer)...")
         print("  Warning: CPU rendering is much slower than GPU")
         t0 = time.monotonic()
-        images = render_cpu(
+        frames = render_cpu(
             verts, norms, uvs, indices, tex_data,
             poses, proj_mat, args.width, args.height, args.seed,
+            stats=raster_stats, ground_truth=ground_truth,
         )
-        elapsed = time.monotonic() - t0
-        print(f"  Rendered {len(images)} views in {elapsed:.1f}s")
-
-    # 6. Save images
-    print("Saving images...")
-    filenames = save_images(images, args.output, args.exif, args.focal_length)
 
-    # 7. Write metadata
+    print(f"Saving images ({args.workers} encoder threads)...")
+    filenames = iter_save_images(frames, args.output, args.exif,
+                                 args.focal_length, args.workers)
+    n_saved = write_cameras_json(poses, filenames, proj_mat, args.focal_length,
+                                 args.width, args.height, args.output)
+    elapsed = time.monotonic() - t0
+    print(f"  Rendered and saved {n_saved} views in {elapsed:.1f}s")
+    if raster_stats.get("triangles"):
+        print(f"  Rasterized {raster_stats['rasterized']}/{raster_stats['triangles']} "
+              f"triangles after culling")
+
+    # 6. Write metadata
     print("Writing metadata...")
-    write_cameras_json(poses, filenames, proj_mat, args.focal_length,
-                       args.width, args.height, args.output)
+    if ground_truth is not None:
+        ground_truth.close()
+        print(f"  Ground truth: {', '.join(args.emit)} ({args.emit_format})")
     write_scene_info(args, args.output)
 
-    print(f"\nDone! {len(filenames)} images saved to {args.output}")
+    print(f"\nDone! {n_saved} images saved to {args.output}")
 
-    # 8. Validate
+    # 7. Validate
     if args.validate:
         ok = validate_output(args.output, args.views, args.width, args.height)
         return 0 if ok else 1
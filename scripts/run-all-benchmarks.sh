@@ -35,20 +35,9 @@ BENCHMARKS=(
     "design-automation"
     "version-compatibility"
     "rust-vs-nodejs"
+    "cli-startup"
 )
 
-# Initialize combined results
-COMBINED_RESULTS="$REPORT_DIR/combined-results.json"
-cat > "$COMBINED_RESULTS" << EOF
-{
-    "benchmark_run": {
-        "timestamp": "$(date -Iseconds)",
-        "platform": "$(uname -s)",
-        "arch": "$(uname -m)"
-    },
-    "suites": {}
-}
-EOF
 
 # ============================================
 # Generate Test Data (if needed)
@@ -125,72 +114,8 @@ echo "========================================"
 echo "Aggregating Results"
 echo "========================================"
 
-python3 << AGGREGATE
-import json
-import os
-import glob
-
-report_dir = "$REPORT_DIR"
-combined_file = "$COMBINED_RESULTS"
-
-# Load combined results
-with open(combined_file, 'r') as f:
-    combined = json.load(f)
-
-# Find all result files
-result_files = glob.glob(os.path.join(report_dir, '*-results.json'))
-
-for result_file in result_files:
-    if result_file == combined_file:
-        continue
-
-    try:
-        with open(result_file, 'r') as f:
-            data = json.load(f)
-
-        suite_name = data.get('benchmark', os.path.basename(result_file))
-        combined['suites'][suite_name] = data
-        print(f"  Added: {suite_name}")
-    except Exception as e:
-        print(f"  Error reading {result_file}: {e}")
-
-# Calculate summary
-total_claims = 0
-passed_claims = 0
-
-for suite_name, suite_data in combined['suites'].items():
-    if 'claims' in suite_data:
-        for claim in suite_data['claims']:
-            total_claims += 1
-            if claim.get('passed'):
-                passed_claims += 1
-    elif 'tests' in suite_data:
-        for test in suite_data['tests']:
-            total_claims += 1
-            if test.get('status') in ['success', 'mock']:
-                passed_claims += 1
-    elif 'flows' in suite_data:
-        for flow in suite_data['flows']:
-            total_claims += 1
-            if flow.get('status') in ['success', 'available', 'detected']:
-                passed_claims += 1
-
-combined['summary'] = {
-    'total_claims_validated': total_claims,
-    'passed': passed_claims,
-    'failed': total_claims - passed_claims,
-    'pass_rate': round(passed_claims / total_claims * 100, 1) if total_claims > 0 else 0
-}
-
-# Save combined results
-with open(combined_file, 'w') as f:
-    json.dump(combined, f, indent=2)
-
-print()
-print(f"Combined results saved to: {combined_file}")
-print(f"Total validations: {total_claims}")
-print(f"Passed: {passed_claims} ({combined['summary']['pass_rate']}%)")
-AGGREGATE
+PYTHONPATH="$WORKSPACE_DIR/benchmarks${PYTHONPATH:+:$PYTHONPATH}" \
+    python3 -m harness --report-dir "$REPORT_DIR" combine
 
 echo ""
 
@@ -209,6 +134,22 @@ fi
 
 echo ""
 
+# ============================================
+# Compare Against Baseline
+# ============================================
+# Record a baseline with: python3 scripts/bench-compare.py --update
+BASELINE_FILE="${BENCH_BASELINE:-$WORKSPACE_DIR/benchmark-results/baselines.json}"
+REGRESSIONS=0
+if [ -f "$BASELINE_FILE" ]; then
+    echo "========================================"
+    echo "Comparing Against Baseline"
+    echo "========================================"
+
+    python3 "$SCRIPT_DIR/bench-compare.py" "$REPORT_DIR/combined-results.json" \
+        --baseline "$BASELINE_FILE" --output "$REPORT_DIR/bench-compare.md" || REGRESSIONS=1
+    echo ""
+fi
+
 # ============================================
 # Final Summary
 # ============================================
@@ -220,6 +161,7 @@ echo "Suites run:    $TOTAL_TESTS"
 echo "Passed:        $PASSED_TESTS"
 echo "Failed:        $FAILED_TESTS"
 echo "Skipped:       $SKIPPED_TESTS"
+[ -f "$BASELINE_FILE" ] && echo "Regressions:   $([ "$REGRESSIONS" -gt 0 ] && echo yes || echo no)"
 echo ""
 echo "Reports generated in: $REPORT_DIR"
 echo ""
@@ -228,7 +170,7 @@ ls -la "$REPORT_DIR"/*.json 2>/dev/null || echo "  No JSON reports found"
 ls -la "$REPORT_DIR"/*.html 2>/dev/null || echo "  No HTML reports found"
 ls -la "$REPORT_DIR"/*.md 2>/dev/null || echo "  No Markdown reports found"
 
-# Exit with failure if any tests failed
-if [ "$FAILED_TESTS" -gt 0 ]; then
+# Exit with failure if any tests failed or got slower
+if [ "$FAILED_TESTS" -gt 0 ] || [ "$REGRESSIONS" -gt 0 ]; then
     exit 1
 fi
@@ -5,13 +5,18 @@ from __future__ import annotations
 import os
 import re
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
 from .helpers.auth import AuthManager
+from .helpers.cache import CommandCache, format_stats
+from .helpers.retry import Retrier, format_stats as format_retry_stats
 from .helpers.discovery import DiscoveredIds, discover_ids
 from .helpers.json_report import SectionJsonReporter
+from .helpers.profiler import RapsProfilerPlugin
+from .helpers.ratelimit import RateLimiter, format_stats as format_rate_limit_stats, load_limits
 from .helpers.runner import CommandRecord, RapsRunner, build_raps_env, get_command_records, clear_command_records
 from .helpers.test_users import TestUsers
 from .helpers.yr_generator import YrScriptGenerator, _find_yr_binary
@@ -74,6 +79,89 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=4,
         help="Parallel workers for yr rendering (default: 4)",
     )
+    parser.addoption(
+        "--raps-worker",
+        action="store_true",
+        default=False,
+        help="Serve read-only local --output json commands (config, logs, "
+        "template, plugin) from one persistent raps shell instead of a process each",
+    )
+    parser.addoption(
+        "--raps-lifecycle-workers",
+        type=int,
+        default=4,
+        help="Independent lifecycle DAG steps run concurrently, at most this many "
+        "at a time (default: 4; 1 runs them in order)",
+    )
+    parser.addoption(
+        "--raps-cache",
+        action="store_true",
+        default=False,
+        help="Reuse results of read-only commands (list, info, show, get, current) "
+        "until a mutating command in the same family runs",
+    )
+    parser.addoption(
+        "--raps-cache-ttl",
+        type=float,
+        default=30.0,
+        help="Seconds a --raps-cache result stays fresh (default: 30)",
+    )
+    parser.addoption(
+        "--raps-retry-budget",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Retry raps commands that hit rate limits, 5xx, network errors or timeouts, "
+        "with jittered exponential backoff, at most N times per session (default: 0, off)",
+    )
+    parser.addoption(
+        "--raps-no-rate-limit",
+        action="store_true",
+        default=False,
+        help="Don't throttle raps commands to the [tool.raps.rate-limits] quotas in "
+        "pyproject.toml (never applied with --mock)",
+    )
+    parser.addoption(
+        "--raps-capture-window",
+        type=int,
+        default=None,
+        metavar="BYTES",
+        help="Stream command output and keep only its first and last BYTES per stream "
+        "(hash, byte and line counts still cover all of it)",
+    )
+    parser.addoption(
+        "--raps-tee-dir",
+        type=str,
+        default=None,
+        help="Stream command output and write each stream in full to a file per run here",
+    )
+    parser.addoption(
+        "--raps-cpu-limit",
+        type=int,
+        default=None,
+        metavar="SECONDS",
+        help="RLIMIT_CPU for every command (its whole process tree is killed on timeout)",
+    )
+    parser.addoption(
+        "--raps-memory-limit",
+        type=int,
+        default=None,
+        metavar="MIB",
+        help="RLIMIT_AS (address space) for every command",
+    )
+    parser.addoption(
+        "--raps-profile",
+        action="store_true",
+        default=False,
+        help="Time harness phases (spawn, wait, decode, logging, hooks) per SR-ID",
+    )
+    parser.addoption(
+        "--raps-profile-dir",
+        type=str,
+        default=None,
+        help="Output directory for raps-profile.json/.folded "
+        "(default: --json-report-dir, else raps-profile)",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -103,6 +191,17 @@ def pytest_sessionstart(session: pytest.Session) -> None:
             "section_json_reporter",
         )
 
+    if session.config.getoption("--raps-profile", default=False):
+        profile_dir = (
+            session.config.getoption("--raps-profile-dir", default=None)
+            or report_dir
+            or "raps-profile"
+        )
+        session.config.pluginmanager.register(
+            RapsProfilerPlugin(Path(profile_dir)),
+            "raps_profiler",
+        )
+
     generate_yr = session.config.getoption("--generate-yr", default=False)
     render_yr = session.config.getoption("--render-yr", default=False)
     if generate_yr or render_yr:
@@ -120,6 +219,40 @@ def pytest_sessionstart(session: pytest.Session) -> None:
         )
 
 
+# ---------------------------------------------------------------------------
+# --raps-cache session summary
+# ---------------------------------------------------------------------------
+
+# Cache counters per runner: this process's, plus one per xdist worker.
+_CACHE_STATS = pytest.StashKey[list]()
+_RETRY_STATS = pytest.StashKey[list]()
+_RATE_LIMIT_STATS = pytest.StashKey[list]()
+_WORKER_STATS = {
+    "raps_cache": (_CACHE_STATS, format_stats),
+    "raps_retry": (_RETRY_STATS, format_retry_stats),
+    "raps_rate_limit": (_RATE_LIMIT_STATS, format_rate_limit_stats),
+}
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """Collect an xdist worker's cache, retry and rate-limit counters in the controller."""
+    workeroutput = getattr(node, "workeroutput", {})
+    for name, (key, _) in _WORKER_STATS.items():
+        stats = workeroutput.get(name)
+        if stats:
+            node.config.stash.setdefault(key, []).append(stats)
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    for key, fmt in _WORKER_STATS.values():
+        stats = config.stash.get(key, [])
+        if stats:
+            totals = {name: sum(s[name] for s in stats) for name in stats[0]}
+            if any(totals.values()):
+                terminalreporter.write_line(fmt(totals))
+
+
 # ---------------------------------------------------------------------------
 # .yr recording plugin
 # ---------------------------------------------------------------------------
@@ -370,15 +503,46 @@ def users() -> TestUsers:
 @pytest.fixture(scope="session")
 def raps(
     _target: str, _mock_base_url: str, _raps_cwd: str, request: pytest.FixtureRequest
-) -> RapsRunner:
+) -> Iterator[RapsRunner]:
     """Session-scoped RAPS CLI runner."""
     timeout = request.config.getoption("--raps-timeout")
-    return RapsRunner(
+    cache = None
+    if request.config.getoption("--raps-cache"):
+        cache = CommandCache(ttl=request.config.getoption("--raps-cache-ttl"))
+    retry = None
+    if request.config.getoption("--raps-retry-budget") > 0:
+        retry = Retrier(budget=request.config.getoption("--raps-retry-budget"))
+    rate_limiter = None
+    if _target != "mock" and not request.config.getoption("--raps-no-rate-limit"):
+        buckets, state_file = load_limits(request.config.rootpath / "pyproject.toml")
+        if buckets:
+            rate_limiter = RateLimiter(buckets, state_file)
+    runner = RapsRunner(
         target=_target,
         mock_base_url=_mock_base_url,
         timeout=timeout,
         cwd=_raps_cwd,
+        worker=request.config.getoption("--raps-worker"),
+        cache=cache,
+        lifecycle_workers=request.config.getoption("--raps-lifecycle-workers"),
+        capture_window=request.config.getoption("--raps-capture-window"),
+        tee_dir=request.config.getoption("--raps-tee-dir"),
+        cpu_limit=request.config.getoption("--raps-cpu-limit"),
+        memory_limit_mb=request.config.getoption("--raps-memory-limit"),
+        retry=retry,
+        rate_limiter=rate_limiter,
     )
+    yield runner
+    runner.close()
+    sources = {"raps_cache": cache, "raps_retry": retry, "raps_rate_limit": rate_limiter}
+    for name, source in sources.items():
+        if source is None:
+            continue
+        key = _WORKER_STATS[name][0]
+        stats = source.stats()
+        if hasattr(request.config, "workeroutput"):  # xdist worker: report to the controller
+            request.config.workeroutput[name] = stats
+        request.config.stash.setdefault(key, []).append(stats)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -1,4 +1,4 @@
-from .runner import RapsRunner, RunResult, LifecycleContext
+from .runner import RapsRunner, RunResult, LifecycleContext, LifecycleStep
 from .auth import AuthManager
 from .discovery import discover_ids, DiscoveredIds
 from .test_users import TestUsers
@@ -7,6 +7,7 @@ __all__ = [
     "RapsRunner",
     "RunResult",
     "LifecycleContext",
+    "LifecycleStep",
     "AuthManager",
     "discover_ids",
     "DiscoveredIds",
@@ -0,0 +1,140 @@
+"""CommandCache — memoized results of read-only raps commands within a session.
+
+A command is pure when one of its first two words after the resource
+family is a read-only verb (``raps bucket list``, ``raps config profile
+current``); pure commands that succeed are cached, keyed by the resolved
+command and a fingerprint of the runner's environment, for ``ttl``
+seconds. Any other command against a resource family drops that
+family's entries once it has run. Polls of server-side job state
+(``raps translate status``) are read-only but volatile: the job moves
+on with no local write, so they are never cached and invalidate nothing.
+Commands that can change state
+everywhere (profiles, auth, raw API calls, pipelines) and commands the
+cache cannot classify clear it entirely.
+
+Opt-in (pytest --raps-cache): served results may be up to ``ttl``
+seconds stale, which suits load-testing the harness and smoke runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .runner import RunResult
+
+# Verbs that only read. "current" covers `raps config profile current`.
+PURE_VERBS = frozenset({"list", "info", "show", "get", "current"})
+# Read-only verbs whose answer changes on its own (translation and
+# reality-capture job progress).
+VOLATILE_VERBS = frozenset({"status"})
+# Options that make an otherwise read-only command write local files.
+_WRITES_FILES = frozenset({"--out-file", "--out-dir", "--output-dir"})
+# Families whose resources overlap, so a write to one invalidates the others.
+RESOURCE_GROUPS = {
+    "bucket": "oss", "object": "oss", "snapshot": "oss",
+    "hub": "data-management", "project": "data-management",
+    "folder": "data-management", "item": "data-management",
+    "acc": "acc", "issue": "acc", "rfi": "acc", "report": "acc",
+}
+# Families that can change what every other command returns.
+GLOBAL_FAMILIES = frozenset({"config", "auth", "api", "demo", "pipeline"})
+
+PURE = "pure"
+MUTATING = "mutating"
+VOLATILE = "volatile"  # read-only, but never cached
+NEUTRAL = "neutral"    # no remote effect worth tracking (--version, --help)
+
+
+def classify(args: list[str]) -> tuple[str, str | None]:
+    """Classify a raps command (argv without ``raps``): (kind, resource group).
+
+    The group is None when a mutating command may affect every family.
+    """
+    if not args or args[0].startswith("-") or "--help" in args:
+        return NEUTRAL, None
+    family = args[0]
+    words = []
+    for arg in args[1:]:
+        if arg.startswith("-"):
+            break
+        words.append(arg)
+    if PURE_VERBS.intersection(words[:2]) and not _WRITES_FILES.intersection(args):
+        return PURE, RESOURCE_GROUPS.get(family, family)
+    if VOLATILE_VERBS.intersection(words[:2]):
+        return VOLATILE, RESOURCE_GROUPS.get(family, family)
+    if family in GLOBAL_FAMILIES:
+        return MUTATING, None
+    return MUTATING, RESOURCE_GROUPS.get(family, family)
+
+
+def env_fingerprint(env: dict[str, str], cwd: str | None) -> str:
+    """Short stable hash of an environment and working directory."""
+    digest = hashlib.sha256(repr((sorted(env.items()), cwd)).encode())
+    return digest.hexdigest()[:12]
+
+
+@dataclass
+class _Entry:
+    result: RunResult
+    group: str
+    expires: float
+
+
+class CommandCache:
+    """Thread-safe result cache with per-family invalidation."""
+
+    def __init__(self, ttl: float = 30.0) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> RunResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry.result
+
+    def put(self, key: tuple[str, str], group: str, result: RunResult) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(result, group, time.monotonic() + self.ttl)
+
+    def invalidate(self, group: str | None = None) -> None:
+        """Drop one resource group's entries, or every entry when group is None."""
+        with self._lock:
+            stale = [k for k, e in self._entries.items() if group is None or e.group == group]
+            for key in stale:
+                del self._entries[key]
+            self.invalidated += len(stale)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidated": self.invalidated,
+                "entries": len(self._entries),
+            }
+
+
+def format_stats(stats: dict[str, int]) -> str:
+    """One-line session summary of cache counters."""
+    lookups = stats["hits"] + stats["misses"]
+    rate = f" ({stats['hits'] / lookups:.0%} hit rate)" if lookups else ""
+    return (
+        f"raps cache: {stats['hits']} hits, {stats['misses']} misses{rate}, "
+        f"{stats['invalidated']} entries invalidated"
+    )
@@ -0,0 +1,114 @@
+"""StreamCapture — bounded, incremental capture of a child's output pipe.
+
+Reads arrive as raw bytes. The first and last ``window`` bytes are kept
+(everything, when ``window`` is None) along with a running SHA-256, byte
+count and line count over the whole stream, so a command that prints
+hundreds of megabytes costs a fixed amount of memory. Only the retained
+window is decoded, once, when the text is first asked for. The full
+stream can be teed to a file for later inspection.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+
+class StreamCapture:
+    """Head+tail window over one output stream."""
+
+    def __init__(
+        self,
+        *,
+        window: int | None = None,
+        tee: Path | None = None,
+        decode: Callable[..., str] = bytes.decode,
+    ) -> None:
+        self.window = window
+        self.tee = tee
+        self.bytes = 0
+        self._newlines = 0
+        self._last = b""
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._hash = hashlib.sha256()
+        self._decode = decode
+        self._text: str | None = None
+        self._tee_file: BinaryIO | None = tee.open("wb") if tee else None
+
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self.bytes += len(chunk)
+        self._newlines += chunk.count(b"\n")
+        self._last = chunk[-1:]
+        self._hash.update(chunk)
+        if self._tee_file is not None:
+            self._tee_file.write(chunk)
+        if self.window is None:
+            self._head += chunk
+            return
+        room = self.window - len(self._head)
+        if room > 0:
+            self._head += chunk[:room]
+            chunk = chunk[room:]
+        if chunk:
+            self._tail += chunk
+            # Trim in batches so a stream of small reads stays linear.
+            if len(self._tail) > 2 * self.window:
+                del self._tail[:-self.window]
+
+    def pump(self, stream: BinaryIO) -> None:
+        """Feed everything from a pipe until EOF (run in a reader thread)."""
+        read = getattr(stream, "read1", stream.read)
+        try:
+            while chunk := read(65536):
+                self.feed(chunk)
+        except (OSError, ValueError):  # pipe closed under us after a timeout
+            pass
+
+    def close(self) -> None:
+        if self._tee_file is not None:
+            self._tee_file.close()
+            self._tee_file = None
+
+    @property
+    def lines(self) -> int:
+        return self._newlines + (1 if self._last not in (b"", b"\n") else 0)
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    @property
+    def omitted(self) -> int:
+        """Bytes dropped between the head and the tail."""
+        if self.window is None:
+            return 0
+        return max(0, self.bytes - len(self._head) - min(len(self._tail), self.window))
+
+    @property
+    def text(self) -> str:
+        """The retained window, decoded; a marker line stands in for what was dropped."""
+        if self._text is None:
+            if self.omitted:
+                # The cut may split a multi-byte character.
+                head = self._decode(bytes(self._head), errors="replace")
+                tail = self._decode(bytes(self._tail[-self.window:]), errors="replace")
+                self._text = f"{head}\n... [{self.omitted} bytes omitted] ...\n{tail}"
+            else:
+                self._text = self._decode(bytes(self._head + self._tail))
+        return self._text
+
+    def summary(self) -> dict:
+        """Byte/line counts and hash of the full stream, for reports."""
+        info = {
+            "bytes": self.bytes,
+            "lines": self.lines,
+            "sha256": self.sha256,
+            "truncated": self.omitted > 0,
+        }
+        if self.tee is not None:
+            info["tee"] = str(self.tee)
+        return info
@@ -0,0 +1,23 @@
+"""Shared fixtures for the helper unit tests."""
+from __future__ import annotations
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+
+@pytest.fixture
+def fake_raps(tmp_path):
+    """Install a stand-in ``raps`` with the given Python body in tmp_path.
+
+    Returns the env (PATH with tmp_path first) to give RapsRunner.
+    """
+    def install(body: str) -> dict[str, str]:
+        raps = tmp_path / "raps"
+        raps.write_text(f"#!{sys.executable}\n" + textwrap.dedent(body))
+        raps.chmod(0o755)
+        return {"PATH": f"{tmp_path}{os.pathsep}{os.environ['PATH']}"}
+
+    return install
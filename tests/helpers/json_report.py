@@ -14,7 +14,14 @@ from pathlib import Path
 
 import pytest
 
-from .runner import _captured_logs, _captured_codes
+from .runner import (
+    _captured_codes,
+    _captured_logs,
+    _captured_queue,
+    _captured_retries,
+    _captured_steps,
+    _captured_usage,
+)
 
 
 def _parse_worst_cli_exit(sr_id: str) -> int | None:
@@ -25,6 +32,33 @@ def _parse_worst_cli_exit(sr_id: str) -> int | None:
     return max(codes)
 
 
+def _sum_resources(sr_id: str) -> dict:
+    """Resource usage of every command run for sr_id: totals, and the largest peak RSS."""
+    entries = _captured_usage.get(sr_id)
+    if not entries:
+        return {}
+    totals = {key: sum(e[key] for e in entries) for key in entries[0]}
+    totals["user_cpu"] = round(totals["user_cpu"], 3)
+    totals["sys_cpu"] = round(totals["sys_cpu"], 3)
+    totals["max_rss_kb"] = max(e["max_rss_kb"] for e in entries)
+    return totals
+
+
+def _sum_retries(sr_id: str) -> dict:
+    """Retries of sr_id's commands and the backoff they waited, by failure reason."""
+    attempts = _captured_retries.get(sr_id)
+    if not attempts:
+        return {}
+    reasons: dict[str, int] = {}
+    for attempt in attempts:
+        reasons[attempt["reason"]] = reasons.get(attempt["reason"], 0) + 1
+    return {
+        "retries": len(attempts),
+        "retry_reasons": reasons,
+        "backoff_seconds": round(sum(a["backoff_seconds"] for a in attempts), 3),
+    }
+
+
 class SectionJsonReporter:
     """Collect test results and write per-section JSON files."""
 
@@ -125,6 +159,14 @@ class SectionJsonReporter:
         cli_exit = _parse_worst_cli_exit(sr_id)
         if cli_exit is not None:
             run_entry["cli_exit_code"] = cli_exit
+        steps = _captured_steps.get(sr_id)
+        if steps:
+            run_entry["steps"] = steps
+        run_entry.update(_sum_resources(sr_id))
+        run_entry.update(_sum_retries(sr_id))
+        queued = _captured_queue.get(sr_id)
+        if queued:
+            run_entry["queue_seconds"] = round(sum(queued), 3)
 
         self._sections[section_name]["runs"].append(run_entry)
 
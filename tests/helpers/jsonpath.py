@@ -0,0 +1,183 @@
+"""A small JSONPath subset for pulling values out of raps ``--output json``.
+
+Supported: ``$`` followed by ``.name``, ``['name']``, ``[N]``, ``.N``
+(an index into a list, or a key), ``.*`` and ``[*]``; e.g.
+``$.items[*].id`` or ``$.data.metadata[0].guid``.
+
+A compiled path evaluates against parsed data (``find``) or directly
+against JSON text (``stream``): the text is walked along the path one
+value at a time and only the matches are decoded. Values off the path
+are stepped over by scanning for their closing bracket, without being
+built, so taking the ids out of a 100 MB listing never builds the whole
+document, and taking the first stops reading right after it.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import re
+from collections.abc import Iterator
+from typing import Any
+
+_STEP_RE = re.compile(
+    r"\.(?P<name>[A-Za-z_][\w-]*|\d+)|\.(?P<dot_any>\*)"
+    r"|\[(?:(?P<index>\d+)|(?P<any>\*)|'(?P<sq>[^']*)'|\"(?P<dq>[^\"]*)\")\]"
+)
+_WS_RE = re.compile(r"[ \t\n\r]*")
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+# Everything up to the next bracket of a skipped container, consuming
+# strings whole so brackets inside them are not counted.
+_SKIP_RE = re.compile(r'[^"{}\[\]]*(?:' + _STRING + r'[^"{}\[\]]*)*[{}\[\]]', re.S)
+_SCALAR_RE = re.compile(
+    _STRING + r"|-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null|NaN|-?Infinity",
+    re.S,
+)
+_decoder = json.JSONDecoder()
+
+ANY = "*"
+
+
+def json_start(text: str) -> int:
+    """Offset of the JSON document in ``text``, skipping leading log lines."""
+    pos = _WS_RE.match(text).end()
+    if text[pos:pos + 1] in ("{", "["):
+        return pos
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    return min(starts) if starts else pos
+
+
+def parse_json(text: str) -> Any:
+    """The JSON document in ``text`` (see json_start); raises ValueError if there is none."""
+    value, _ = _decoder.raw_decode(text, json_start(text))
+    return value
+
+
+class JsonPath:
+    """A compiled path: a sequence of keys, list indices and wildcards."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        # Each step is a dict key (str), a list index (int) or ANY.
+        # A bare ``.N`` matches key "N" in an object and index N in a list.
+        self.steps: list[str | int] = []
+        rest = path.strip()
+        if not rest.startswith("$"):
+            raise ValueError(f"JSON path must start with '$': {path!r}")
+        pos = 1
+        while pos < len(rest):
+            m = _STEP_RE.match(rest, pos)
+            if not m:
+                raise ValueError(f"bad JSON path {path!r} at offset {pos}")
+            if m["index"] is not None:
+                self.steps.append(int(m["index"]))
+            elif m["any"] or m["dot_any"]:
+                self.steps.append(ANY)
+            else:
+                self.steps.append(next(g for g in (m["name"], m["sq"], m["dq"]) if g is not None))
+            pos = m.end()
+
+    def __repr__(self) -> str:
+        return f"JsonPath({self.path!r})"
+
+    def find(self, data: Any) -> list:
+        """Every value at this path in parsed data."""
+        nodes = [data]
+        for step in self.steps:
+            matched = []
+            for node in nodes:
+                if isinstance(node, dict):
+                    if step is ANY:
+                        matched.extend(node.values())
+                    elif isinstance(step, str) and step in node:
+                        matched.append(node[step])
+                elif isinstance(node, list):
+                    if step is ANY:
+                        matched.extend(node)
+                    elif (i := _as_index(step)) is not None and i < len(node):
+                        matched.append(node[i])
+            nodes = matched
+        return nodes
+
+    def stream(self, text: str) -> Iterator[Any]:
+        """Values at this path in JSON text, decoded lazily in document order.
+
+        Stops quietly at malformed JSON, yielding what was found before it.
+        """
+        try:
+            yield from self._walk(text, json_start(text), 0)
+        except (ValueError, IndexError):
+            return
+
+    def _walk(self, text: str, pos: int, depth: int):
+        """Yield matches in the value at ``pos``; return the offset after it."""
+        pos = _WS_RE.match(text, pos).end()
+        if depth == len(self.steps):
+            value, end = _decoder.raw_decode(text, pos)
+            yield value
+            return end
+        step = self.steps[depth]
+        opener = text[pos]
+        if opener not in "{[":
+            return _skip(text, pos)
+        closer = "}" if opener == "{" else "]"
+        pos = _WS_RE.match(text, pos + 1).end()
+        if text[pos] == closer:
+            return pos + 1
+        index = 0
+        while True:
+            if opener == "{":
+                key, pos = _decoder.raw_decode(text, pos)
+                pos = _WS_RE.match(text, pos).end()
+                if text[pos] != ":":
+                    raise ValueError(f"expected ':' at offset {pos}")
+                hit = step is ANY or step == key
+                pos += 1
+            else:
+                hit = step is ANY or _as_index(step) == index
+            if hit:
+                pos = yield from self._walk(text, pos, depth + 1)
+            else:
+                pos = _skip(text, pos)
+            pos = _WS_RE.match(text, pos).end()
+            if text[pos] == closer:
+                return pos + 1
+            if text[pos] != ",":
+                raise ValueError(f"expected ',' or {closer!r} at offset {pos}")
+            pos = _WS_RE.match(text, pos + 1).end()
+            index += 1
+
+
+def _as_index(step: str | int) -> int | None:
+    if isinstance(step, int):
+        return step
+    return int(step) if step.isdigit() else None
+
+
+def _skip(text: str, pos: int) -> int:
+    """Offset just after the JSON value starting at ``pos``, found without decoding it.
+
+    Only strings and brackets are tracked; a malformed value is caught
+    when the walk resumes after it, or as ValueError if it never ends.
+    """
+    pos = _WS_RE.match(text, pos).end()
+    if text[pos] not in "{[":
+        m = _SCALAR_RE.match(text, pos)
+        if not m:
+            raise ValueError(f"expected a JSON value at offset {pos}")
+        return m.end()
+    depth = 0
+    while m := _SKIP_RE.match(text, pos):
+        pos = m.end()
+        if text[pos - 1] in "{[":
+            depth += 1
+        else:
+            depth -= 1
+            if not depth:
+                return pos
+    raise ValueError(f"unterminated JSON value at offset {pos}")
+
+
+@functools.lru_cache(maxsize=256)
+def compile_path(path: str) -> JsonPath:
+    return JsonPath(path)
@@ -0,0 +1,188 @@
+"""Opt-in harness overhead profiler (``pytest --raps-profile``).
+
+Times the phases of each sample run with ``perf_counter_ns`` so the
+harness's own cost (env setup, command parsing, spawn, wait, decode,
+log bookkeeping, pytest hooks) can be told apart from raps itself.
+
+Phases nest: each recorded stack starts with the SR-ID it ran under,
+e.g. ``SR-051;call;run;spawn``. Results are written as a per-SR JSON
+breakdown and as collapsed stacks (one ``frame;frame;frame value`` line
+per stack, value in microseconds) that flamegraph.pl, inferno or
+speedscope render directly.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Root frame for phases that run outside any SR (session fixtures, setup).
+NO_SR = "(session)"
+
+_enabled = False
+# (root, frame, frame, ...) -> [count, total_ns]; self time is derived at write time.
+_stacks: dict[tuple[str, ...], list[int]] = {}
+_stacks_lock = threading.Lock()
+_local = threading.local()
+
+
+def enable_profiling(enabled: bool = True) -> None:
+    """Turn phase timing on or off for this process."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_profiling() -> bool:
+    return _enabled
+
+
+def clear_profile() -> None:
+    with _stacks_lock:
+        _stacks.clear()
+
+
+def get_profile() -> dict[tuple[str, ...], tuple[int, int]]:
+    """Snapshot of stack -> (count, total_ns), totals inclusive of children."""
+    with _stacks_lock:
+        return {stack: (count, total) for stack, (count, total) in _stacks.items()}
+
+
+@contextlib.contextmanager
+def _timed(name: str, sr_id: str):
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    if not stack:
+        stack.append(sr_id.split("/")[0] if sr_id else NO_SR)
+    stack.append(name)
+    key = tuple(stack)
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter_ns() - start
+        stack.pop()
+        if len(stack) == 1:
+            stack.pop()
+        with _stacks_lock:
+            entry = _stacks.setdefault(key, [0, 0])
+            entry[0] += 1
+            entry[1] += elapsed
+
+
+_NULL = contextlib.nullcontext()
+
+
+def phase(name: str, sr_id: str = ""):
+    """Context manager timing one phase; a no-op unless profiling is enabled.
+
+    ``sr_id`` names the root frame when this is the outermost phase on
+    the current thread; nested phases inherit their parent's root.
+    """
+    if not _enabled:
+        return _NULL
+    return _timed(name, sr_id)
+
+
+def _self_times(profile: dict[tuple[str, ...], tuple[int, int]]) -> dict[tuple[str, ...], int]:
+    """Exclusive ns per stack: inclusive total minus direct children's totals."""
+    own = {stack: total for stack, (_, total) in profile.items()}
+    for stack, (_, total) in profile.items():
+        parent = stack[:-1]
+        if len(parent) > 1 and parent in own:
+            own[parent] -= total
+    return {stack: max(ns, 0) for stack, ns in own.items()}
+
+
+def write_profile(output_dir: Path, worker: str | None = None) -> tuple[Path, Path]:
+    """Write the per-SR breakdown (JSON) and collapsed stacks (.folded).
+
+    Under pytest-xdist each worker writes its own pair of files, suffixed
+    with the worker id; concatenated .folded files form one flame graph.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    suffix = f"-{worker}" if worker else ""
+    profile = get_profile()
+
+    breakdown: dict[str, dict[str, dict]] = {}
+    for stack, (count, total) in sorted(profile.items()):
+        breakdown.setdefault(stack[0], {})[";".join(stack[1:])] = {
+            "count": count,
+            "total_ms": round(total / 1e6, 3),
+        }
+    json_path = output_dir / f"raps-profile{suffix}.json"
+    json_path.write_text(json.dumps(breakdown, indent=2), encoding="utf-8")
+
+    folded_path = output_dir / f"raps-profile{suffix}.folded"
+    lines = [
+        f"{';'.join(stack)} {ns // 1000}"
+        for stack, ns in sorted(_self_times(profile).items())
+        if ns >= 1000
+    ]
+    folded_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return json_path, folded_path
+
+
+def phase_totals() -> dict[str, tuple[int, int]]:
+    """Leaf phase name -> (count, self ns) summed over all SRs."""
+    totals: dict[str, list[int]] = {}
+    profile = get_profile()
+    for stack, ns in _self_times(profile).items():
+        entry = totals.setdefault(stack[-1], [0, 0])
+        entry[0] += profile[stack][0]
+        entry[1] += ns
+    return {name: (count, ns) for name, (count, ns) in totals.items()}
+
+
+def xdist_worker() -> str | None:
+    """pytest-xdist worker id (gw0, gw1, ...) or None in the controller."""
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+def _item_sr_id(item: pytest.Item) -> str:
+    for marker in item.iter_markers("sr"):
+        return marker.args[0] if marker.args else ""
+    return ""
+
+
+class RapsProfilerPlugin:
+    """Pytest plugin that times test phases and writes the profile at session end."""
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = output_dir
+        enable_profiling(True)
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_setup(self, item: pytest.Item):
+        with phase("setup", _item_sr_id(item)):
+            yield
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_call(self, item: pytest.Item):
+        with phase("call", _item_sr_id(item)):
+            yield
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_teardown(self, item: pytest.Item):
+        with phase("teardown", _item_sr_id(item)):
+            yield
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call):
+        with phase("report_hooks", _item_sr_id(item)):
+            yield
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        json_path, folded_path = write_profile(self.output_dir, xdist_worker())
+        totals = sorted(phase_totals().items(), key=lambda kv: kv[1][1], reverse=True)
+        lines = ["", f"raps-profile: wrote {json_path} and {folded_path}"]
+        for name, (count, ns) in totals[:10]:
+            lines.append(f"  {name:<16} {ns / 1e6:>10.1f} ms self  ({count} calls)")
+        sys.stderr.write("\n".join(lines) + "\n")
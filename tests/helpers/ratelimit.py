@@ -0,0 +1,149 @@
+"""RateLimiter — client-side token buckets per APS API family, shared across processes.
+
+Each family (OSS, Model Derivative, ACC Issues, Admin, ...) has a bucket
+that refills at ``per-minute / 60`` tokens a second up to ``burst``.
+Every raps invocation in the family takes one token; when the bucket is
+empty the caller sleeps until its token is due. The buckets live in one
+small JSON state file that every process updates under ``flock``, so
+all xdist workers on the machine draw from the same quota.
+
+A token is taken by letting the bucket go into debt and sleeping off the
+debt after the lock is released, so callers are served in the order they
+arrived and the lock is never held while waiting.
+
+Configured in pyproject.toml::
+
+    [tool.raps.rate-limits]
+    state-file = "/tmp/raps-rate-limits.json"   # optional
+
+    [tool.raps.rate-limits.oss]
+    per-minute = 600
+    burst = 20
+    commands = ["bucket", "object"]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: buckets are shared by threads of one process only
+    fcntl = None
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+DEFAULT_STATE_FILE = Path(tempfile.gettempdir()) / "raps-rate-limits.json"
+
+
+@dataclass(frozen=True)
+class Bucket:
+    """Quota of one API family."""
+
+    name: str
+    per_minute: float
+    burst: int
+    commands: frozenset[str]
+
+    @property
+    def rate(self) -> float:
+        """Tokens per second."""
+        return self.per_minute / 60
+
+
+def load_limits(pyproject: Path) -> tuple[list[Bucket], Path]:
+    """Buckets and state file from ``[tool.raps.rate-limits]`` (no buckets if absent)."""
+    if tomllib is None or not pyproject.is_file():
+        return [], DEFAULT_STATE_FILE
+    with pyproject.open("rb") as f:
+        section = tomllib.load(f).get("tool", {}).get("raps", {}).get("rate-limits", {})
+    buckets = [
+        Bucket(
+            name=name,
+            per_minute=float(table["per-minute"]),
+            burst=int(table.get("burst", 1)),
+            commands=frozenset(table.get("commands", [])),
+        )
+        for name, table in section.items()
+        if isinstance(table, dict)
+    ]
+    state_file = Path(section.get("state-file", DEFAULT_STATE_FILE))
+    return buckets, state_file
+
+
+class RateLimiter:
+    """Token buckets keyed by raps family (``bucket``, ``translate``, ...)."""
+
+    def __init__(self, buckets: list[Bucket], state_file: Path = DEFAULT_STATE_FILE) -> None:
+        self.buckets = buckets
+        self.state_file = Path(state_file)
+        self._by_command = {command: b for b in buckets for command in b.commands}
+        # Serializes this process's threads; flock (per open file) covers the
+        # other processes.
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def bucket_for(self, args: list[str] | None) -> Bucket | None:
+        """The bucket a raps command (argv without ``raps``) draws from, if any."""
+        if not args:
+            return None
+        return self._by_command.get(args[0])
+
+    def acquire(self, args: list[str] | None) -> float:
+        """Take a token for a raps command, sleeping until it is due; returns the wait."""
+        bucket = self.bucket_for(args)
+        if bucket is None:
+            return 0.0
+        wait = self._reserve(bucket)
+        if wait > 0:
+            time.sleep(wait)
+            with self._stats_lock:
+                self.waits += 1
+                self.wait_seconds += wait
+        return round(wait, 3)
+
+    def _reserve(self, bucket: Bucket) -> float:
+        """Take a token, on credit if need be, under the file lock; return the debt in seconds."""
+        with self._lock:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.state_file, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                with os.fdopen(os.dup(fd), "r+", encoding="utf-8") as f:
+                    try:
+                        state = json.loads(f.read() or "{}")
+                    except ValueError:  # torn by a crash; start over with full buckets
+                        state = {}
+                    now = time.time()
+                    tokens, last = state.get(bucket.name, (bucket.burst, now))
+                    tokens = min(bucket.burst, tokens + (now - last) * bucket.rate) - 1
+                    state[bucket.name] = (tokens, now)
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+            finally:
+                os.close(fd)  # releases the flock
+        return max(0.0, -tokens / bucket.rate)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {"waits": self.waits, "wait_seconds": round(self.wait_seconds, 3)}
+
+
+def format_stats(stats: dict) -> str:
+    return f"raps rate limit: {stats['waits']} commands queued ({stats['wait_seconds']:.1f}s)"
@@ -0,0 +1,157 @@
+"""Retrier — retrying raps commands that failed for transient APS reasons.
+
+A failed command is classified from its exit code and stderr: rate
+limited (429, "Too Many Requests"), server error (500/502/503/504),
+network trouble (connection reset/refused, DNS) or timeout. Anything
+else — usage errors, 4xx, a missing binary, a process killed by a
+signal — is a real failure and is returned as is.
+
+Each raps family has a RetryPolicy: how many retries, and the base and
+cap of the exponential backoff. Delays use full jitter, a uniform draw
+from [0, min(cap, base * 2**attempt)], so parallel xdist workers that
+hit the same limit do not retry in lockstep; a ``Retry-After`` hint in
+stderr is honoured up to the cap. Commands that change state are only
+retried when rate limited, since the request was refused before it was
+processed. A budget caps the retries of a whole session (one per xdist
+worker) so an APS outage degrades into failures instead of stalling
+every test for its full backoff.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+
+from .cache import PURE, VOLATILE, classify
+
+RATE_LIMITED = "rate-limited"
+SERVER_ERROR = "server-error"
+NETWORK = "network"
+TIMEOUT = "timeout"
+
+_REASON_RES = (
+    (RATE_LIMITED, re.compile(r"\b429\b|too many requests|rate.?limit|throttl", re.I)),
+    (SERVER_ERROR, re.compile(
+        r"\b50[0234]\b|internal server error|bad gateway|service unavailable|gateway time-?out",
+        re.I,
+    )),
+    (NETWORK, re.compile(
+        r"connection (?:reset|refused|closed|aborted)|broken pipe|error sending request"
+        r"|dns error|failed to lookup address|temporary failure in name resolution",
+        re.I,
+    )),
+)
+_RETRY_AFTER_RE = re.compile(r"retry[- ]after\D{0,3}(\d+(?:\.\d+)?)", re.I)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retries and backoff (seconds) for one raps family."""
+
+    retries: int = 2
+    base: float = 0.5
+    cap: float = 8.0
+
+    def delay(self, attempt: int, rng: random.Random, retry_after: float | None = None) -> float:
+        """Full-jitter backoff before retry ``attempt`` (0-based)."""
+        delay = rng.uniform(0, min(self.cap, self.base * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.cap))
+        return round(delay, 3)
+
+
+DEFAULT_POLICY = RetryPolicy()
+POLICIES = {
+    # Model Derivative and Reality Capture throttle hardest and recover slowest.
+    "translate": RetryPolicy(retries=4, base=1.0, cap=30.0),
+    "reality": RetryPolicy(retries=4, base=1.0, cap=30.0),
+    "admin": RetryPolicy(retries=3, base=1.0, cap=15.0),
+    "acc": RetryPolicy(retries=3, base=1.0, cap=15.0),
+    "issue": RetryPolicy(retries=3, base=1.0, cap=15.0),
+    "rfi": RetryPolicy(retries=3, base=1.0, cap=15.0),
+    # Local commands never reach APS.
+    "config": RetryPolicy(retries=0),
+    "logs": RetryPolicy(retries=0),
+    "plugin": RetryPolicy(retries=0),
+}
+
+
+def classify_failure(exit_code: int, stderr: str, timed_out: bool = False) -> str | None:
+    """Why a command failed, if the failure is transient (else None)."""
+    if timed_out or exit_code == 124:
+        return TIMEOUT
+    if exit_code == 0 or exit_code in (126, 127) or exit_code > 128 or exit_code < 0:
+        return None
+    for reason, pattern in _REASON_RES:
+        if pattern.search(stderr):
+            return reason
+    return None
+
+
+class Retrier:
+    """Thread-safe retry decisions and a per-session retry budget."""
+
+    def __init__(
+        self,
+        *,
+        budget: int = 50,
+        policies: dict[str, RetryPolicy] | None = None,
+        default: RetryPolicy = DEFAULT_POLICY,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.budget = budget
+        self.policies = POLICIES if policies is None else policies
+        self.default = default
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.backoff_seconds = 0.0
+        self.exhausted = 0    # retryable failures returned because the budget ran out
+
+    def policy(self, args: list[str]) -> RetryPolicy:
+        return self.policies.get(args[0], self.default) if args else self.default
+
+    def backoff(
+        self, args: list[str], reason: str | None, attempt: int, stderr: str = "",
+    ) -> float | None:
+        """Seconds to wait before retrying a failed raps command, or None to give up.
+
+        ``args`` is the argv without ``raps``; ``attempt`` counts retries so far.
+        """
+        if reason is None:
+            return None
+        policy = self.policy(args)
+        if attempt >= policy.retries:
+            return None
+        if reason != RATE_LIMITED and classify(args)[0] not in (PURE, VOLATILE):
+            return None
+        hint = _RETRY_AFTER_RE.search(stderr)
+        with self._lock:
+            if self.retries >= self.budget:
+                self.exhausted += 1
+                return None
+            delay = policy.delay(attempt, self._rng, float(hint[1]) if hint else None)
+            self.retries += 1
+            self.backoff_seconds += delay
+        return delay
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "backoff_seconds": round(self.backoff_seconds, 3),
+                "exhausted": self.exhausted,
+            }
+
+
+def format_stats(stats: dict) -> str:
+    line = f"raps retries: {stats['retries']} ({stats['backoff_seconds']:.1f}s backoff)"
+    if stats["exhausted"]:
+        line += f", budget exhausted for {stats['exhausted']} failures"
+    return line
@@ -3,16 +3,44 @@
 from __future__ import annotations
 
 import functools
+import itertools
+import locale
 import math
 import os
 import re
 import shlex
 import shutil
+import signal
 import subprocess
 import sys
 import threading
 import time
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+from .cache import MUTATING, PURE, VOLATILE, CommandCache, classify, env_fingerprint
+from .capture import StreamCapture
+from .jsonpath import compile_path, parse_json
+from .profiler import phase
+from .ratelimit import RateLimiter
+from .retry import Retrier, classify_failure
+from .worker import RapsWorker, WorkerError, proves_success, worker_eligible
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_POSIX = os.name == "posix"
+# Output at least this long is streamed by RunResult.extract instead of parsed whole.
+STREAM_THRESHOLD = 1 << 20
+# RunResult fields filled from a child's wait4 rusage.
+USAGE_FIELDS = (
+    "user_cpu", "sys_cpu", "max_rss_kb", "voluntary_ctx_switches", "involuntary_ctx_switches",
+)
 
 
 # ---------------------------------------------------------------------------
@@ -23,6 +51,14 @@ from dataclasses import dataclass, field
 _captured_logs: dict[str, str] = {}
 # Maps base SR-ID -> list of CLI exit codes (structured, avoids log-text parsing)
 _captured_codes: dict[str, list[int]] = {}
+# Maps base SR-ID -> per-step entries of shell-free command lists
+_captured_steps: dict[str, list[dict]] = {}
+# Maps base SR-ID -> wait4 resource usage and output bytes of each spawned command
+_captured_usage: dict[str, list[dict]] = {}
+# Maps base SR-ID -> failed attempts that were retried (see retry.py)
+_captured_retries: dict[str, list[dict]] = {}
+# Maps base SR-ID -> seconds each command waited for a rate-limit token (see ratelimit.py)
+_captured_queue: dict[str, list[float]] = {}
 # Tracks whether each base SR-ID received a "direct" or "step" log entry.
 # Used to detect accidental reuse of the same SR-ID for both types.
 _log_types: dict[str, str] = {}  # base_id -> "direct" | "step"
@@ -44,6 +80,8 @@ class CommandRecord:
     duration: float
     exit_code: int
     timed_out: bool
+    max_rss_kb: int | None = None
+    cpu_seconds: float | None = None
 
 
 _command_records: list[CommandRecord] = []
@@ -83,7 +121,18 @@ def _store_log(sr_id: str, result: "RunResult") -> None:
 
     status = "TIMEOUT" if result.timed_out else f"exit {result.exit_code}"
     lines = [f"[{sr_id}] {result.slug}: {result.command}"]
-    lines.append(f"  -> {status} ({result.duration}s)")
+    via = ", worker" if result.worker else ", cached" if result.cached else ""
+    lines.append(f"  -> {status} ({result.duration}s{via})")
+    if result.queue_seconds:
+        lines.append(f"     queued {result.queue_seconds}s for the client-side rate limit")
+    for n, attempt in enumerate(result.retries, 1):
+        lines.append(
+            f"     retry {n}: {attempt['reason']} (exit {attempt['exit_code']}, "
+            f"{attempt['duration_seconds']}s), backoff {attempt['backoff_seconds']}s"
+        )
+    for step in result.steps:
+        step_status = "TIMEOUT" if step.timed_out else f"exit {step.exit_code}"
+        lines.append(f"     step: {step.command} -> {step_status} ({step.duration}s)")
     if result.stdout.strip():
         lines.append(result.stdout.strip()[:3000])
     if result.stderr.strip():
@@ -97,13 +146,41 @@ def _store_log(sr_id: str, result: "RunResult") -> None:
         code = 124 if result.timed_out else result.exit_code
         _captured_codes.setdefault(base_id, [])
         _captured_codes[base_id].append(code)
+        if result.steps:
+            _captured_steps.setdefault(base_id, []).extend(
+                {
+                    "command": step.command,
+                    "exit_code": 124 if step.timed_out else step.exit_code,
+                    "duration_seconds": step.duration,
+                    **step.resources(),
+                    **({"queue_seconds": step.queue_seconds} if step.queue_seconds else {}),
+                }
+                for step in result.steps
+            )
+        if result.user_cpu is not None:
+            _captured_usage.setdefault(base_id, []).append(result.resources())
+        if result.retries:
+            _captured_retries.setdefault(base_id, []).extend(result.retries)
+        if result.queue_seconds:
+            _captured_queue.setdefault(base_id, []).append(result.queue_seconds)
+
+
+def _append_log(sr_id: str, text: str) -> None:
+    """Append a free-form line (e.g. a lifecycle summary) to an SR-ID's log."""
+    with _captured_lock:
+        _captured_logs.setdefault(sr_id.split("/")[0], "")
+        _captured_logs[sr_id.split("/")[0]] += text + "\n"
 
 
 def clear_captured_logs() -> None:
-    """Clear accumulated logs, codes, and type tracking."""
+    """Clear accumulated logs, codes, steps, and type tracking."""
     with _captured_lock:
         _captured_logs.clear()
         _captured_codes.clear()
+        _captured_steps.clear()
+        _captured_usage.clear()
+        _captured_retries.clear()
+        _captured_queue.clear()
         _log_types.clear()
 
 
@@ -125,6 +202,82 @@ def _find_bash() -> str | None:
 # Shell metacharacters that require bash -c wrapping
 _NEEDS_SHELL_RE = re.compile(r'[|&;<>`$]|2>&1|/dev/')
 
+# ---------------------------------------------------------------------------
+# Shell-free command lists
+# ---------------------------------------------------------------------------
+# `raps a; raps b && raps c 2>&1` is common in the catalog and needs no
+# real shell: it is split here and each raps invocation run directly.
+# Anything else a shell would have to interpret falls back to bash.
+
+_QUOTED_RE = re.compile(r"'[^']*'|\"[^\"]*\"")
+# Characters that make a quoted string ambiguous to the parser or subject to expansion.
+_QUOTED_UNSAFE_RE = re.compile(r"[;&<>|$`\\!]")
+_MERGE_STDERR_RE = re.compile(r"(?<!\S)2>&1(?=\s|;|&&|$)")
+# Pipes, other redirections, expansions, globs, subshells, background jobs, escapes.
+_COMPLEX_SHELL_RE = re.compile(r"[|<>`$()*?\[\]{}~#!\\\n]|(?<!&)&(?!&)|&&&")
+
+
+@dataclass
+class ListStep:
+    """One simple command of a `;`/`&&` command list."""
+
+    argv: list[str]
+    merge_stderr: bool = False   # trailing 2>&1
+    operator: str = ""           # ";" or "&&" joining it to the previous step
+
+    @property
+    def text(self) -> str:
+        return shlex.join(self.argv) + (" 2>&1" if self.merge_stderr else "")
+
+
+def parse_command_list(command: str) -> list[ListStep] | None:
+    """Split a `;`/`&&` list of raps commands, or return None if it needs a real shell.
+
+    Only `;`, `&&` and `2>&1` are understood, and every step must be a
+    raps invocation; pipes, other redirections, variables, globs and
+    quoting that hides any of these all return None.
+    """
+    for quoted in _QUOTED_RE.findall(command):
+        if _QUOTED_UNSAFE_RE.search(quoted):
+            return None
+    bare = _MERGE_STDERR_RE.sub(" ", _QUOTED_RE.sub("q", command))
+    if _COMPLEX_SHELL_RE.search(bare):
+        return None
+
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=";&>")
+    lexer.whitespace_split = True
+    try:
+        tokens = list(lexer)
+    except ValueError:  # unbalanced quotes
+        return None
+
+    steps: list[ListStep] = []
+    current = ListStep(argv=[])
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok in (";", "&&"):
+            if not current.argv:
+                return None
+            steps.append(current)
+            current = ListStep(argv=[], operator=tok)
+        elif tok == "2" and tokens[i + 1:i + 3] == [">&", "1"]:
+            # Only a whole-word 2>&1 survives the checks above.
+            current.merge_stderr = True
+            i += 2
+        elif set(tok) <= set(";&>"):
+            return None
+        else:
+            current.argv.append(tok)
+        i += 1
+    if current.argv:
+        steps.append(current)
+    elif current.operator == "&&":
+        return None
+    if not steps or any(step.argv[0] != "raps" for step in steps):
+        return None
+    return steps
+
 
 def _raps_bin_dir(cwd: str | None) -> str | None:
     """Return directory containing raps binary built from raps repo, or None."""
@@ -220,6 +373,98 @@ def _resolve_raps_command(command: str, raps_bin: str | None, bash: str | None =
     return path + " " + command[5:]
 
 
+def _decode(data: bytes, errors: str = "strict") -> str:
+    """Decode captured output exactly as ``text=True`` would."""
+    text = data.decode(locale.getpreferredencoding(False), errors)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+# Sets the limits, then execs the real command in the same process. preexec_fn
+# would do the same in the forked child, but it is unsafe while other threads
+# hold locks (pumps, reapers and LifecycleContext workers always are).
+_LIMIT_SHIM = """\
+import os, resource, sys
+cpu, mem = int(sys.argv[1]), int(sys.argv[2]) << 20
+if cpu:
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+if mem:
+    resource.setrlimit(resource.RLIMIT_AS, (mem, mem))
+try:
+    os.execvp(sys.argv[3], sys.argv[3:])
+except FileNotFoundError:
+    sys.stderr.write(f"{sys.argv[3]}: command not found\\n")
+    sys.exit(127)
+except OSError as e:
+    sys.stderr.write(f"{sys.argv[3]}: {e.strerror}\\n")
+    sys.exit(126)
+"""
+
+
+def _limit_wrapper(cpu_seconds: int | None, memory_mb: int | None) -> list[str]:
+    """Argv prefix that runs a command under CPU-time and address-space limits.
+
+    The limits are inherited by grandchildren. util-linux ``prlimit`` is
+    used when installed; otherwise a ``python -c`` shim (``_LIMIT_SHIM``).
+    """
+    prlimit = shutil.which("prlimit")
+    if prlimit:
+        args = [prlimit]
+        if cpu_seconds:
+            # The soft limit sends SIGXCPU; the hard limit a second later, SIGKILL.
+            args.append(f"--cpu={cpu_seconds}:{cpu_seconds + 1}")
+        if memory_mb:
+            args.append(f"--as={memory_mb * 1024 * 1024}")
+        return args + ["--"]
+    return [sys.executable, "-c", _LIMIT_SHIM, str(cpu_seconds or 0), str(memory_mb or 0)]
+
+
+def _reap(proc: subprocess.Popen, usage: dict) -> None:
+    """Wait for a child (reaper thread), keeping its rusage where wait4 exists."""
+    if not hasattr(os, "wait4"):
+        proc.wait()
+        return
+    try:
+        _, status, rusage = os.wait4(proc.pid, 0)
+    except ChildProcessError:
+        return
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere.
+    usage["user_cpu"] = round(rusage.ru_utime, 3)
+    usage["sys_cpu"] = round(rusage.ru_stime, 3)
+    usage["max_rss_kb"] = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    usage["voluntary_ctx_switches"] = rusage.ru_nvcsw
+    usage["involuntary_ctx_switches"] = rusage.ru_nivcsw
+
+
+def _sum_usage(results: list[RunResult]) -> dict:
+    """Usage of a command list: summed over its steps, peak RSS the largest."""
+    measured = [r for r in results if r.user_cpu is not None]
+    if not measured:
+        return {}
+    usage = {name: sum(getattr(r, name) for r in measured) for name in USAGE_FIELDS}
+    usage["user_cpu"] = round(usage["user_cpu"], 3)
+    usage["sys_cpu"] = round(usage["sys_cpu"], 3)
+    usage["max_rss_kb"] = max(r.max_rss_kb for r in measured)
+    return usage
+
+
+def _kill_tree(proc: subprocess.Popen) -> None:
+    """Kill a child and everything in its session."""
+    if not _POSIX:
+        proc.kill()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _warn_worker_fallback(reason: str) -> None:
+    """Warn that the persistent worker is off and commands are spawned again."""
+    import warnings as _warnings
+    _warnings.warn(f"{reason}; spawning a process per command instead", stacklevel=4)
+
+
 @dataclass
 class RunResult:
     """Result of a single RAPS CLI invocation."""
@@ -232,14 +477,121 @@ class RunResult:
     stderr: str
     duration: float
     timed_out: bool = False
+    # Per-step results when a `;`/`&&` command list ran without a shell.
+    steps: list[RunResult] = field(default_factory=list)
+    # Served by the persistent raps worker instead of a fresh process.
+    worker: bool = False
+    # Replayed from the read-only command cache; nothing was run.
+    cached: bool = False
+    # Full-stream bytes, lines, sha256, truncated and tee path per stream
+    # ("stdout", "stderr"); see capture.py.
+    output: dict[str, dict] = field(default_factory=dict)
+    # wait4 accounting for the process tree (None when nothing was spawned,
+    # or the platform has no wait4). CPU in seconds.
+    user_cpu: float | None = None
+    sys_cpu: float | None = None
+    max_rss_kb: int | None = None
+    voluntary_ctx_switches: int | None = None
+    involuntary_ctx_switches: int | None = None
+    # Earlier attempts that failed transiently and were retried: reason,
+    # exit_code, duration_seconds, backoff_seconds (see retry.py). duration
+    # covers every attempt and the backoff between them.
+    retries: list[dict] = field(default_factory=list)
+    # Seconds spent waiting for rate-limit tokens before running; not in duration.
+    queue_seconds: float = 0.0
 
     @property
     def ok(self) -> bool:
         return self.exit_code == 0 and not self.timed_out
 
+    @property
+    def backoff_seconds(self) -> float:
+        return round(sum(attempt["backoff_seconds"] for attempt in self.retries), 3)
+
+    @property
+    def cpu_seconds(self) -> float | None:
+        if self.user_cpu is None:
+            return None
+        return round(self.user_cpu + self.sys_cpu, 3)
+
+    @property
+    def stdout_bytes(self) -> int | None:
+        return self.output.get("stdout", {}).get("bytes")
+
+    @property
+    def stderr_bytes(self) -> int | None:
+        return self.output.get("stderr", {}).get("bytes")
+
+    @functools.cached_property
+    def json(self) -> Any:
+        """stdout's JSON document, parsed once (None if stdout holds no JSON)."""
+        try:
+            return parse_json(self.stdout)
+        except ValueError:
+            return None
+
+    def extract(self, path: str) -> list:
+        """Every value at a JSON path in stdout, e.g. ``extract("$.items[*].id")``.
+
+        Uses the parsed ``json`` when it is small or already parsed;
+        large output is streamed instead, decoding only what is on the path.
+        """
+        compiled = compile_path(path)
+        if "json" in self.__dict__ or len(self.stdout) < STREAM_THRESHOLD:
+            return compiled.find(self.json) if self.json is not None else []
+        return list(compiled.stream(self.stdout))
+
+    def extract_first(self, path: str, default: Any = None) -> Any:
+        """The first value at a JSON path in stdout, or ``default``."""
+        compiled = compile_path(path)
+        if "json" in self.__dict__ or len(self.stdout) < STREAM_THRESHOLD:
+            matches = compiled.find(self.json) if self.json is not None else []
+            return matches[0] if matches else default
+        return next(compiled.stream(self.stdout), default)
+
+    def resources(self) -> dict:
+        """wait4 usage and output sizes, as recorded in the JSON reports."""
+        if self.user_cpu is None:
+            return {}
+        entry = {name: getattr(self, name) for name in USAGE_FIELDS}
+        parts = self.steps or [self]
+        entry["stdout_bytes"] = sum(r.stdout_bytes or 0 for r in parts)
+        entry["stderr_bytes"] = sum(r.stderr_bytes or 0 for r in parts)
+        return entry
+
+
+
+@dataclass(eq=False)
+class LifecycleStep:
+    """A step declared with LifecycleContext.add and run by LifecycleContext.run."""
+
+    number: int
+    # A command, or a function building one from the lifecycle's values.
+    command: str | Callable[[dict[str, str]], str]
+    # Must finish first; `requires` must also have succeeded, else this step is skipped.
+    after: tuple[LifecycleStep, ...] = ()
+    requires: tuple[LifecycleStep, ...] = ()
+    # Value name -> JSON path into this step's stdout (RunResult.extract_first),
+    # e.g. {"issue_id": "$.id"}.
+    outputs: dict[str, str] = field(default_factory=dict)
+    result: RunResult | None = None
+    skipped: bool = False
+    rendered: str = ""
+
+    @property
+    def deps(self) -> tuple[LifecycleStep, ...]:
+        return self.after + self.requires
+
 
 class LifecycleContext:
-    """Multi-step lifecycle test context."""
+    """Multi-step lifecycle test context.
+
+    ``step()`` runs a command immediately. ``add()`` declares a step with
+    its dependencies instead, and ``run()`` executes the declared steps as
+    a DAG, independent ones concurrently. Steps are numbered in declaration
+    order either way, and DAG results are logged in that order, so logs and
+    .yr scripts don't depend on scheduling.
+    """
 
     def __init__(
         self,
@@ -254,6 +606,11 @@ class LifecycleContext:
         self.description = description
         self.results: list[RunResult] = []
         self._step_num = 0
+        # Values extracted from step outputs, plus any defaults a test seeds.
+        self.values: dict[str, str] = {}
+        self.critical_path: list[LifecycleStep] = []
+        self._pending: list[LifecycleStep] = []
+        self._values_lock = threading.Lock()
 
     def step(self, command: str) -> RunResult:
         """Execute a lifecycle step and record its result."""
@@ -266,6 +623,101 @@ class LifecycleContext:
         self.results.append(result)
         return result
 
+    def add(
+        self,
+        command: str | Callable[[dict[str, str]], str],
+        *,
+        after: Iterable[LifecycleStep] = (),
+        requires: Iterable[LifecycleStep] = (),
+        outputs: dict[str, str] | None = None,
+    ) -> LifecycleStep:
+        """Declare a step for run(); dependencies must already be declared."""
+        self._step_num += 1
+        step = LifecycleStep(self._step_num, command, tuple(after), tuple(requires),
+                             dict(outputs or {}))
+        self._pending.append(step)
+        return step
+
+    def run(self, *, max_workers: int | None = None) -> None:
+        """Run the declared steps, up to ``max_workers`` at a time.
+
+        A step starts once everything it depends on has finished; steps
+        whose ``requires`` failed or were skipped are skipped. A command
+        function sees the values extracted by the steps it depends on.
+        """
+        steps, self._pending = self._pending, []
+        batch = set(steps)
+        workers = max_workers or self.runner.lifecycle_workers
+        remaining = list(steps)
+        running: dict[Future, LifecycleStep] = {}
+        done: set[LifecycleStep] = set()
+        start = time.monotonic()
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                while remaining or running:
+                    # Declaration order is a topological order, so one pass sees
+                    # every skip it depends on.
+                    for step in list(remaining):
+                        if not all(d in done or d not in batch for d in step.deps):
+                            continue
+                        remaining.remove(step)
+                        if any(d.skipped or (d.result and not d.result.ok) for d in step.requires):
+                            step.skipped = True
+                            done.add(step)
+                        else:
+                            running[pool.submit(self._run_step, step)] = step
+                    if running:
+                        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            done.add(running.pop(future))
+                            future.result()
+        finally:
+            for step in steps:
+                if step.result is not None:
+                    self.runner._record(step.result, step.rendered)
+                    self.results.append(step.result)
+        self._report_critical_path(steps, time.monotonic() - start, workers)
+
+    def _run_step(self, step: LifecycleStep) -> None:
+        with self._values_lock:
+            values = dict(self.values)
+        step.rendered = step.command(values) if callable(step.command) else step.command
+        result = self.runner.run(
+            step.rendered,
+            sr_id=f"{self.sr_id}/step{step.number}",
+            slug=f"{self.slug}-step{step.number}",
+            record=False,
+        )
+        if step.outputs and result.ok:
+            extracted = {
+                name: value for name, path in step.outputs.items()
+                if (value := result.extract_first(path)) is not None
+            }
+            with self._values_lock:
+                self.values.update(extracted)
+        step.result = result
+
+    def _report_critical_path(
+        self, steps: list[LifecycleStep], wall: float, workers: int,
+    ) -> None:
+        """Find the longest chain of dependent steps and note it in the log."""
+        chains: dict[LifecycleStep, tuple[float, list[LifecycleStep]]] = {}
+        for step in steps:
+            if step.result is None:
+                continue
+            before = max((chains[d] for d in step.deps if d in chains),
+                         key=lambda chain: chain[0], default=(0.0, []))
+            chains[step] = (before[0] + step.result.duration, before[1] + [step])
+        if not chains:
+            return
+        length, self.critical_path = max(chains.values(), key=lambda chain: chain[0])
+        sequential = sum(step.result.duration for step in chains)
+        path = " -> ".join(f"step{step.number}" for step in self.critical_path)
+        _append_log(self.sr_id, (
+            f"[{self.sr_id}] critical path: {path} ({length:.2f}s; "
+            f"{sequential:.2f}s in sequence, {wall:.2f}s wall with {workers} workers)"
+        ))
+
     def assert_all_passed(self) -> None:
         """Assert that all lifecycle steps passed."""
         failures = [r for r in self.results if not r.ok]
@@ -306,18 +758,60 @@ class RapsRunner:
         timeout: int = 30,
         cwd: str | None = None,
         env: dict[str, str] | None = None,
+        worker: bool = False,
+        cache: CommandCache | None = None,
+        lifecycle_workers: int = 4,
+        capture_window: int | None = None,
+        tee_dir: str | None = None,
+        cpu_limit: int | None = None,
+        memory_limit_mb: int | None = None,
+        retry: Retrier | None = None,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         self.target = target
         self.mock_base_url = mock_base_url
         self.timeout = timeout
         self.cwd = cwd
-        self._env = build_raps_env(
-            cwd,
-            target=target,
-            mock_base_url=mock_base_url,
-            base_env=dict(env) if env else None,
-        )
+        with phase("build_raps_env"):
+            self._env = build_raps_env(
+                cwd,
+                target=target,
+                mock_base_url=mock_base_url,
+                base_env=dict(env) if env else None,
+            )
         self._raps_bin = _raps_binary(cwd)
+        # Persistent `raps shell` for local commands; started on first use.
+        self._use_worker = worker
+        self._worker: RapsWorker | None = None
+        self._worker_lock = threading.Lock()
+        # Memoized results of read-only commands (opt-in, see cache.py).
+        self.cache = cache
+        self._env_fingerprint = env_fingerprint(self._env, cwd)
+        # Concurrency of LifecycleContext.run().
+        self.lifecycle_workers = lifecycle_workers
+        # Streaming capture (see capture.py): keep only the first and last
+        # capture_window bytes of each stream, optionally teeing it all to tee_dir.
+        self.capture_window = capture_window
+        self.tee_dir = Path(tee_dir) if tee_dir else None
+        if self.tee_dir:
+            self.tee_dir.mkdir(parents=True, exist_ok=True)
+        self._tee_seq = itertools.count(1)
+        # Per-process RLIMIT_CPU (seconds) and RLIMIT_AS (MiB), applied by an
+        # exec wrapper in front of every command (see _limit_wrapper).
+        self._limit_prefix: list[str] = []
+        if (cpu_limit or memory_limit_mb) and resource is not None:
+            self._limit_prefix = _limit_wrapper(cpu_limit, memory_limit_mb)
+        # Retries of transient APS failures (opt-in, see retry.py).
+        self.retry = retry
+        # Token buckets per API family shared with other processes (see ratelimit.py).
+        self.rate_limiter = rate_limiter
+
+    def close(self) -> None:
+        """Stop the persistent worker, if one is running."""
+        with self._worker_lock:
+            if self._worker is not None:
+                self._worker.close()
+                self._worker = None
 
     def run(
         self,
@@ -326,80 +820,407 @@ class RapsRunner:
         sr_id: str = "",
         slug: str = "",
         timeout: int | None = None,
+        record: bool = True,
+    ) -> RunResult:
+        """Run a command and return the result.
+
+        ``record=False`` leaves logging to the caller (see _record).
+        """
+        with phase("run", sr_id):
+            return self._run(command, sr_id=sr_id, slug=slug, timeout=timeout, record=record)
+
+    def _run(
+        self, command: str, *, sr_id: str, slug: str, timeout: int | None, record: bool,
     ) -> RunResult:
-        """Run a command and return the result."""
         original_command = command  # preserve before path resolution
         effective_timeout = timeout or self.timeout
-        bash = _find_bash()
-
-        # Determine execution strategy: direct (fast) vs bash -c (shell features)
-        needs_shell = bool(_NEEDS_SHELL_RE.search(command))
-
-        if needs_shell:
-            # Shell features needed — route through bash
-            resolved = _resolve_raps_command(command, self._raps_bin, bash)
-            cmd_args = [bash, "-c", resolved] if bash else resolved
-            use_shell = not bash
-        elif self._raps_bin and command.strip().startswith("raps "):
-            # Simple raps command — run binary directly (skip bash overhead)
-            argv = command.strip().split(None, 1)
-            raps_args = argv[1] if len(argv) > 1 else ""
-            cmd_args = [self._raps_bin] + shlex.split(raps_args)
-            use_shell = False
-            command = _resolve_raps_command(command, self._raps_bin, bash)
-        else:
-            # Non-raps simple command
-            resolved = _resolve_raps_command(command, self._raps_bin, bash)
-            cmd_args = [bash, "-c", resolved] if bash else resolved
-            use_shell = not bash
+
+        with phase("prepare"):
+            bash = _find_bash()
+
+            # Determine execution strategy: direct (fast) vs bash -c (shell features)
+            needs_shell = bool(_NEEDS_SHELL_RE.search(command))
+            steps = parse_command_list(command) if needs_shell else None
+            raps_args = None
+            if not needs_shell and command.strip().startswith("raps "):
+                raps_args = shlex.split(command.strip()[5:])
+            worker_args = raps_args
+            if not (self._use_worker and raps_args and worker_eligible(raps_args)):
+                worker_args = None
+
+            if steps:
+                # `;`/`&&` list of raps commands — run each step directly, no bash
+                cmd_args = []
+                use_shell = False
+                command = _resolve_raps_command(command, self._raps_bin, bash)
+            elif needs_shell:
+                # Shell features needed — route through bash
+                resolved = _resolve_raps_command(command, self._raps_bin, bash)
+                cmd_args = [bash, "-c", resolved] if bash else resolved
+                use_shell = not bash
+            elif self._raps_bin and command.strip().startswith("raps "):
+                # Simple raps command — run binary directly (skip bash overhead)
+                cmd_args = [self._raps_bin] + raps_args
+                use_shell = False
+                command = _resolve_raps_command(command, self._raps_bin, bash)
+            else:
+                # Non-raps simple command
+                resolved = _resolve_raps_command(command, self._raps_bin, bash)
+                cmd_args = [bash, "-c", resolved] if bash else resolved
+                use_shell = not bash
+
+            # Read-only cache: pure commands are looked up by resolved command and
+            # env; everything else invalidates what it may have changed once it ran.
+            cache_key = None
+            invalidates: list[str | None] = []
+            if self.cache is not None:
+                if steps:
+                    effects = [classify(step.argv[1:]) for step in steps]
+                elif raps_args is not None:
+                    effects = [classify(raps_args)]
+                else:
+                    effects = [(MUTATING, None)]  # shell or non-raps: effects unknown
+                invalidates = [group for kind, group in effects if kind == MUTATING]
+                if not steps and effects[0][0] == PURE:
+                    cache_key = (self._env_fingerprint, command)
+                    cached = self.cache.get(cache_key)
+                    if cached is not None:
+                        result = replace(cached, sr_id=sr_id, slug=slug, duration=0.0,
+                                         worker=False, cached=True, retries=[],
+                                         queue_seconds=0.0,
+                                         **dict.fromkeys(USAGE_FIELDS))
+                        if record:
+                            self._record(result, original_command)
+                        return result
+
+            # Retries: raps commands only, and a command list only when rerunning
+            # its earlier steps is harmless.
+            retry_args = None
+            if self.retry is not None:
+                if steps:
+                    if all(classify(step.argv[1:])[0] in (PURE, VOLATILE) for step in steps):
+                        retry_args = steps[0].argv[1:]
+                elif raps_args is not None:
+                    retry_args = raps_args
 
         start = time.monotonic()
-        timed_out = False
-        try:
-            proc = subprocess.run(
-                cmd_args,
-                shell=use_shell,
-                capture_output=True,
-                text=True,
-                timeout=effective_timeout,
-                cwd=self.cwd,
-                env=self._env,
+        retries: list[dict] = []
+        queued = 0.0
+        while True:
+            result = self._attempt(
+                command, cmd_args, use_shell=use_shell, steps=steps, raps_args=raps_args,
+                worker_args=worker_args, sr_id=sr_id, slug=slug, timeout=effective_timeout,
             )
-            exit_code = proc.returncode
-            stdout = proc.stdout
-            stderr = proc.stderr
-        except subprocess.TimeoutExpired:
-            timed_out = True
-            exit_code = 124
-            stdout = ""
-            stderr = f"TIMEOUT after {effective_timeout}s"
-        duration = round(time.monotonic() - start, 2)
-
-        result = RunResult(
+            queued += result.queue_seconds
+            if retry_args is None:
+                break
+            reason = classify_failure(result.exit_code, result.stderr, result.timed_out)
+            delay = self.retry.backoff(retry_args, reason, len(retries), result.stderr)
+            if delay is None:
+                break
+            retries.append({
+                "reason": reason,
+                "exit_code": 124 if result.timed_out else result.exit_code,
+                "duration_seconds": result.duration,
+                "backoff_seconds": delay,
+            })
+            with phase("backoff"):
+                self.retry.sleep(delay)
+        result.duration = round(time.monotonic() - start - queued, 2)
+        result.retries = retries
+        result.queue_seconds = round(queued, 3)
+
+        if cache_key is not None and result.ok:
+            self.cache.put(cache_key, effects[0][1], result)
+        for group in invalidates:
+            self.cache.invalidate(group)
+        if record:
+            self._record(result, original_command)
+        return result
+
+    def _attempt(
+        self,
+        command: str,
+        cmd_args: list[str] | str,
+        *,
+        use_shell: bool,
+        steps: list[ListStep] | None,
+        raps_args: list[str] | None,
+        worker_args: list[str] | None,
+        sr_id: str,
+        slug: str,
+        timeout: float,
+    ) -> RunResult:
+        """Run a prepared command once: in the worker, as a list, or as one process.
+
+        A single raps command first waits for its rate-limit token; the
+        steps of a list each wait for their own (see _execute_list).
+        """
+        queued = self._throttle(raps_args) if not steps else 0.0
+        start = time.monotonic()
+        step_results: list[RunResult] = []
+        output: dict[str, dict] = {}
+        usage: dict = {}
+        tee = self._tee_path(sr_id, slug) if self.tee_dir else None
+        served = self._worker_execute(worker_args, timeout) if worker_args else None
+        if served:
+            exit_code, stdout, stderr, timed_out = served
+        elif steps:
+            exit_code, stdout, stderr, timed_out = self._execute_list(
+                steps, step_results, sr_id=sr_id, slug=slug, timeout=timeout, tee=tee,
+            )
+        else:
+            exit_code, stdout, stderr, timed_out = self._execute(
+                cmd_args, use_shell=use_shell, timeout=timeout, tee=tee,
+                output=output, usage=usage,
+            )
+        if step_results:
+            usage = _sum_usage(step_results)
+            queued = sum(step.queue_seconds for step in step_results)
+        return RunResult(
             sr_id=sr_id,
             slug=slug,
             command=command,
             exit_code=exit_code,
             stdout=stdout,
             stderr=stderr,
-            duration=duration,
+            duration=round(time.monotonic() - start - queued, 2),
             timed_out=timed_out,
+            steps=step_results,
+            worker=served is not None,
+            output=output,
+            queue_seconds=round(queued, 3),
+            **usage,
         )
-        _store_log(sr_id, result)
-
-        # Collect original command for .yr generation
-        if sr_id:
-            with _commands_lock:
-                _command_records.append(CommandRecord(
-                    sr_id=sr_id,
-                    slug=slug,
-                    command=original_command,
-                    duration=duration,
-                    exit_code=exit_code,
-                    timed_out=timed_out,
-                ))
 
-        return result
+    def _throttle(self, args: list[str] | None) -> float:
+        """Wait for a rate-limit token for a raps command; returns the seconds waited."""
+        if self.rate_limiter is None or args is None:
+            return 0.0
+        with phase("queue"):
+            return self.rate_limiter.acquire(args)
+
+    def _record(self, result: RunResult, original_command: str) -> None:
+        """Log a result and collect its original command for .yr generation."""
+        with phase("log"):
+            _store_log(result.sr_id, result)
+
+            if result.sr_id:
+                with _commands_lock:
+                    _command_records.append(CommandRecord(
+                        sr_id=result.sr_id,
+                        slug=result.slug,
+                        command=original_command,
+                        duration=result.duration,
+                        exit_code=result.exit_code,
+                        timed_out=result.timed_out,
+                        max_rss_kb=result.max_rss_kb,
+                        cpu_seconds=result.cpu_seconds,
+                    ))
+
+    def _execute(
+        self,
+        cmd_args: list[str] | str,
+        *,
+        use_shell: bool,
+        timeout: float,
+        merge_stderr: bool = False,
+        tee: Path | None = None,
+        output: dict[str, dict] | None = None,
+        usage: dict | None = None,
+    ) -> tuple[int, str, str, bool]:
+        """Spawn, wait and decode one process: (exit_code, stdout, stderr, timed_out).
+
+        Equivalent to ``subprocess.run(capture_output=True, text=True)``,
+        split into phases so ``--raps-profile`` can time each one.
+        ``merge_stderr`` sends stderr into stdout, like ``2>&1``.
+
+        Pipes are read incrementally through StreamCapture (bounded by
+        ``capture_window``, teed under ``tee``); per-stream summaries go in
+        ``output``. The process leads its own session so a timeout kills
+        the whole tree, raps under ``bash -c`` included, and runs under the
+        configured CPU and address-space limits. It is reaped with wait4;
+        its resource usage (USAGE_FIELDS) goes in ``usage``.
+        """
+        if self._limit_prefix:
+            if use_shell:
+                cmd_args, use_shell = ["/bin/sh", "-c", cmd_args], False
+            cmd_args = self._limit_prefix + cmd_args
+        with phase("spawn"):
+            proc = subprocess.Popen(
+                cmd_args,
+                shell=use_shell,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+                cwd=self.cwd,
+                env=self._env,
+                start_new_session=_POSIX,
+            )
+        names = ["stdout"] if merge_stderr else ["stdout", "stderr"]
+        captures = {
+            name: StreamCapture(
+                window=self.capture_window,
+                tee=tee.with_name(f"{tee.name}.{name}") if tee else None,
+                decode=_decode,
+            )
+            for name in names
+        }
+        reaper = threading.Thread(target=_reap, args=(proc, {} if usage is None else usage),
+                                  daemon=True)
+        threads = [
+            threading.Thread(target=captures[name].pump, args=(getattr(proc, name),), daemon=True)
+            for name in names
+        ] + [reaper]
+        deadline = time.monotonic() + timeout
+        try:
+            with phase("wait"):
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join(max(0.0, deadline - time.monotonic()))
+            timed_out = any(thread.is_alive() for thread in threads)
+            if timed_out:
+                _kill_tree(proc)
+                reaper.join()
+        except BaseException:
+            _kill_tree(proc)
+            raise
+        finally:
+            for thread in threads:
+                thread.join(1.0)
+            for name, capture in captures.items():
+                getattr(proc, name).close()
+                capture.close()
+                if output is not None:
+                    output[name] = capture.summary()
+        if timed_out:
+            return 124, "", f"TIMEOUT after {timeout}s", True
+        if proc.returncode is None:  # the reaper lost the status (e.g. SIGCHLD ignored)
+            proc.wait()
+        with phase("decode"):
+            stderr = captures["stderr"].text if "stderr" in captures else ""
+            return proc.returncode, captures["stdout"].text, stderr, False
+
+    def _tee_path(self, sr_id: str, slug: str) -> Path:
+        """Per-run tee file stem, e.g. ``0007-SR-063_step1-bucket-create``."""
+        name = re.sub(r"[^\w.-]+", "_", "-".join(filter(None, (sr_id, slug)))) or "run"
+        return self.tee_dir / f"{next(self._tee_seq):04d}-{name}"
+
+    def _worker_execute(
+        self, args: list[str], timeout: float,
+    ) -> tuple[int, str, str, bool] | None:
+        """Run a command in the persistent worker, or return None to spawn instead.
+
+        The shell reports no exit codes, so a response is taken as exit 0
+        only when it proves success (see proves_success). Anything else may
+        be a warning, one of raps' exit codes 2-6 or a failure reported on
+        stdout, so the command, read-only by worker_eligible, is spawned
+        again for its real status. Any worker failure stops the worker for
+        the rest of the session and the command is spawned as usual.
+        """
+        worker = self._get_worker()
+        if worker is None:
+            return None
+        try:
+            stdout, stderr = worker.request(args, timeout)
+        except WorkerError as e:
+            self._disable_worker(f"worker stopped responding ({e})")
+            return None
+        if not proves_success(stdout, stderr):
+            return None
+        return 0, stdout, stderr, False
+
+    def _get_worker(self) -> RapsWorker | None:
+        with self._worker_lock:
+            if self._worker is not None or not self._use_worker:
+                return self._worker
+            raps = self._raps_bin or shutil.which("raps", path=self._env.get("PATH"))
+            if not raps:
+                self._use_worker = False
+                return None
+            code, version, _, _ = self._execute(
+                [raps, "--version"], use_shell=False, timeout=self.timeout,
+            )
+            worker = RapsWorker(raps, env=self._env, cwd=self.cwd)
+            try:
+                if code != 0:
+                    raise WorkerError(f"raps --version exited {code}")
+                worker.start(expected_version=version, timeout=self.timeout)
+            except (WorkerError, OSError) as e:
+                self._use_worker = False
+                _warn_worker_fallback(f"could not start raps worker ({e})")
+                return None
+            self._worker = worker
+            return worker
+
+    def _disable_worker(self, reason: str) -> None:
+        with self._worker_lock:
+            self._use_worker = False
+            if self._worker is not None:
+                self._worker.close()
+                self._worker = None
+        _warn_worker_fallback(reason)
+
+    def _execute_list(
+        self,
+        steps: list[ListStep],
+        step_results: list[RunResult],
+        *,
+        sr_id: str,
+        slug: str,
+        timeout: float,
+        tee: Path | None = None,
+    ) -> tuple[int, str, str, bool]:
+        """Run a parsed command list with shell semantics, without a shell.
+
+        A step after `;` always runs; a step after `&&` runs only if the
+        last command that ran succeeded. The exit code is that of the last
+        command run, and the timeout covers the whole list, less any time
+        spent waiting for rate-limit tokens. Each executed step is appended
+        to ``step_results``.
+        """
+        deadline = time.monotonic() + timeout
+        exit_code = 0
+        stdout_parts: list[str] = []
+        stderr_parts: list[str] = []
+        for step in steps:
+            if step.operator == "&&" and exit_code != 0:
+                continue
+            queued = self._throttle(step.argv[1:])
+            deadline += queued
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return 124, "", f"TIMEOUT after {timeout}s", True
+            argv = [self._raps_bin or step.argv[0]] + step.argv[1:]
+            start = time.monotonic()
+            output: dict[str, dict] = {}
+            usage: dict = {}
+            step_tee = tee.with_name(f"{tee.name}-step{len(step_results) + 1}") if tee else None
+            try:
+                exit_code, out, err, timed_out = self._execute(
+                    argv, use_shell=False, timeout=remaining, merge_stderr=step.merge_stderr,
+                    tee=step_tee, output=output, usage=usage,
+                )
+            except FileNotFoundError:
+                exit_code, out, err, timed_out = 127, "", f"{argv[0]}: command not found\n", False
+            step_results.append(RunResult(
+                sr_id=sr_id,
+                slug=slug,
+                command=step.text,
+                exit_code=exit_code,
+                stdout=out,
+                stderr=err,
+                duration=round(time.monotonic() - start, 2),
+                timed_out=timed_out,
+                output=output,
+                queue_seconds=queued,
+                **usage,
+            ))
+            if timed_out:
+                return 124, "", f"TIMEOUT after {timeout}s", True
+            stdout_parts.append(out)
+            stderr_parts.append(err)
+        return exit_code, "".join(stdout_parts), "".join(stderr_parts), False
 
     def run_ok(
         self,
@@ -0,0 +1,114 @@
+"""Unit tests for the --raps-cache read-only command cache."""
+from __future__ import annotations
+
+import pytest
+
+from tests.helpers.cache import (
+    MUTATING,
+    NEUTRAL,
+    PURE,
+    VOLATILE,
+    CommandCache,
+    classify,
+    format_stats,
+)
+from tests.helpers.runner import RapsRunner
+
+# A stand-in raps that appends every invocation to calls.log.
+FAKE_RAPS = """\
+import os, sys
+with open(os.path.join(os.path.dirname(sys.argv[0]), "calls.log"), "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+if sys.argv[-1:] == ["fail"]:
+    sys.exit(3)
+print("out:" + " ".join(sys.argv[1:]))
+"""
+
+
+def _runner(fake_raps, **kwargs):
+    return RapsRunner(timeout=10, env=fake_raps(FAKE_RAPS), cache=CommandCache(**kwargs))
+
+
+def _calls(bin_dir):
+    return (bin_dir / "calls.log").read_text().splitlines()
+
+
+@pytest.mark.parametrize("command, expected", [
+    ("bucket list", (PURE, "oss")),
+    ("object info my-bucket key.rvt", (PURE, "oss")),
+    ("config profile current", (PURE, "config")),
+    ("hub list --output json", (PURE, "data-management")),
+    ("translate status dXJu", (VOLATILE, "translate")),
+    ("reality status job-1", (VOLATILE, "reality")),
+    ("bucket create -k my-bucket", (MUTATING, "oss")),
+    ("object delete my-bucket key.rvt", (MUTATING, "oss")),
+    ("config profile use staging", (MUTATING, None)),
+    ("api post /oss/v2/buckets", (MUTATING, None)),
+    ("pipeline sample --out-file p.yaml", (MUTATING, None)),
+    ("--version", (NEUTRAL, None)),
+    ("bucket --help", (NEUTRAL, None)),
+])
+def test_classify(command, expected):
+    assert classify(command.split()) == expected
+
+
+def test_pure_command_is_served_from_cache(fake_raps, tmp_path):
+    runner = _runner(fake_raps)
+    first = runner.run("raps bucket list")
+    second = runner.run("raps bucket list", sr_id="SR-010", slug="again")
+    assert not first.cached
+    assert second.cached and second.stdout == first.stdout
+    assert (second.sr_id, second.slug, second.duration) == ("SR-010", "again", 0.0)
+    assert _calls(tmp_path) == ["bucket list"]
+    assert runner.cache.stats()["hits"] == 1
+
+
+def test_status_polls_are_never_cached(fake_raps, tmp_path):
+    runner = _runner(fake_raps)
+    runner.run("raps bucket list")
+    assert not runner.run("raps translate status dXJu").cached
+    assert not runner.run("raps translate status dXJu").cached
+    assert runner.run("raps bucket list").cached
+    assert _calls(tmp_path) == ["bucket list", "translate status dXJu", "translate status dXJu"]
+
+
+def test_mutation_invalidates_only_its_resource_group(fake_raps):
+    runner = _runner(fake_raps)
+    runner.run("raps bucket list")
+    runner.run("raps hub list")
+    runner.run("raps object delete my-bucket key.rvt")
+    assert not runner.run("raps bucket list").cached
+    assert runner.run("raps hub list").cached
+    assert runner.cache.invalidated == 1
+
+
+def test_global_mutation_and_shell_commands_clear_everything(fake_raps):
+    runner = _runner(fake_raps)
+    runner.run("raps bucket list")
+    runner.run("raps config profile use staging")
+    assert not runner.run("raps bucket list").cached
+    runner.run("echo done | cat")
+    assert not runner.run("raps bucket list").cached
+
+
+def test_mutating_step_in_command_list_invalidates(fake_raps):
+    runner = _runner(fake_raps)
+    runner.run("raps bucket list")
+    runner.run("raps hub list && raps bucket delete my-bucket")
+    assert not runner.run("raps bucket list").cached
+
+
+def test_failures_and_expired_entries_are_not_served(fake_raps):
+    runner = _runner(fake_raps, ttl=0)
+    runner.run("raps bucket list")
+    assert not runner.run("raps bucket list").cached
+    runner.cache.ttl = 30
+    runner.run("raps bucket get fail")
+    assert not runner.run("raps bucket get fail").cached
+
+
+def test_format_stats():
+    stats = {"hits": 3, "misses": 1, "invalidated": 2, "entries": 1}
+    assert format_stats(stats) == (
+        "raps cache: 3 hits, 1 misses (75% hit rate), 2 entries invalidated"
+    )
@@ -0,0 +1,76 @@
+"""Unit tests for streaming output capture (--raps-capture-window / --raps-tee-dir)."""
+from __future__ import annotations
+
+import hashlib
+import sys
+
+from tests.helpers.capture import StreamCapture
+from tests.helpers.runner import RapsRunner
+
+
+def _feed(capture, data, chunk=7):
+    for i in range(0, len(data), chunk):
+        capture.feed(data[i:i + chunk])
+
+
+def test_unbounded_capture_keeps_everything():
+    capture = StreamCapture()
+    _feed(capture, b"one\ntwo\nthree")
+    assert capture.text == "one\ntwo\nthree"
+    assert (capture.bytes, capture.lines) == (13, 3)
+    assert capture.summary()["truncated"] is False
+
+
+def test_window_keeps_head_and_tail_with_full_stream_stats():
+    data = b"".join(b"line %04d\n" % i for i in range(1000))
+    capture = StreamCapture(window=20)
+    _feed(capture, data)
+    assert capture.text.startswith("line 0000\nline 0001\n\n... [")
+    assert capture.text.endswith("line 0998\nline 0999\n")
+    assert f"[{len(data) - 40} bytes omitted]" in capture.text
+    assert capture.lines == 1000
+    assert capture.sha256 == hashlib.sha256(data).hexdigest()
+    assert len(capture._tail) <= 2 * capture.window
+
+
+def test_short_stream_within_window_is_not_truncated():
+    capture = StreamCapture(window=20)
+    _feed(capture, b"x" * 35)
+    assert capture.text == "x" * 35
+    assert capture.omitted == 0
+
+
+def test_window_cut_inside_multibyte_character_decodes():
+    capture = StreamCapture(window=3)
+    capture.feed("ééééé".encode())
+    assert "bytes omitted" in capture.text
+
+
+def test_tee_writes_full_stream(tmp_path):
+    capture = StreamCapture(window=2, tee=tmp_path / "out")
+    _feed(capture, b"abcdefgh")
+    capture.close()
+    assert (tmp_path / "out").read_bytes() == b"abcdefgh"
+    assert capture.summary()["tee"] == str(tmp_path / "out")
+
+
+def test_runner_streams_and_tees(tmp_path):
+    runner = RapsRunner(timeout=10, capture_window=64, tee_dir=str(tmp_path / "tee"))
+    script = "import sys; sys.stdout.write('row\\n' * 10000); sys.stderr.write('warn\\n')"
+    result = runner.run(f"{sys.executable} -c \"{script}\"", sr_id="SR-100/step2", slug="big")
+    assert result.ok
+    assert len(result.stdout) < 200
+    assert result.stderr == "warn\n"
+    assert result.output["stdout"]["bytes"] == 40000
+    assert result.output["stdout"]["lines"] == 10000
+    assert result.output["stdout"]["truncated"]
+    tee = tmp_path / "tee" / "0001-SR-100_step2-big.stdout"
+    assert result.output["stdout"]["tee"] == str(tee)
+    assert tee.read_text() == "row\n" * 10000
+
+
+def test_runner_streaming_timeout():
+    runner = RapsRunner(timeout=10, capture_window=64)
+    result = runner.run(f"{sys.executable} -c \"import time; time.sleep(5)\"", timeout=1)
+    assert result.timed_out
+    assert result.exit_code == 124
@@ -0,0 +1,106 @@
+"""Unit tests for JSON path extraction (jsonpath.py, RunResult.json/extract)."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tests.helpers import jsonpath as jsonpath_mod
+from tests.helpers import runner as runner_mod
+from tests.helpers.jsonpath import ANY, JsonPath, compile_path, parse_json
+from tests.helpers.runner import RunResult
+
+DOC = {
+    "data": {"metadata": [{"guid": "g-1", "name": "3D"}, {"guid": "g-2"}]},
+    "items": [{"id": "a"}, {"id": "b", "tags": ["x"]}, {"name": "no-id"}],
+    "0": "key-zero",
+}
+
+
+def _result(stdout: str) -> RunResult:
+    return RunResult(
+        sr_id="", slug="", command="raps x", exit_code=0, stdout=stdout, stderr="", duration=0.0
+    )
+
+
+@pytest.mark.parametrize("path, steps", [
+    ("$", []),
+    ("$.items[*].id", ["items", ANY, "id"]),
+    ("$.data.metadata[0].guid", ["data", "metadata", 0, "guid"]),
+    ("$['odd key'][\"k\"].*", ["odd key", "k", ANY]),
+    ("$.data.0.id", ["data", "0", "id"]),
+])
+def test_compile(path, steps):
+    assert JsonPath(path).steps == steps
+
+
+@pytest.mark.parametrize("path", ["items", "$.", "$[x]", "$.items["])
+def test_compile_rejects_bad_paths(path):
+    with pytest.raises(ValueError):
+        JsonPath(path)
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("$.items[*].id", ["a", "b"]),
+    ("$.data.metadata[0].guid", ["g-1"]),
+    ("$.data.metadata.1.guid", ["g-2"]),
+    ("$.items[1].tags[*]", ["x"]),
+    ("$.0", ["key-zero"]),
+    ("$.missing.id", []),
+    ("$.items[9]", []),
+])
+def test_find_and_stream_agree(path, expected):
+    assert compile_path(path).find(DOC) == expected
+    assert list(compile_path(path).stream(json.dumps(DOC, indent=2))) == expected
+
+
+def test_stream_is_lazy():
+    text = '{"items": [{"id": 1}, {"id": 2}] ' + "x" * 100
+    matches = compile_path("$.items[*].id").stream(text)
+    assert next(matches) == 1
+    assert next(matches) == 2
+    assert next(matches, None) is None
+
+
+def test_stream_skips_siblings_without_decoding(monkeypatch):
+    noise = {"s": 'br]ck{ts "q" \\', "n": [-1.5e3, 0, True, None, {}, []], "u": "é "}
+    text = json.dumps({"a": noise, "items": [noise, {"id": 1}, "x]", {"id": 2}], "z": noise})
+    decoded = []
+    raw_decode = jsonpath_mod._decoder.raw_decode
+    monkeypatch.setattr(jsonpath_mod._decoder, "raw_decode",
+                        lambda s, i: decoded.append(s[i]) or raw_decode(s, i))
+    assert list(compile_path("$.items[*].id").stream(text)) == [1, 2]
+    assert list(compile_path("$.z.n[4]").stream(text)) == [{}]
+    # Only the keys on the path and the matches themselves.
+    assert decoded.count("{") == 1
+    assert list(compile_path("$.items[1].id").stream('{"items": [{"a": "]}"')) == []
+
+
+def test_leading_log_text_is_skipped():
+    text = 'Fetching metadata...\nWARN slow response\n{"id": "p-1"}\n'
+    assert parse_json(text) == {"id": "p-1"}
+    assert list(compile_path("$.id").stream(text)) == ["p-1"]
+
+
+def test_malformed_json():
+    with pytest.raises(ValueError):
+        parse_json("not json")
+    assert list(compile_path("$.items[*].id").stream('{"items": [{"id": 1}, {"id": ')) == [1]
+
+
+def test_result_json_is_parsed_once():
+    result = _result('{"id": "p-1", "items": [{"id": 1}]}')
+    assert result.json is result.json
+    assert result.extract("$.items[*].id") == [1]
+    assert result.extract_first("$.id") == "p-1"
+    assert result.extract_first("$.nope", "fallback") == "fallback"
+    assert _result("Error: 404").json is None
+    assert _result("Error: 404").extract_first("$.id") is None
+
+
+def test_large_output_is_streamed(monkeypatch):
+    monkeypatch.setattr(runner_mod, "STREAM_THRESHOLD", 16)
+    result = _result('[{"hookId": "h-1"}, {"hookId": "h-2"}]')
+    assert result.extract_first("$[0].hookId") == "h-1"
+    assert result.extract("$[*].hookId") == ["h-1", "h-2"]
+    assert "json" not in result.__dict__
@@ -0,0 +1,87 @@
+"""Unit tests for the lifecycle step DAG (LifecycleContext.add/run)."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from tests.helpers.runner import (
+    RapsRunner,
+    _captured_logs,
+    clear_captured_logs,
+    clear_command_records,
+    get_command_records,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    clear_captured_logs()
+    clear_command_records()
+    yield
+    clear_captured_logs()
+    clear_command_records()
+
+
+@pytest.fixture
+def lc():
+    return RapsRunner(timeout=10, lifecycle_workers=4).lifecycle("SR-990", "dag", "DAG test")
+
+
+def test_independent_steps_run_concurrently(lc):
+    for _ in range(3):
+        lc.add("sleep 0.4")
+    start = time.monotonic()
+    lc.run()
+    assert time.monotonic() - start < 1.0
+    assert len(lc.results) == 3
+    lc.assert_all_passed()
+
+
+def test_after_orders_dependent_steps(lc, tmp_path):
+    marker = tmp_path / "created"
+    create = lc.add(f"sleep 0.2 && touch {marker}")
+    lc.add(f"test -f {marker}", after=[create])
+    lc.run()
+    lc.assert_all_passed()
+
+
+def test_requires_skips_steps_after_failure(lc):
+    failing = lc.add("false")
+    skipped = lc.add("echo never", requires=[failing])
+    chained = lc.add("echo never either", requires=[skipped])
+    ordered = lc.add("echo still runs", after=[failing])
+    lc.run()
+    assert skipped.skipped and chained.skipped
+    assert ordered.result.ok
+    assert [r.sr_id for r in lc.results] == ["SR-990/step1", "SR-990/step4"]
+
+
+def test_outputs_pass_values_to_dependents(lc):
+    lc.values["issue_id"] = "fallback"
+    issue = lc.add("""echo '{"data": [{"id": "ISS-7"}]}'""", outputs={"issue_id": "$.data.0.id"})
+    comment = lc.add(lambda v: f"echo comment on {v['issue_id']}", after=[issue])
+    broken = lc.add("echo not-json", outputs={"other": "$.id"})
+    lc.run()
+    assert comment.result.stdout == "comment on ISS-7\n"
+    assert broken.result.ok and "other" not in lc.values
+
+
+def test_numbering_and_logs_follow_declaration_order(lc):
+    lc.add("sleep 0.3 && echo first")
+    lc.add("echo second")
+    lc.run()
+    log = _captured_logs["SR-990"]
+    assert log.index("[SR-990/step1]") < log.index("[SR-990/step2]")
+    records = get_command_records()
+    assert [r.sr_id for r in records] == ["SR-990/step1", "SR-990/step2"]
+    assert records[0].command == "sleep 0.3 && echo first"
+
+
+def test_critical_path_is_longest_dependent_chain(lc):
+    a = lc.add("sleep 0.3")
+    b = lc.add("sleep 0.3", after=[a])
+    lc.add("sleep 0.1")
+    lc.run()
+    assert lc.critical_path == [a, b]
+    assert "critical path: step1 -> step2" in _captured_logs["SR-990"]
@@ -0,0 +1,68 @@
+"""Unit tests for the --raps-profile phase profiler."""
+from __future__ import annotations
+
+from tests.helpers import profiler
+from tests.helpers.profiler import (
+    NO_SR,
+    clear_profile,
+    enable_profiling,
+    get_profile,
+    phase,
+    write_profile,
+)
+
+
+def setup_function():
+    clear_profile()
+    enable_profiling(True)
+
+
+def teardown_function():
+    enable_profiling(False)
+    clear_profile()
+
+
+def test_phase_is_noop_when_disabled():
+    enable_profiling(False)
+    with phase("run", "SR-001"):
+        pass
+    assert get_profile() == {}
+
+
+def test_nested_phases_share_outer_sr_root():
+    """Nested phases record full stacks rooted at the outermost SR-ID."""
+    with phase("call", "SR-051"):
+        with phase("run", "SR-051/step1"):
+            with phase("spawn"):
+                pass
+    profile = get_profile()
+    assert set(profile) == {
+        ("SR-051", "call"),
+        ("SR-051", "call", "run"),
+        ("SR-051", "call", "run", "spawn"),
+    }
+    assert all(count == 1 for count, _ in profile.values())
+
+
+def test_phase_without_sr_uses_session_root():
+    with phase("build_raps_env"):
+        pass
+    assert (NO_SR, "build_raps_env") in get_profile()
+
+
+def test_step_ids_fold_into_base_id():
+    with phase("run", "SR-063/step2"):
+        pass
+    assert ("SR-063", "run") in get_profile()
+
+
+def test_folded_output_uses_self_time(tmp_path, monkeypatch):
+    """Collapsed stacks carry exclusive time so a flame graph sums correctly."""
+    monkeypatch.setattr(profiler, "_stacks", {
+        ("SR-1", "run"): [1, 10_000_000],
+        ("SR-1", "run", "wait"): [1, 7_000_000],
+    })
+    json_path, folded_path = write_profile(tmp_path, worker="gw1")
+    assert json_path.name == "raps-profile-gw1.json"
+    lines = folded_path.read_text().split()
+    assert lines == ["SR-1;run", "3000", "SR-1;run;wait", "7000"]
@@ -0,0 +1,123 @@
+"""Unit tests for the cross-process rate limiter ([tool.raps.rate-limits])."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.helpers.ratelimit import Bucket, RateLimiter, format_stats, load_limits
+from tests.helpers.runner import RapsRunner, _captured_logs, clear_captured_logs
+
+PYPROJECT = """\
+[project]
+name = "x"
+
+[tool.raps.rate-limits]
+state-file = "{state}"
+
+[tool.raps.rate-limits.oss]
+per-minute = 600
+burst = 20
+commands = ["bucket", "object"]
+
+[tool.raps.rate-limits.admin]
+per-minute = 60
+commands = ["admin"]
+"""
+
+
+def _limiter(tmp_path, per_minute=600, burst=2):
+    bucket = Bucket("oss", per_minute, burst, frozenset({"bucket", "object"}))
+    return RateLimiter([bucket], tmp_path / "state.json")
+
+
+def _drain(state_file: str, count: int) -> None:
+    limiter = RateLimiter([Bucket("oss", 1200, 1, frozenset({"bucket"}))], Path(state_file))
+    for _ in range(count):
+        limiter.acquire(["bucket", "list"])
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    clear_captured_logs()
+    yield
+    clear_captured_logs()
+
+
+def test_load_limits(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(PYPROJECT.format(state=tmp_path / "s.json"))
+    buckets, state_file = load_limits(tmp_path / "pyproject.toml")
+    assert [(b.name, b.rate, b.burst) for b in buckets] == [("oss", 10.0, 20), ("admin", 1.0, 1)]
+    assert buckets[0].commands == {"bucket", "object"}
+    assert state_file == tmp_path / "s.json"
+    assert load_limits(tmp_path / "missing.toml")[0] == []
+
+
+def test_repo_pyproject_covers_the_main_api_families():
+    buckets, _ = load_limits(Path(__file__).parents[2] / "pyproject.toml")
+    families = {command for b in buckets for command in b.commands}
+    assert {"bucket", "object", "translate", "issue", "admin"} <= families
+
+
+def test_burst_is_free_then_callers_queue(tmp_path):
+    limiter = _limiter(tmp_path)
+    assert limiter.acquire(["bucket", "list"]) == 0.0
+    assert limiter.acquire(["object", "list", "b"]) == 0.0
+    start = time.monotonic()
+    waited = limiter.acquire(["bucket", "info", "b"])
+    assert 0.05 < waited <= 0.1
+    assert time.monotonic() - start >= waited - 0.005
+    assert limiter.acquire(["hub", "list"]) == 0.0
+    assert limiter.stats()["waits"] == 1
+
+
+def test_bucket_refills_over_time(tmp_path):
+    limiter = _limiter(tmp_path, per_minute=1200, burst=1)
+    limiter.acquire(["bucket", "list"])
+    time.sleep(0.06)
+    assert limiter.acquire(["bucket", "list"]) == 0.0
+
+
+def test_corrupt_state_file_starts_over(tmp_path):
+    (tmp_path / "state.json").write_text('{"oss": [1.0,')
+    assert _limiter(tmp_path).acquire(["bucket", "list"]) == 0.0
+
+
+@pytest.mark.skipif(os.name != "posix", reason="buckets are shared across processes via flock")
+def test_processes_share_one_bucket(tmp_path):
+    state = str(tmp_path / "state.json")
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_drain, args=(state, 5)) for _ in range(2)]
+    start = time.monotonic()
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(10)
+    # 10 tokens at 20/s with a burst of 1: the last is due 0.45s in.
+    assert time.monotonic() - start >= 0.4
+    assert all(proc.exitcode == 0 for proc in procs)
+
+
+def test_runner_records_queueing_delay(fake_raps, tmp_path):
+    runner = RapsRunner(
+        timeout=10,
+        env=fake_raps("print('ok')\n"),
+        rate_limiter=_limiter(tmp_path, per_minute=300, burst=1),
+    )
+    assert runner.run("raps bucket list").queue_seconds == 0.0
+    result = runner.run("raps bucket list", sr_id="SR-970", slug="queued")
+    assert result.ok
+    assert result.queue_seconds > 0.1
+    assert "queued" in _captured_logs["SR-970"]
+    listed = runner.run("raps bucket list; raps object list b")
+    assert [step.queue_seconds > 0.1 for step in listed.steps] == [True, True]
+    assert listed.queue_seconds == pytest.approx(sum(s.queue_seconds for s in listed.steps))
+
+
+def test_format_stats():
+    assert format_stats({"waits": 4, "wait_seconds": 2.46}) == (
+        "raps rate limit: 4 commands queued (2.5s)"
+    )
@@ -0,0 +1,145 @@
+"""Unit tests for --raps-retry-budget transient-failure retries."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tests.helpers.json_report import _sum_retries
+from tests.helpers.retry import (
+    NETWORK,
+    RATE_LIMITED,
+    SERVER_ERROR,
+    TIMEOUT,
+    Retrier,
+    RetryPolicy,
+    classify_failure,
+    format_stats,
+)
+from tests.helpers.runner import RapsRunner, _captured_logs, clear_captured_logs
+
+# A stand-in raps that fails with the stderr in $FAIL_WITH until $FAIL_TIMES
+# calls have been made, counting calls in calls.log.
+FAKE_RAPS = """\
+import os, sys
+log = os.path.join(os.path.dirname(sys.argv[0]), "calls.log")
+with open(log, "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+with open(log) as f:
+    calls = len(f.readlines())
+if calls <= int(os.environ.get("FAIL_TIMES", "0")):
+    sys.stderr.write(os.environ["FAIL_WITH"] + "\\n")
+    sys.exit(5)
+print("ok")
+"""
+
+
+class _NoSleep(Retrier):
+    def __init__(self, **kwargs):
+        super().__init__(rng=random.Random(0), **kwargs)
+        self.slept: list[float] = []
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    clear_captured_logs()
+    yield
+    clear_captured_logs()
+
+
+def _runner(fake_raps, fail_times, fail_with, **kwargs):
+    env = fake_raps(FAKE_RAPS) | {"FAIL_TIMES": str(fail_times), "FAIL_WITH": fail_with}
+    return RapsRunner(timeout=10, env=env, retry=_NoSleep(**kwargs))
+
+
+def _calls(bin_dir):
+    return len((bin_dir / "calls.log").read_text().splitlines())
+
+
+@pytest.mark.parametrize("exit_code, stderr, timed_out, expected", [
+    (5, "Error: API error 429 Too Many Requests", False, RATE_LIMITED),
+    (5, "Error: rate limit exceeded, retry after 2s", False, RATE_LIMITED),
+    (5, "Error: 503 Service Unavailable", False, SERVER_ERROR),
+    (1, "error sending request: connection reset by peer", False, NETWORK),
+    (124, "TIMEOUT after 30s", True, TIMEOUT),
+    (5, "Error: 404 Not Found", False, None),
+    (2, "error: unexpected argument '--bogus'", False, None),
+    (127, "raps: command not found (429)", False, None),
+    (137, "Killed 500", False, None),
+    (0, "warning: 429 earlier", False, None),
+])
+def test_classify_failure(exit_code, stderr, timed_out, expected):
+    assert classify_failure(exit_code, stderr, timed_out) == expected
+
+
+def test_full_jitter_stays_under_exponential_cap():
+    policy = RetryPolicy(retries=5, base=1.0, cap=5.0)
+    rng = random.Random(1)
+    for attempt in range(5):
+        ceiling = min(5.0, 2 ** attempt)
+        assert all(0 <= policy.delay(attempt, rng) <= ceiling for _ in range(200))
+    assert policy.delay(0, rng, retry_after=3) >= 3
+    assert policy.delay(0, rng, retry_after=60) == 5.0
+
+
+def test_policy_limits_mutating_commands_and_budget():
+    retrier = _NoSleep(budget=2)
+    assert retrier.backoff(["bucket", "list"], SERVER_ERROR, 0) is not None
+    assert retrier.backoff(["bucket", "create", "b"], SERVER_ERROR, 0) is None
+    assert retrier.backoff(["bucket", "create", "b"], RATE_LIMITED, 0) is not None
+    assert retrier.backoff(["bucket", "list"], SERVER_ERROR, 0) is None
+    assert retrier.backoff(["config", "profile", "list"], SERVER_ERROR, 0) is None
+    assert retrier.backoff(["bucket", "list"], SERVER_ERROR, 2) is None
+    assert retrier.stats()["retries"] == 2
+    assert retrier.stats()["exhausted"] == 1
+    assert _NoSleep().backoff(["translate", "status", "dXJu"], SERVER_ERROR, 0) is not None
+
+
+def test_transient_failure_is_retried_and_recorded(fake_raps, tmp_path):
+    runner = _runner(fake_raps, 2, "Error: HTTP 429 Too Many Requests")
+    result = runner.run("raps bucket list", sr_id="SR-980", slug="retried")
+    assert result.ok
+    assert _calls(tmp_path) == 3
+    assert [a["reason"] for a in result.retries] == [RATE_LIMITED, RATE_LIMITED]
+    assert [a["exit_code"] for a in result.retries] == [5, 5]
+    assert result.backoff_seconds == round(sum(runner.retry.slept), 3)
+    assert "retry 2: rate-limited (exit 5" in _captured_logs["SR-980"]
+    summary = _sum_retries("SR-980")
+    assert summary["retries"] == 2
+    assert summary["retry_reasons"] == {RATE_LIMITED: 2}
+
+
+def test_permanent_failure_is_not_retried(fake_raps, tmp_path):
+    runner = _runner(fake_raps, 5, "Error: 403 Forbidden")
+    result = runner.run("raps bucket list")
+    assert result.exit_code == 5
+    assert result.retries == []
+    assert _calls(tmp_path) == 1
+
+
+def test_gives_up_after_policy_retries(fake_raps, tmp_path):
+    runner = _runner(fake_raps, 10, "Error: 502 Bad Gateway",
+                     policies={"bucket": RetryPolicy(retries=1, base=0.01)})
+    result = runner.run("raps bucket list")
+    assert result.exit_code == 5
+    assert len(result.retries) == 1
+    assert _calls(tmp_path) == 2
+
+
+def test_mutating_command_list_is_not_rerun(fake_raps):
+    runner = _runner(fake_raps, 10, "Error: 429 Too Many Requests")
+    result = runner.run("raps bucket create b && raps bucket list")
+    assert not result.ok
+    assert result.retries == []
+
+
+def test_format_stats():
+    assert format_stats({"retries": 3, "backoff_seconds": 4.25, "exhausted": 0}) == (
+        "raps retries: 3 (4.2s backoff)"
+    )
+    assert format_stats({"retries": 5, "backoff_seconds": 9.0, "exhausted": 2}).endswith(
+        ", budget exhausted for 2 failures"
+    )
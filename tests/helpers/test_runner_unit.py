@@ -1,15 +1,22 @@
-"""Unit tests for RapsRunner exit code tracking."""
+"""Unit tests for RapsRunner exit code tracking and execution."""
 from __future__ import annotations
 
+import os
+import shutil
+import time
 import warnings
 
+import pytest
+
 from tests.helpers.runner import (
+    RapsRunner,
     RunResult,
     _captured_codes,
     _store_log,
     clear_captured_logs,
+    parse_command_list,
 )
-from tests.helpers.json_report import _parse_worst_cli_exit
+from tests.helpers.json_report import _parse_worst_cli_exit, _sum_resources
 
 
 def _make_result(sr_id, exit_code, timed_out=False):
@@ -84,3 +91,138 @@ def test_no_warning_for_lifecycle_steps_only():
         _store_log("SR-994/step1", _make_result("SR-994/step1", 0))
         _store_log("SR-994/step2", _make_result("SR-994/step2", 3))
     assert not any("SR-994" in str(x.message) for x in w)
+
+
+def test_run_decodes_output_like_text_mode():
+    """run() captures in binary and decodes as text=True would (\\r\\n -> \\n)."""
+    result = RapsRunner(timeout=10).run("printf 'a\\r\\nb'")
+    assert result.ok
+    assert result.stdout == "a\nb"
+
+
+def test_run_timeout_reports_124():
+    result = RapsRunner(timeout=10).run("sleep 5", timeout=0.2)
+    assert result.timed_out
+    assert result.exit_code == 124
+    assert "TIMEOUT" in result.stderr
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups and rlimits are POSIX-only")
+def test_run_timeout_kills_grandchildren(tmp_path):
+    """A timeout under `bash -c` also kills the grandchild, not just bash."""
+    marker = tmp_path / "survived"
+    result = RapsRunner(timeout=10).run(f"(sleep 1; touch {marker}) | cat", timeout=0.2)
+    assert result.timed_out
+    time.sleep(1.5)
+    assert not marker.exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="needs wait4")
+def test_run_reports_peak_rss_and_cpu():
+    result = RapsRunner(timeout=10).run("python3 -c 'bytearray(50 * 1024 * 1024)'")
+    assert result.ok
+    assert result.max_rss_kb > 50 * 1024
+    assert result.cpu_seconds > 0
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="needs wait4")
+def test_resources_are_summed_per_sr_id():
+    runner = RapsRunner(timeout=10)
+    first = runner.run("printf abc", sr_id="SR-997/step1")
+    second = runner.run("printf 'x\n' >&2", sr_id="SR-997/step2")
+    totals = _sum_resources("SR-997")
+    assert (totals["stdout_bytes"], totals["stderr_bytes"]) == (3, 2)
+    assert totals["max_rss_kb"] == max(first.max_rss_kb, second.max_rss_kb)
+    assert totals["voluntary_ctx_switches"] == (
+        first.voluntary_ctx_switches + second.voluntary_ctx_switches
+    )
+
+
+@pytest.fixture(params=["prlimit", "shim"])
+def limit_wrapper(request, monkeypatch):
+    """Run the rlimit tests under prlimit (if installed) and the python -c shim."""
+    if request.param == "prlimit" and not shutil.which("prlimit"):
+        pytest.skip("prlimit not installed")
+    if request.param == "shim":
+        monkeypatch.setattr("tests.helpers.runner.shutil.which", lambda name: None)
+    return request.param
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups and rlimits are POSIX-only")
+def test_run_enforces_cpu_limit(limit_wrapper):
+    result = RapsRunner(timeout=10, cpu_limit=1).run("python3 -c 'while True: pass'")
+    assert not result.timed_out
+    assert result.exit_code != 0  # SIGXCPU, reported by bash as 128 + 24
+    assert result.cpu_seconds > 0.9
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups and rlimits are POSIX-only")
+def test_run_enforces_memory_limit(limit_wrapper):
+    runner = RapsRunner(timeout=10, memory_limit_mb=200)
+    assert runner.run("python3 -c 'bytearray(10 * 1024 * 1024)'").ok
+    result = runner.run("python3 -c 'bytearray(400 * 1024 * 1024)'")
+    assert result.exit_code != 0
+    assert "MemoryError" in result.stderr
+    missing = runner.run("raps-missing-binary version")
+    assert missing.exit_code == 127
+
+
+# ---------------------------------------------------------------------------
+# Shell-free command lists
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("command, expected", [
+    ("raps a; raps b", [("", ["raps", "a"], False), (";", ["raps", "b"], False)]),
+    ("raps a 2>&1&&raps 'b c'", [("", ["raps", "a"], True), ("&&", ["raps", "b c"], False)]),
+    ("raps a;", [("", ["raps", "a"], False)]),
+])
+def test_parse_command_list_simple_lists(command, expected):
+    steps = parse_command_list(command)
+    assert [(s.operator, s.argv, s.merge_stderr) for s in steps] == expected
+
+
+@pytest.mark.parametrize("command", [
+    'echo "exit" | raps shell',     # pipe
+    "raps a || raps b",             # ||
+    "raps a > out.txt",             # other redirection
+    "raps a & raps b",              # background job
+    "raps hub list $HUB",           # expansion
+    "raps a 'x;y'",                 # operator inside quotes
+    "ls; raps a",                   # non-raps step
+    "raps a &&",                    # dangling &&
+])
+def test_parse_command_list_falls_back_for_real_shell(command):
+    assert parse_command_list(command) is None
+
+
+@pytest.fixture
+def fake_raps_runner(fake_raps):
+    env = fake_raps("""
+        import sys
+        args = " ".join(sys.argv[1:])
+        print(f"out:{args}", flush=True)
+        print(f"err:{args}", file=sys.stderr)
+        sys.exit(3 if sys.argv[1:2] == ["fail"] else 0)
+    """)
+    return RapsRunner(timeout=10, env=env)
+
+
+def test_command_list_records_each_step(fake_raps_runner):
+    result = fake_raps_runner.run("raps fail; raps two 2>&1", sr_id="SR-990")
+    assert result.exit_code == 0
+    assert [(s.command, s.exit_code) for s in result.steps] == [
+        ("raps fail", 3),
+        ("raps two 2>&1", 0),
+    ]
+    assert result.stdout == "out:fail\nout:two\nerr:two\n"
+    assert result.stderr == "err:fail\n"
+
+
+def test_command_list_and_skips_after_failure(fake_raps_runner):
+    result = fake_raps_runner.run("raps fail && raps skipped; raps last")
+    assert [s.command for s in result.steps] == ["raps fail", "raps last"]
+    assert result.exit_code == 0
+
+    result = fake_raps_runner.run("raps ok && raps fail && raps skipped")
+    assert [s.command for s in result.steps] == ["raps ok", "raps fail"]
+    assert result.exit_code == 3
@@ -0,0 +1,132 @@
+"""Unit tests for the persistent raps worker and its spawn fallback."""
+from __future__ import annotations
+
+import warnings
+
+import pytest
+
+from tests.helpers.runner import RapsRunner
+from tests.helpers.worker import proves_success, worker_eligible
+
+# A stand-in raps: plain commands (JSON with --output json), plus a
+# `shell` REPL that prompts on stdout and reports unknown commands on
+# stderr.
+FAKE_RAPS = """\
+import json
+import sys
+
+def run(argv):
+    if argv == ["--version"]:
+        print("raps 9.9.9")
+        return 0
+    if "fail" in argv:
+        print("boom", file=sys.stderr)
+        return 3
+    if "missing" in argv:
+        print("Error: profile not found")
+        return 4
+    if "denied" in argv:
+        print(json.dumps({"error": "permission denied"}))
+        return 5
+    if "warn" in argv:
+        print("warning: profile is stale", file=sys.stderr)
+    if "--output" in argv:
+        print(json.dumps({"argv": argv[:argv.index("--output")]}))
+    else:
+        print("out:" + " ".join(argv))
+    return 0
+
+if sys.argv[1:] != ["shell"]:
+    sys.exit(run(sys.argv[1:]))
+print("RAPS shell")
+while True:
+    sys.stdout.write("raps> ")
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line or line.strip() == "exit":
+        break
+    argv = line.split()
+    if argv and argv[0].startswith("__"):
+        print(f"unknown command: {argv[0]}", file=sys.stderr)
+    elif argv and {broken}:
+        print("raps 0.0.0-shell")
+    elif argv:
+        run(argv)
+    sys.stdout.flush()
+    sys.stderr.flush()
+"""
+
+
+def _worker_runner(fake_raps, *, broken=False):
+    env = fake_raps(FAKE_RAPS.replace("{broken}", str(broken)))
+    return RapsRunner(timeout=10, env=env, worker=True)
+
+
+@pytest.fixture
+def worker_runner(fake_raps):
+    runner = _worker_runner(fake_raps)
+    yield runner
+    runner.close()
+
+
+def test_local_json_commands_are_served_by_worker(worker_runner):
+    first = worker_runner.run("raps config profile current --output json")
+    second = worker_runner.run("raps template list --output json")
+    assert first.worker and second.worker
+    assert first.stdout == '{"argv": ["config", "profile", "current"]}\n'
+    assert second.stdout == '{"argv": ["template", "list"]}\n'
+    assert first.ok
+    assert worker_runner._worker.requests == 3  # handshake --version + 2
+
+
+@pytest.mark.parametrize("args, exit_code", [
+    ("config get fail", 3),             # failure on stderr
+    ("config get missing", 4),          # failure reported only on stdout
+    ("config get denied", 5),           # JSON error object
+    ("config profile list warn", 0),    # warning on stderr
+])
+def test_unproven_worker_responses_are_respawned(worker_runner, args, exit_code):
+    result = worker_runner.run(f"raps {args} --output json")
+    assert not result.worker
+    assert result.exit_code == exit_code
+
+
+def test_only_json_output_is_worker_eligible():
+    assert worker_eligible(["config", "profile", "current", "--output", "json"])
+    assert worker_eligible(["logs", "list", "--output=json"])
+    assert not worker_eligible(["config", "profile", "current"])
+    assert not worker_eligible(["config", "profile", "use", "staging", "--output", "json"])
+    assert not worker_eligible(["bucket", "list", "--output", "json"])
+
+
+def test_proves_success():
+    assert proves_success('{"items": []}\n', "")
+    assert proves_success("[]", "")
+    assert not proves_success('{"items": []}', "warning: stale\n")
+    assert not proves_success('{"error": "not found"}', "")
+    assert not proves_success("Error: not found\n", "")
+    assert not proves_success('{"items": [', "")
+    assert not proves_success("", "")
+
+
+def test_mutating_local_commands_still_spawn(worker_runner):
+    result = worker_runner.run("raps config profile use staging --output json")
+    assert not result.worker
+    assert result.ok
+
+
+def test_network_commands_still_spawn(worker_runner):
+    result = worker_runner.run("raps bucket list --output json")
+    assert not result.worker
+    assert result.stdout == '{"argv": ["bucket", "list"]}\n'
+
+
+def test_worker_falls_back_when_handshake_disagrees(fake_raps):
+    runner = _worker_runner(fake_raps, broken=True)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        result = runner.run("raps config profile current --output json")
+    assert not result.worker
+    assert result.stdout == '{"argv": ["config", "profile", "current"]}\n'
+    assert any("spawning a process per command" in str(x.message) for x in w)
+    runner.close()
@@ -0,0 +1,216 @@
+"""RapsWorker — a long-lived ``raps shell`` that runs commands without a spawn each.
+
+The shell is driven over stdin/stdout. After each command the worker
+writes a sentinel line, an unknown command carrying a unique token; the
+shell's complaint about it marks where the command's output ends, on
+whichever stream it arrives. The shell flushes a command's output before
+it reads the next line, so once the complaint is in, the rest of the
+response is already in the pipes and is drained without waiting. Text
+the shell prints on its own (prompts, learned during the handshake) is
+stripped from every response; a prompt printed after the sentinel may
+land in the next response, where it is stripped the same way.
+
+The interactive shell reports no exit codes, so a response is only
+trusted when it proves success: only read-only ``--output json``
+commands are sent to it, and RapsRunner uses a response only when
+stderr is empty and stdout is exactly one JSON document that is not an
+error object. Anything else — warnings, raps' codes 2-6, a failure
+reported on stdout — is spawned again for its real exit code. The
+handshake checks that ``--version`` through the shell matches a spawned
+``raps --version``; RapsRunner falls back to spawn-per-command if it
+doesn't, or if the worker ever stops responding.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import select
+import shlex
+import subprocess
+import threading
+import time
+import uuid
+
+from .cache import PURE, classify
+from .profiler import phase
+
+# Command families that are local (no network) and cheap enough that
+# process startup dominates their run time.
+WORKER_FAMILIES = frozenset({"config", "logs", "template", "plugin"})
+# While learning the prompt, the handshake waits for the shell to go this
+# long without output, so the prompt it prints after the sentinel is caught.
+_HANDSHAKE_QUIET_SECONDS = 0.05
+
+
+class WorkerError(RuntimeError):
+    """The worker could not start, or stopped answering."""
+
+
+class RapsWorker:
+    """One ``raps shell`` process serving requests one at a time."""
+
+    def __init__(
+        self,
+        raps: str,
+        *,
+        env: dict[str, str] | None = None,
+        cwd: str | None = None,
+        argv: tuple[str, ...] = ("shell",),
+    ) -> None:
+        self.argv = [raps, *argv]
+        self.env = env
+        self.cwd = cwd
+        self.prompt = ""
+        self.requests = 0
+        self._proc: subprocess.Popen | None = None
+        self._buffers = {"stdout": bytearray(), "stderr": bytearray()}
+        self._open: dict[int, str] = {}     # fd -> stream name, until EOF
+        self._lock = threading.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self, *, expected_version: str, timeout: float = 10.0) -> None:
+        """Spawn the shell, learn its prompt and verify it runs commands correctly."""
+        if os.name != "posix":
+            raise WorkerError("the worker reads its pipes with select(), which needs POSIX")
+        self._proc = subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.cwd,
+            env=self.env,
+        )
+        self._open = {getattr(self._proc, name).fileno(): name for name in ("stdout", "stderr")}
+        try:
+            self._exchange("", timeout, _HANDSHAKE_QUIET_SECONDS)   # banner and prompt
+            self.prompt, _ = self._exchange("", timeout, _HANDSHAKE_QUIET_SECONDS)
+            out, err = self.request(["--version"], timeout)
+        except WorkerError:
+            self.close()
+            raise
+        if err.strip() or out.strip() != expected_version.strip():
+            self.close()
+            raise WorkerError(f"unexpected --version output from worker: {out.strip()!r}")
+
+    def request(self, args: list[str], timeout: float) -> tuple[str, str]:
+        """Run one raps command (without the leading ``raps``): (stdout, stderr)."""
+        with self._lock:
+            out, err = self._exchange(shlex.join(args) + "\n", timeout)
+            self.requests += 1
+        if self.prompt:
+            out = out.replace(self.prompt, "")
+        return out, err
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.write(b"exit\n")
+            self._proc.stdin.close()
+            self._proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+    # --- internals ---
+
+    def _read_ready(self, timeout: float) -> bool:
+        """Append whatever the shell has written within ``timeout``; False if nothing."""
+        if not self._open:
+            raise WorkerError("worker exited")
+        ready, _, _ = select.select(list(self._open), [], [], timeout)
+        for fd in ready:
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError:
+                chunk = b""
+            if chunk:
+                self._buffers[self._open[fd]] += chunk
+            else:
+                del self._open[fd]
+        return bool(ready)
+
+    def _exchange(
+        self, payload: str, timeout: float, quiet: float | None = None,
+    ) -> tuple[str, str]:
+        """Send payload plus a sentinel; return everything printed before the sentinel.
+
+        With ``quiet``, keep reading after the sentinel until the shell has
+        been silent that long (the handshake, which must see the prompt).
+        """
+        if not self.alive:
+            raise WorkerError("worker is not running")
+        token = f"__raps_worker_{uuid.uuid4().hex}__"
+        with phase("worker_request"):
+            try:
+                self._proc.stdin.write((payload + token + "\n").encode())
+                self._proc.stdin.flush()
+            except OSError as e:
+                raise WorkerError(f"worker stdin closed: {e}") from e
+
+            marker = token.encode()
+            deadline = time.monotonic() + timeout
+            while not any(marker in buf for buf in self._buffers.values()):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise WorkerError(f"no response within {timeout}s")
+                self._read_ready(remaining)
+            # The command's output on the other stream was flushed before the
+            # shell read the sentinel, so it is already in the pipe: drain it.
+            while self._open and self._read_ready(quiet or 0):
+                pass
+            out = bytes(self._buffers["stdout"])
+            err = bytes(self._buffers["stderr"])
+            self._buffers["stdout"].clear()
+            self._buffers["stderr"].clear()
+        return _strip_sentinel(out, marker), _strip_sentinel(err, marker)
+
+
+def _strip_sentinel(data: bytes, marker: bytes) -> str:
+    """Decode output, dropping the line(s) that report the sentinel command."""
+    text = data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+    return "".join(
+        line for line in text.splitlines(keepends=True) if marker.decode() not in line
+    )
+
+
+def requests_json(args: list[str]) -> bool:
+    """Whether a raps command (argv without ``raps``) asks for ``--output json``."""
+    return "--output=json" in args or any(
+        a == "--output" and b == "json" for a, b in zip(args, args[1:])
+    )
+
+
+def proves_success(stdout: str, stderr: str) -> bool:
+    """Whether a worker response shows the command succeeded.
+
+    Nothing on stderr, and stdout exactly one JSON document that is not
+    an error object; a truncated or failed response never parses as one.
+    """
+    if stderr.strip():
+        return False
+    try:
+        data = json.loads(stdout)
+    except ValueError:
+        return False
+    return not (isinstance(data, dict) and "error" in data)
+
+
+def worker_eligible(args: list[str]) -> bool:
+    """Whether a raps command (argv without ``raps``) may run in the worker.
+
+    Read-only commands only, so they are safe to spawn again when the
+    response doesn't prove success, and only with ``--output json``,
+    whose output can prove it (see proves_success).
+    """
+    return (
+        bool(args)
+        and args[0] in WORKER_FAMILIES
+        and classify(args)[0] == PURE
+        and requests_json(args)
+    )
@@ -40,15 +40,7 @@ def test_sr013_auth_login_token_direct(raps):
         sr_id="SR-013",
         slug="auth-login-token-direct-inspect",
     )
-    token = EXTERNAL_TOKEN
-    if result.ok and result.stdout.strip():
-        try:
-            import json
-
-            data = json.loads(result.stdout)
-            token = data.get("access_token", EXTERNAL_TOKEN) or EXTERNAL_TOKEN
-        except (json.JSONDecodeError, KeyError):
-            pass
+    token = (result.ok and result.extract_first("$.access_token")) or EXTERNAL_TOKEN
     raps.run(
         f'raps auth login --token "{token}"',
         sr_id="SR-013",
@@ -64,15 +56,7 @@ def test_sr014_auth_login_refresh_token(raps):
         sr_id="SR-014",
         slug="auth-login-refresh-token-inspect",
     )
-    refresh = "dummy-refresh"
-    if result.ok and result.stdout.strip():
-        try:
-            import json
-
-            data = json.loads(result.stdout)
-            refresh = data.get("refresh_token", "dummy-refresh") or "dummy-refresh"
-        except (json.JSONDecodeError, KeyError):
-            pass
+    refresh = (result.ok and result.extract_first("$.refresh_token")) or "dummy-refresh"
     raps.run(
         f'raps auth login --refresh-token "{refresh}" --expires-in 3600',
         sr_id="SR-014",
@@ -167,15 +151,7 @@ def test_sr024_auth_lifecycle_token_injection(raps, auth_manager):
         sr_id="SR-024",
         slug="auth-lifecycle-token-injection-inspect",
     )
-    token = ""
-    if inspect_result.ok and inspect_result.stdout.strip():
-        try:
-            import json
-
-            data = json.loads(inspect_result.stdout)
-            token = data.get("access_token", "") or ""
-        except (json.JSONDecodeError, KeyError):
-            pass
+    token = (inspect_result.ok and inspect_result.extract_first("$.access_token")) or ""
 
     if not token:
         pytest.skip("No valid token available for injection test (requires 3-leg auth)")
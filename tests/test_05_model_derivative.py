@@ -1,7 +1,6 @@
 """Model Derivative / Translation"""
 
 import base64
-import json
 import time
 from pathlib import Path
 
@@ -83,17 +82,7 @@ def test_sr550_translate_metadata_lifecycle(raps):
         lc.step(f"raps translate manifest {meta_urn}")
     # T020: Get metadata (JSON output to extract GUID)
     meta_result = lc.step(f"raps translate metadata {meta_urn} --output json")
-    guid = ""
-    if meta_result.ok:
-        json_start = meta_result.stdout.find("{")
-        if json_start >= 0:
-            try:
-                meta = json.loads(meta_result.stdout[json_start:])
-                views = meta.get("data", {}).get("metadata", [])
-                if views:
-                    guid = views[0].get("guid", "")
-            except (json.JSONDecodeError, KeyError, IndexError):
-                pass
+    guid = meta_result.extract_first("$.data.metadata[0].guid", "") if meta_result.ok else ""
     if not guid:
         pytest.skip("Could not extract GUID from metadata response")
     # T021: Get object tree
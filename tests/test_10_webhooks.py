@@ -1,6 +1,5 @@
 """Webhooks"""
 
-import json
 import time
 
 import pytest
@@ -21,14 +20,7 @@ def _get_first_hook_id(raps) -> str:
         sr_id="",
         slug="webhook-list-json-helper",
     )
-    if result.ok and result.stdout.strip():
-        try:
-            hooks = json.loads(result.stdout)
-            if hooks and isinstance(hooks, list):
-                return hooks[0].get("hookId", "")
-        except (json.JSONDecodeError, KeyError, IndexError):
-            pass
-    return ""
+    return result.extract_first("$[0].hookId", "") if result.ok else ""
 
 
 # ── Webhook atomics ──────────────────────────────────────────────
@@ -111,13 +103,7 @@ def test_sr188_webhook_subscription_lifecycle(raps):
     lc.step("raps webhook list")
 
     # Extract hookId from create output or list
-    hook_id = ""
-    if create_result.stdout.strip():
-        try:
-            data = json.loads(create_result.stdout)
-            hook_id = data.get("hookId", "")
-        except (json.JSONDecodeError, KeyError):
-            pass
+    hook_id = create_result.extract_first("$.hookId", "")
     if not hook_id:
         hook_id = _get_first_hook_id(raps)
 
@@ -53,7 +53,6 @@ def test_sr214_admin_project_archive(raps, ids):
 @pytest.mark.lifecycle
 @pytest.mark.require_acc
 def test_sr215_project_lifecycle_admin(raps, ids, users):
-    import json
     import time
 
     account_id = ids.account_id or "demo-account-001"
@@ -64,10 +63,7 @@ def test_sr215_project_lifecycle_admin(raps, ids, users):
     )
     pid = ids.project_id or "demo-project-001"
     if result.ok:
-        try:
-            pid = json.loads(result.stdout).get("id", pid)
-        except (json.JSONDecodeError, KeyError):
-            pass
+        pid = result.extract_first("$.id", pid)
     lc.step(f'raps admin project list -a {account_id} -f "name:*Bridge*"')
     lc.step(
         f'raps admin user add {users.user_pm} -a {account_id}'
@@ -74,8 +74,6 @@ def test_sr237_reality_delete(raps):
 @pytest.mark.sr("SR-238")
 @pytest.mark.lifecycle
 def test_sr238_reality_capture_lifecycle(raps):
-    import json
-
     lc = raps.lifecycle(
         "SR-238", "reality-capture-lifecycle", "Capture and process construction site"
     )
@@ -85,10 +83,7 @@ def test_sr238_reality_capture_lifecycle(raps):
     )
     jid = JID
     if result.ok:
-        try:
-            jid = json.loads(result.stdout).get("photoscene_id", jid)
-        except (json.JSONDecodeError, KeyError):
-            pass
+        jid = result.extract_first("$.photoscene_id", jid)
     lc.step(f"raps reality upload {jid} ./test-data/sample.rvt")
     lc.step(f"raps reality process {jid}")
     lc.step(f"raps reality status {jid}")
@@ -61,7 +61,6 @@ def test_sr254_template_archive(raps, ids):
 @pytest.mark.lifecycle
 @pytest.mark.require_acc
 def test_sr255_template_management_lifecycle(raps, ids):
-    import json
     import time
 
     account_id = ids.account_id or "demo-account-001"
@@ -72,10 +71,7 @@ def test_sr255_template_management_lifecycle(raps, ids):
     )
     tpl_id = "tpl-demo-001"
     if result.ok:
-        try:
-            tpl_id = json.loads(result.stdout).get("id", tpl_id)
-        except (json.JSONDecodeError, KeyError):
-            pass
+        tpl_id = result.extract_first("$.id", tpl_id)
     lc.step(f"raps template list -a {account_id}")
     lc.step(f"raps template info {tpl_id} -a {account_id}")
     lc.step(f'raps template update {tpl_id} -a {account_id} --name "Healthcare Template 2026"')
@@ -37,31 +37,28 @@ CLIENT_B_SECRET = "demo-client-b-secret"
 @pytest.mark.require_3leg
 @pytest.mark.require_acc
 def test_sr400_workflow_model_review_cycle(raps, ids):
-    import json as _json
     pid = ids.project_id or "b.demo-project-001"
     lc = raps.lifecycle("SR-400", "workflow-model-review-cycle",
                         "Architect uploads, translates, creates issues")
     bkt = f"review-cycle-{_TS}"
-    lc.step(f"raps bucket create -k {bkt} -p transient -r US")
-    lc.step(f"raps object upload {bkt} ./test-data/sample.rvt")
     rvt_urn = base64.urlsafe_b64encode(
         f"urn:adsk.objects:os.object:{bkt}/sample.rvt".encode()
     ).decode().rstrip("=")
-    tr = lc.step(f"raps translate start {rvt_urn} -f svf2")
-    if tr.ok:
-        lc.step(f"raps translate status {rvt_urn}")
-        lc.step(f"raps translate manifest {rvt_urn}")
-    result = lc.step(f'raps issue create {pid} -t "Clash at grid A-3" --output json')
-    i1 = I1
-    if result.ok:
-        try:
-            i1 = _json.loads(result.stdout).get("id", i1)
-        except (_json.JSONDecodeError, KeyError):
-            pass
-    lc.step(f'raps issue create {pid} -t "Missing fire rating on wall W-12"')
-    lc.step(f'raps issue comment add {pid} {i1} -b "See model view at Level 2"')
-    lc.step(f'raps rfi create {pid} --title "Confirm structural capacity at A-3"')
-    lc.step(f"raps bucket delete {bkt} --yes")
+    lc.values["i1"] = I1
+    bucket = lc.add(f"raps bucket create -k {bkt} -p transient -r US")
+    upload = lc.add(f"raps object upload {bkt} ./test-data/sample.rvt", after=[bucket])
+    tr = lc.add(f"raps translate start {rvt_urn} -f svf2", after=[upload])
+    status = lc.add(f"raps translate status {rvt_urn}", requires=[tr])
+    manifest = lc.add(f"raps translate manifest {rvt_urn}", requires=[tr])
+    # Issues and the RFI don't depend on the model upload
+    issue = lc.add(f'raps issue create {pid} -t "Clash at grid A-3" --output json',
+                   outputs={"i1": "$.id"})
+    lc.add(f'raps issue create {pid} -t "Missing fire rating on wall W-12"')
+    lc.add(lambda v: f'raps issue comment add {pid} {v["i1"]} -b "See model view at Level 2"',
+           after=[issue])
+    lc.add(f'raps rfi create {pid} --title "Confirm structural capacity at A-3"')
+    lc.add(f"raps bucket delete {bkt} --yes", after=[upload, tr, status, manifest])
+    lc.run()
     lc.assert_all_passed_or_skip(skip_on=(3, 4, 5, 6))
 
 
@@ -70,25 +67,21 @@ def test_sr400_workflow_model_review_cycle(raps, ids):
 @pytest.mark.require_3leg
 @pytest.mark.require_acc
 def test_sr401_workflow_project_setup(raps, ids, users):
-    import json as _json
     acct = ids.account_id or "demo-account-001"
     lc = raps.lifecycle("SR-401", "workflow-project-setup",
                         "Admin creates project and staffs it")
-    lc.step(f"raps template list -a {acct}")
-    result = lc.step(f'raps admin project create -a {acct} -n "Hospital Wing B" -t "Healthcare" --output json')
-    new_pid = ids.project_full_id or "b.demo-project-001"
-    if result.ok:
-        try:
-            new_pid = _json.loads(result.stdout).get("id", new_pid)
-        except (_json.JSONDecodeError, KeyError):
-            pass
-    lc.step(f'raps admin user add {users.user_pm} -a {acct} -r "Project Admin" -f "name:*Hospital Wing B*" -y')
-    lc.step(f'raps admin user add {users.user_struct} -a {acct} -r "Project Viewer" -f "name:*Hospital Wing B*" -y')
-    lc.step(f'raps admin user add {users.user_mep} -a {acct} -r "Project Viewer" -f "name:*Hospital Wing B*" -y')
-    lc.step(f'raps admin folder set-permissions {users.user_struct} -a {acct} -l view-download-upload --folder "Structural" -f "name:*Hospital Wing B*" -y')
-    lc.step(f'raps admin folder set-permissions {users.user_mep} -a {acct} -l view-download-upload --folder "MEP" -f "name:*Hospital Wing B*" -y')
-    lc.step(f"raps admin user list -a {acct} -p {new_pid}")
-    lc.step(f'raps webhook create -e "dm.version.added" -u "https://hooks.co.com/hospital"')
+    lc.values["new_pid"] = ids.project_full_id or "b.demo-project-001"
+    lc.add(f"raps template list -a {acct}")
+    project = lc.add(f'raps admin project create -a {acct} -n "Hospital Wing B" -t "Healthcare" --output json',
+                     outputs={"new_pid": "$.id"})
+    pm = lc.add(f'raps admin user add {users.user_pm} -a {acct} -r "Project Admin" -f "name:*Hospital Wing B*" -y', after=[project])
+    struct = lc.add(f'raps admin user add {users.user_struct} -a {acct} -r "Project Viewer" -f "name:*Hospital Wing B*" -y', after=[project])
+    mep = lc.add(f'raps admin user add {users.user_mep} -a {acct} -r "Project Viewer" -f "name:*Hospital Wing B*" -y', after=[project])
+    lc.add(f'raps admin folder set-permissions {users.user_struct} -a {acct} -l view-download-upload --folder "Structural" -f "name:*Hospital Wing B*" -y', after=[struct])
+    lc.add(f'raps admin folder set-permissions {users.user_mep} -a {acct} -l view-download-upload --folder "MEP" -f "name:*Hospital Wing B*" -y', after=[mep])
+    lc.add(lambda v: f"raps admin user list -a {acct} -p {v['new_pid']}", after=[project, pm, struct, mep])
+    lc.add(f'raps webhook create -e "dm.version.added" -u "https://hooks.co.com/hospital"')
+    lc.run()
     lc.assert_all_passed_or_skip(skip_on=(2, 3, 4, 5, 6))
 
 
@@ -128,17 +121,18 @@ def test_sr403_workflow_design_automation_job(raps):
     bkt = f"da-job-{_TS}"
     bundle_id = f"Extract{_TS}"
     activity_id = f"ExtractAct{_TS}"
-    lc.step(f"raps bucket create -k {bkt} -p transient -r US")
-    lc.step(f"raps object upload {bkt} ./test-data/sample.rvt")
-    lc.step(f"raps object signed-url {bkt} sample.rvt")
-    lc.step("raps da engines")
-    lc.step(f'raps da appbundle-create -i {bundle_id} -e "Autodesk.Revit+2025"')
-    lc.step(f'raps da activity-create --id {activity_id} --engine "Autodesk.Revit+2025" --appbundle "{bundle_id}" --command "..."')
+    bucket = lc.add(f"raps bucket create -k {bkt} -p transient -r US")
+    upload = lc.add(f"raps object upload {bkt} ./test-data/sample.rvt", after=[bucket])
+    signed = lc.add(f"raps object signed-url {bkt} sample.rvt", after=[upload])
+    lc.add("raps da engines")
+    bundle = lc.add(f'raps da appbundle-create -i {bundle_id} -e "Autodesk.Revit+2025"')
+    activity = lc.add(f'raps da activity-create --id {activity_id} --engine "Autodesk.Revit+2025" --appbundle "{bundle_id}" --command "..."', after=[bundle])
     # Note: da run requires a real uploaded plugin binary — skip in test env
     # Note: da status requires a real workitem ID from a previous run
-    lc.step(f"raps da activity-delete {activity_id}")
-    lc.step(f"raps da appbundle-delete {bundle_id}")
-    lc.step(f"raps bucket delete {bkt} --yes")
+    activity_delete = lc.add(f"raps da activity-delete {activity_id}", after=[activity])
+    lc.add(f"raps da appbundle-delete {bundle_id}", after=[activity_delete])
+    lc.add(f"raps bucket delete {bkt} --yes", after=[signed])
+    lc.run()
     lc.assert_all_passed_or_skip()
 
 
@@ -150,12 +144,14 @@ def test_sr404_workflow_portfolio_health_check(raps, ids):
     acct = ids.account_id or "demo-account-001"
     lc = raps.lifecycle("SR-404", "workflow-portfolio-health-check",
                         "Executive reviews portfolio health")
-    lc.step(f"raps admin project list -a {acct} --status active")
-    lc.step(f"raps report issues-summary -a {acct} --status open --output json")
-    lc.step(f'raps report rfi-summary -a {acct} --status open --since "2026-01-01" --output json')
-    lc.step(f"raps report submittals-summary -a {acct} --output json")
-    lc.step(f'raps report checklists-summary -a {acct} --status "in_progress" --output json')
-    lc.step(f"raps report assets-summary -a {acct} --output json")
+    # Independent read-only reports
+    lc.add(f"raps admin project list -a {acct} --status active")
+    lc.add(f"raps report issues-summary -a {acct} --status open --output json")
+    lc.add(f'raps report rfi-summary -a {acct} --status open --since "2026-01-01" --output json')
+    lc.add(f"raps report submittals-summary -a {acct} --output json")
+    lc.add(f'raps report checklists-summary -a {acct} --status "in_progress" --output json')
+    lc.add(f"raps report assets-summary -a {acct} --output json")
+    lc.run()
     lc.assert_all_passed_or_skip(skip_on=(3, 4, 5, 6))
 
 
@@ -163,31 +159,28 @@ def test_sr404_workflow_portfolio_health_check(raps, ids):
 @pytest.mark.lifecycle
 @pytest.mark.require_3leg
 def test_sr405_workflow_site_survey_to_model(raps, ids):
-    import json as _json
     pid = ids.project_full_id or "b.demo-project-001"
     folder_id = ids.root_folder_id or FOLDER_ID
     lc = raps.lifecycle("SR-405", "workflow-site-survey-to-model",
                         "Survey captures, processes, uploads to BIM 360")
-    result = lc.step('raps reality create -n "Foundation Survey" -f obj --output json')
-    jid = JID
-    if result.ok:
-        try:
-            jid = _json.loads(result.stdout).get("photoscene_id", jid)
-        except (_json.JSONDecodeError, KeyError):
-            pass
-    lc.step(f"raps reality upload {jid} ./test-data/sample.rvt")
-    lc.step(f"raps reality process {jid}")
-    lc.step(f"raps reality status {jid}")
-    lc.step(f"raps reality result {jid}")
+    # The reality job and the OSS upload are independent chains
+    lc.values["jid"] = JID
+    job = lc.add('raps reality create -n "Foundation Survey" -f obj --output json',
+                 outputs={"jid": "$.photoscene_id"})
+    upload = lc.add(lambda v: f"raps reality upload {v['jid']} ./test-data/sample.rvt", after=[job])
+    process = lc.add(lambda v: f"raps reality process {v['jid']}", after=[upload])
+    status = lc.add(lambda v: f"raps reality status {v['jid']}", after=[process])
+    result = lc.add(lambda v: f"raps reality result {v['jid']}", after=[status])
     bkt = f"survey-upload-{_TS}"
-    lc.step(f"raps bucket create -k {bkt} -p transient -r US")
-    lc.step(f"raps object upload {bkt} ./test-data/sample.rvt")
     obj_urn = base64.urlsafe_b64encode(
         f"urn:adsk.objects:os.object:{bkt}/sample.rvt".encode()
     ).decode().rstrip("=")
-    lc.step(f'raps item create-from-oss {pid} {folder_id} --name "Foundation Survey 2026-02" --object-id {obj_urn}')
-    lc.step(f"raps reality delete {jid} --yes")
-    lc.step(f"raps bucket delete {bkt} --yes")
+    bucket = lc.add(f"raps bucket create -k {bkt} -p transient -r US")
+    obj = lc.add(f"raps object upload {bkt} ./test-data/sample.rvt", after=[bucket])
+    item = lc.add(f'raps item create-from-oss {pid} {folder_id} --name "Foundation Survey 2026-02" --object-id {obj_urn}', after=[obj])
+    lc.add(lambda v: f"raps reality delete {v['jid']} --yes", after=[result])
+    lc.add(f"raps bucket delete {bkt} --yes", after=[item])
+    lc.run()
     lc.assert_all_passed_or_skip(skip_on=(3, 4, 5, 6))
 
 
@@ -199,14 +192,16 @@ def test_sr406_workflow_weekly_admin_operations(raps, ids, users):
     acct = ids.account_id or "demo-account-001"
     lc = raps.lifecycle("SR-406", "workflow-weekly-admin-operations",
                         "Admin weekly maintenance")
-    lc.step(f'raps admin user list -a {acct} --status "active" --output json')
-    lc.step(f'raps admin user list -a {acct} --role "Project Admin"')
-    lc.step(f'raps admin project list -a {acct} -f "name:*2024*" --status active')
-    lc.step(f'raps admin user update {users.user_old_admin} -a {acct} -r "Project Viewer" --from-role "Project Admin" -f "name:*2024*" --dry-run')
-    lc.step(f'raps admin user update {users.user_old_admin} -a {acct} -r "Project Viewer" --from-role "Project Admin" -f "name:*2024*" -y')
-    lc.step("raps admin operation list --limit 1")
-    lc.step(f"raps admin company-list -a {acct}")
-    lc.step(f"raps report issues-summary -a {acct} --status open")
+    active = lc.add(f'raps admin user list -a {acct} --status "active" --output json')
+    admins = lc.add(f'raps admin user list -a {acct} --role "Project Admin"')
+    projects = lc.add(f'raps admin project list -a {acct} -f "name:*2024*" --status active')
+    # The role change runs only after the listings it would otherwise alter
+    dry_run = lc.add(f'raps admin user update {users.user_old_admin} -a {acct} -r "Project Viewer" --from-role "Project Admin" -f "name:*2024*" --dry-run', after=[active, admins, projects])
+    update = lc.add(f'raps admin user update {users.user_old_admin} -a {acct} -r "Project Viewer" --from-role "Project Admin" -f "name:*2024*" -y', after=[dry_run])
+    lc.add("raps admin operation list --limit 1", after=[update])
+    lc.add(f"raps admin company-list -a {acct}")
+    lc.add(f"raps report issues-summary -a {acct} --status open")
+    lc.run()
     lc.assert_all_passed_or_skip(skip_on=(3, 4, 5, 6))
 
 
@@ -215,8 +210,9 @@ def test_sr406_workflow_weekly_admin_operations(raps, ids, users):
 def test_sr407_workflow_webhook_driven_automation(raps):
     lc = raps.lifecycle("SR-407", "workflow-webhook-driven-automation",
                         "DevOps lists webhook events and existing hooks")
-    lc.step("raps webhook events")
-    lc.step("raps webhook list")
+    lc.add("raps webhook events")
+    lc.add("raps webhook list")
+    lc.run()
     lc.assert_all_passed_or_skip()
 
 